@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Collection, Coroutine
+from collections.abc import Awaitable, Callable, Collection, Coroutine, Hashable
 from concurrent.futures import ThreadPoolExecutor
 from concurrent.futures._base import CancelledError
 from functools import wraps
@@ -115,6 +115,69 @@ class Looper:
         return task
 
 
+class SingleFlight:
+    """
+    Helper class to share the result of identical concurrent calls.
+
+    While a call for a key is in flight, further calls with the same key
+    await the result of this call instead of executing the call again.
+    The shared result must not be modified by the callers.
+    """
+
+    def __init__(self) -> None:
+        """Init the single flight helper."""
+        self._in_flight: Final[dict[Hashable, asyncio.Future[Any]]] = {}
+        self._hit_count: int = 0
+        self._miss_count: int = 0
+
+    @property
+    def hit_count(self) -> int:
+        """Return the number of calls, that awaited the result of a call in flight."""
+        return self._hit_count
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of calls in flight."""
+        return len(self._in_flight)
+
+    @property
+    def miss_count(self) -> int:
+        """Return the number of calls, that have been executed."""
+        return self._miss_count
+
+    async def run[_R](self, key: Hashable, call: Callable[[], Awaitable[_R]]) -> _R:
+        """Execute the call, or await the result of the identical call in flight."""
+        while (future := self._in_flight.get(key)) is not None:
+            self._hit_count += 1
+            try:
+                return cast(_R, await asyncio.shield(future))
+            except asyncio.CancelledError:
+                # Retry, if the call in flight has been cancelled, but not this one.
+                if not future.cancelled() or cancelling(
+                    cast(asyncio.Task, asyncio.current_task())
+                ):
+                    raise
+
+        self._miss_count += 1
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as ex:
+            future.set_exception(ex)
+            # mark the exception as retrieved, if there are no waiting callers
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._in_flight[key]
+
+
 def cancelling(task: asyncio.Future[Any]) -> bool:
     """Return True if task is cancelling."""
     return bool((cancelling_ := getattr(task, "cancelling", None)) and cancelling_())
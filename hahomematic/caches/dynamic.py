@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Mapping
 from datetime import datetime
 import logging
@@ -18,6 +19,7 @@ from hahomematic.const import (
     DP_KEY_VALUE,
     INIT_DATETIME,
     MAX_CACHE_AGE,
+    MAX_DEVICE_DATA_DELTA_AGE,
     NO_CACHE_ENTRY,
     CallSource,
     EventKey,
@@ -145,13 +147,23 @@ class DeviceDetailsCache:
         _LOGGER.debug("LOAD: Loading names for %s", self._central.name)
         if client := self._central.primary_client:
             await client.fetch_device_details()
-        _LOGGER.debug("LOAD: Loading rooms for %s", self._central.name)
+        # rooms and functions are mapped by the channel ids of the device details
+        _LOGGER.debug("LOAD: Loading rooms and functions for %s", self._central.name)
+        rooms, functions = await asyncio.gather(self._get_all_rooms(), self._get_all_functions())
+        self.set_rooms_and_functions(rooms=rooms, functions=functions)
+
+    def set_rooms_and_functions(
+        self,
+        rooms: dict[str, set[str]],
+        functions: dict[str, set[str]],
+        refreshed_at: datetime | None = None,
+    ) -> None:
+        """Set the rooms and functions, that have been fetched together with the names."""
         self._channel_rooms.clear()
-        self._channel_rooms.update(await self._get_all_rooms())
-        _LOGGER.debug("LOAD: Loading functions for %s", self._central.name)
+        self._channel_rooms.update(rooms)
         self._functions.clear()
-        self._functions.update(await self._get_all_functions())
-        self._refreshed_at = datetime.now()
+        self._functions.update(functions)
+        self._refreshed_at = refreshed_at or datetime.now()
 
     @property
     def device_channel_ids(self) -> Mapping[str, str]:
@@ -234,8 +246,8 @@ class CentralDataCache:
     def __init__(self, central: hmcu.CentralUnit) -> None:
         """Init the central data cache."""
         self._central: Final = central
-        # { key, value}
-        self._value_cache: Final[dict[Interface, dict[str, Any]]] = {}
+        # {interface, {channel_address, {parameter, value}}}
+        self._value_cache: Final[dict[Interface, dict[str, dict[str, Any]]]] = {}
         self._refreshed_at: Final[dict[Interface, datetime]] = {}
 
     async def load(self, direct_call: bool = False, interface: Interface | None = None) -> None:
@@ -249,7 +261,9 @@ class CentralDataCache:
                 max_age=int(MAX_CACHE_AGE / 3),
             ):
                 return
-            await client.fetch_all_device_data()
+            await client.fetch_all_device_data(
+                since=self._get_delta_since(interface=client.interface)
+            )
 
     async def refresh_data_point_data(
         self,
@@ -265,10 +279,30 @@ class CentralDataCache:
                 call_source=CallSource.HM_INIT, direct_call=direct_call
             )
 
-    def add_data(self, interface: Interface, all_device_data: dict[str, Any]) -> None:
+    def add_data(
+        self,
+        interface: Interface,
+        all_device_data: dict[str, dict[str, Any]],
+        refreshed_at: datetime | None = None,
+    ) -> None:
         """Add data to cache."""
         self._value_cache[interface] = all_device_data
-        self._refreshed_at[interface] = datetime.now()
+        self._refreshed_at[interface] = refreshed_at or datetime.now()
+
+    def merge_data(
+        self,
+        interface: Interface,
+        all_device_data: dict[str, dict[str, Any]],
+        refreshed_at: datetime | None = None,
+    ) -> None:
+        """Merge the changed data into the cache."""
+        value_cache = self._value_cache.setdefault(interface, {})
+        for channel_address, channel_values in all_device_data.items():
+            if (cached_values := value_cache.get(channel_address)) is None:
+                value_cache[channel_address] = channel_values
+            else:
+                cached_values.update(channel_values)
+        self._refreshed_at[interface] = refreshed_at or datetime.now()
 
     def get_data(
         self,
@@ -277,9 +311,10 @@ class CentralDataCache:
         parameter: str,
     ) -> Any:
         """Get data from cache."""
-        if not self._is_empty(interface=interface):
-            key = f"{interface}.{channel_address.replace(':','%3A')}.{parameter}"
-            return self._value_cache[interface].get(key, NO_CACHE_ENTRY)
+        if not self._is_empty(interface=interface) and (
+            channel_values := self._value_cache[interface].get(channel_address)
+        ):
+            return channel_values.get(parameter, NO_CACHE_ENTRY)
         return NO_CACHE_ENTRY
 
     def clear(self, interface: Interface | None = None) -> None:
@@ -295,14 +330,22 @@ class CentralDataCache:
         """Return when cache has been refreshed."""
         return self._refreshed_at.get(interface, INIT_DATETIME)
 
+    def _get_delta_since(self, interface: Interface) -> datetime | None:
+        """Return since when the changed data can be merged, or None if all data is required."""
+        refreshed_at = self._get_refreshed_at(interface=interface)
+        if refreshed_at == INIT_DATETIME or interface not in self._value_cache:
+            return None
+        if (datetime.now() - refreshed_at).total_seconds() > MAX_DEVICE_DATA_DELTA_AGE:
+            self.clear(interface=interface)
+            return None
+        return refreshed_at
+
     def _is_empty(self, interface: Interface) -> bool:
         """Return if cache is empty."""
         if len(self._value_cache) == 0:
             return True
-        if not changed_within_seconds(last_change=self._get_refreshed_at(interface=interface)):
-            self.clear(interface=interface)
-            return True
-        return False
+        # outdated data is not used, but kept as base for the next delta
+        return not changed_within_seconds(last_change=self._get_refreshed_at(interface=interface))
 
 
 class PingPongCache:
@@ -2,24 +2,26 @@
 
 from __future__ import annotations
 
-from abc import ABC
+from abc import ABC, abstractmethod
 import asyncio
 from collections.abc import Mapping
 from datetime import datetime
-from functools import lru_cache
+from functools import lru_cache, partial
+import hashlib
 import logging
 import os
-from typing import Any, Final
+import re
+from time import monotonic
+from typing import Any, Final, cast
 
 import orjson
 
-from hahomematic import central as hmcu
+from hahomematic import central as hmcu, config
 from hahomematic.const import (
     CACHE_PATH,
     FILE_DEVICES,
     FILE_PARAMSETS,
     INIT_DATETIME,
-    UTF8,
     DataOperationResult,
     DeviceDescription,
     ParameterData,
@@ -31,14 +33,31 @@ from hahomematic.support import (
     delete_file,
     get_device_address,
     get_split_channel_address,
-    hash_sha256,
+    reduce_args,
 )
 
 _LOGGER: Final = logging.getLogger(__name__)
 
+_FILE_KEY_CHANNELS: Final = "channels"
+_FILE_KEY_CHECKSUM: Final = "checksum"
+_FILE_KEY_DESCRIPTIONS: Final = "descriptions"
+_FILE_KEY_MODEL: Final = "model"
+_FILE_KEY_REGION: Final = "region"
+_FILE_KEY_SHARDS: Final = "shards"
+_FILE_KEY_VERSION: Final = "version"
+_MANIFEST_FILE: Final = "manifest.json"
+_MANIFEST_VERSION: Final = 2
+_SHARD_NAME_PATTERN: Final = re.compile(r"[^\w.-]")
+
 
 class BasePersistentCache(ABC):
-    """Cache for files."""
+    """
+    Cache for files.
+
+    The cache is stored in one shard file per region (interface_id) and model,
+    and a manifest with the checksums of the shards. Only the shards of the
+    changed regions are serialized, and only the changed shards are written.
+    """
 
     _file_postfix: str
 
@@ -52,83 +71,390 @@ class BasePersistentCache(ABC):
         self._central: Final = central
         self._cache_dir: Final = f"{central.config.storage_folder}/{CACHE_PATH}"
         self._filename: Final = f"{central.name}_{self._file_postfix}"
+        self._shard_dir: Final = os.path.join(self._cache_dir, os.path.splitext(self._filename)[0])
         self._persistant_cache: Final = persistant_cache
+        # {region, change_count}, the regions (interface_ids) changed since the last save
+        self._dirty_regions: Final[dict[str, int]] = {}
+        self._change_count = 0
+        self._saved_change_count = 0
+        # {shard_name, {region, model, checksum}}, the shards on disk
+        self._manifest: dict[str, dict[str, str]] | None = None
+        # {shard_name, checksum}, the shards, that are in memory
+        self._loaded_checksums: Final[dict[str, str]] = {}
         self.last_save_triggered: datetime = INIT_DATETIME
-        self.last_hash_saved = hash_sha256(value=persistant_cache)
+        self._save_timer: asyncio.TimerHandle | None = None
+        self._save_requested_at: float | None = None
 
     @property
     def cache_hash(self) -> str:
-        """Return the hash of the cache."""
-        return hash_sha256(value=self._persistant_cache)
+        """Return the fingerprint of the cache content."""
+        return _get_fingerprint(
+            data=orjson.dumps(self._persistant_cache, option=orjson.OPT_NON_STR_KEYS)
+        )
 
     @property
     def data_changed(self) -> bool:
         """Return if the data has changed."""
-        return self.cache_hash != self.last_hash_saved
+        return self._change_count != self._saved_change_count
+
+    @property
+    def dirty_regions(self) -> tuple[str, ...]:
+        """Return the regions, that have changed since the last save."""
+        return tuple(self._dirty_regions)
+
+    def _mark_dirty(self, region: str) -> None:
+        """Mark a region of the cache as changed."""
+        self._change_count += 1
+        self._dirty_regions[region] = self._change_count
+
+    def _mark_clean(self, change_count: int) -> None:
+        """Mark the changes up to the change count as saved."""
+        self._saved_change_count = change_count
+        for region, region_change_count in tuple(self._dirty_regions.items()):
+            if region_change_count <= change_count:
+                del self._dirty_regions[region]
+
+    @abstractmethod
+    def _get_shards(self, region: str) -> dict[str, Any]:
+        """Return the content of the shards of a region by model."""
+
+    @abstractmethod
+    def _add_shard(self, region: str, content: Any) -> None:
+        """Add the content of a loaded shard to the cache."""
+
+    def _clear_region(self, region: str) -> None:
+        """Remove the content of a region from the cache."""
+        self._persistant_cache.pop(region, None)
+
+    def _to_file_data(self, content: Any) -> Any:
+        """Return the data of a shard, that is written to the file."""
+        return content
+
+    def _from_file_data(self, data: Any) -> Any:
+        """Return the content of a shard of the data, that has been read from the file."""
+        return data
+
+    def _from_legacy_file_data(self, data: Any) -> dict[str, Any]:
+        """Return the cache content of the file, that has been used before the shards."""
+        return cast(dict[str, Any], data)
+
+    def _get_shard_name(self, region: str, model: str) -> str:
+        """Return the name of a shard."""
+        name = f"{region}_{model}"
+        return f"{_SHARD_NAME_PATTERN.sub('_', name)}_{_get_fingerprint(data=name.encode())[:8]}"
+
+    def _read_manifest(self) -> dict[str, dict[str, str]] | None:
+        """Return the manifest of the shards on disk."""
+        if not os.path.exists(manifest_path := os.path.join(self._shard_dir, _MANIFEST_FILE)):
+            return None
+        with open(file=manifest_path, mode="rb") as fptr:
+            data = fptr.read()
+        try:
+            manifest = orjson.loads(data)
+        except orjson.JSONDecodeError:
+            manifest = None
+        if isinstance(manifest, dict) and manifest.get(_FILE_KEY_VERSION) != _MANIFEST_VERSION:
+            return None
+        if not _is_valid_manifest(manifest=manifest):
+            _LOGGER.warning(
+                "LOAD failed: Manifest of %s is malformed. Ignoring the cache shards",
+                self._filename,
+            )
+            return None
+        return cast(dict[str, dict[str, str]], manifest[_FILE_KEY_SHARDS])
+
+    def _read_shards(self, shards: dict[str, dict[str, str]]) -> list[Any] | None:
+        """Return the contents of the shards of a region, or None if a shard is missing or corrupt."""
+        contents: list[Any] = []
+        for shard_name, entry in shards.items():
+            file_name = _get_shard_file_name(
+                shard_name=shard_name, checksum=entry[_FILE_KEY_CHECKSUM]
+            )
+            try:
+                with open(file=os.path.join(self._shard_dir, file_name), mode="rb") as fptr:
+                    data = fptr.read()
+            except OSError as oserr:
+                _LOGGER.warning(
+                    "LOAD failed: Unable to read cache shard %s of %s. Dropping region %s: %s",
+                    file_name,
+                    self._filename,
+                    entry[_FILE_KEY_REGION],
+                    reduce_args(args=oserr.args),
+                )
+                return None
+            if _get_fingerprint(data=data) != entry[_FILE_KEY_CHECKSUM]:
+                _LOGGER.warning(
+                    "LOAD failed: Checksum of cache shard %s of %s does not match. Dropping region %s",
+                    file_name,
+                    self._filename,
+                    entry[_FILE_KEY_REGION],
+                )
+                return None
+            contents.append(self._from_file_data(data=orjson.loads(data)))
+        return contents
+
+    def schedule_save(self) -> None:
+        """
+        Save the cache in the background after a delay.
+
+        The delay is restarted by every request, so the changes of a burst are
+        saved together, but not later than the max delay after the first request.
+        """
+        self.last_save_triggered = datetime.now()
+        now = monotonic()
+        if self._save_requested_at is None:
+            self._save_requested_at = now
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+        delay = min(
+            config.CACHE_SAVE_DELAY,
+            max(0, self._save_requested_at + config.CACHE_SAVE_MAX_DELAY - now),
+        )
+        self._save_timer = asyncio.get_running_loop().call_later(delay, self._start_save)
+
+    def _start_save(self) -> None:
+        """Start the scheduled save."""
+        self._save_timer = None
+        self._save_requested_at = None
+        self._central.looper.create_task(
+            self._save_scheduled(), name=f"save-persistent-cache-{self._filename}"
+        )
+
+    async def _save_scheduled(self) -> None:
+        """Save the cache, and log instead of raising the errors."""
+        try:
+            await self.save()
+        except Exception as ex:
+            _LOGGER.warning(
+                "SAVE failed: Unable to save %s: %s [%s]",
+                self._filename,
+                type(ex).__name__,
+                reduce_args(args=ex.args),
+            )
+
+    async def flush(self) -> DataOperationResult:
+        """Save the scheduled changes now."""
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+            self._save_timer = None
+            self._save_requested_at = None
+        return await self.save()
 
     async def save(self) -> DataOperationResult:
         """Save current name data in NAMES to disk."""
         self.last_save_triggered = datetime.now()
         if (
-            not check_or_create_directory(self._cache_dir)
+            not check_or_create_directory(self._shard_dir)
             or not self._central.config.use_caches
-            or (cache_hash := self.cache_hash) == self.last_hash_saved
+            or not self.data_changed
         ):
             return DataOperationResult.NO_SAVE
 
-        def _save() -> DataOperationResult:
-            with open(
-                file=os.path.join(self._cache_dir, self._filename),
-                mode="wb",
-            ) as fptr:
-                fptr.write(
-                    orjson.dumps(
-                        self._persistant_cache,
-                        option=orjson.OPT_NON_STR_KEYS,
-                    )
-                )
-                self.last_hash_saved = cache_hash
+        change_count = self._change_count
+        regions = set(self.dirty_regions)
+        # the shards are collected in the event loop, so that the cache is not changed meanwhile.
+        # Only the serialization and the file operations are done in the executor.
+        # {shard_name, (region, model, file_data)}
+        shards: dict[str, tuple[str, str, Any]] = {
+            self._get_shard_name(region=region, model=model): (
+                region,
+                model,
+                self._to_file_data(content=content),
+            )
+            for region in regions
+            for model, content in self._get_shards(region=region).items()
+        }
 
-            return DataOperationResult.SAVE_SUCCESS
+        def _save(
+            old_manifest: dict[str, dict[str, str]] | None,
+        ) -> tuple[DataOperationResult, dict[str, dict[str, str]], dict[str, str]]:
+            if old_manifest is None:
+                old_manifest = self._read_manifest() or {}
+            manifest = {
+                shard_name: entry
+                for shard_name, entry in old_manifest.items()
+                if entry[_FILE_KEY_REGION] not in regions
+            }
+            checksums: dict[str, str] = {}
+            written_count = 0
+            for shard_name, (region, model, file_data) in shards.items():
+                data = orjson.dumps(file_data, option=orjson.OPT_NON_STR_KEYS)
+                checksums[shard_name] = checksum = _get_fingerprint(data=data)
+                manifest[shard_name] = {
+                    _FILE_KEY_REGION: region,
+                    _FILE_KEY_MODEL: model,
+                    _FILE_KEY_CHECKSUM: checksum,
+                }
+                # the changes may have been reverted, e.g. by re-adding a removed device
+                if old_manifest.get(shard_name, {}).get(_FILE_KEY_CHECKSUM) != checksum:
+                    _write_file(
+                        folder=self._shard_dir,
+                        file_name=_get_shard_file_name(shard_name=shard_name, checksum=checksum),
+                        data=data,
+                    )
+                    written_count += 1
+            if manifest == old_manifest:
+                return DataOperationResult.NO_SAVE, manifest, checksums
+            # A changed shard is written to a new file, the manifest is swapped after all
+            # shards are written, and the replaced shards are deleted afterwards. So the
+            # manifest on disk never references a missing or partially written shard.
+            _write_file(
+                folder=self._shard_dir,
+                file_name=_MANIFEST_FILE,
+                data=orjson.dumps(
+                    {_FILE_KEY_VERSION: _MANIFEST_VERSION, _FILE_KEY_SHARDS: manifest}
+                ),
+            )
+            referenced_files = {
+                _get_shard_file_name(shard_name=shard_name, checksum=entry[_FILE_KEY_CHECKSUM])
+                for shard_name, entry in manifest.items()
+            }
+            for file_name in os.listdir(self._shard_dir):
+                if file_name != _MANIFEST_FILE and file_name not in referenced_files:
+                    delete_file(folder=self._shard_dir, file_name=file_name)
+            delete_file(folder=self._cache_dir, file_name=self._filename)
+            _LOGGER.debug("SAVE: Written %i shards of %s", written_count, self._filename)
+            return DataOperationResult.SAVE_SUCCESS, manifest, checksums
 
         async with self._sema_save_or_load:
-            return await self._central.looper.async_add_executor_job(
-                _save, name=f"save-persistent-cache-{self._filename}"
+            result, manifest, checksums = await self._central.looper.async_add_executor_job(
+                partial(_save, old_manifest=self._manifest),
+                name=f"save-persistent-cache-{self._filename}",
             )
+            self._manifest = manifest
+            for shard_name in tuple(self._loaded_checksums):
+                if shard_name not in manifest:
+                    del self._loaded_checksums[shard_name]
+            self._loaded_checksums.update(checksums)
+            self._mark_clean(change_count=change_count)
+            return result
 
     async def load(self) -> DataOperationResult:
-        """Load file from disk into dict."""
-        if not check_or_create_directory(self._cache_dir) or not os.path.exists(
-            os.path.join(self._cache_dir, self._filename)
-        ):
+        """
+        Load the shards from disk into the cache.
+
+        Only the manifest and the changed shards of the interfaces of the central are read.
+        A region with a missing or corrupt shard is dropped, and fetched again from the backend.
+        """
+        if not check_or_create_directory(self._shard_dir):
             return DataOperationResult.NO_LOAD
 
-        def _load() -> DataOperationResult:
-            with open(
-                file=os.path.join(self._cache_dir, self._filename),
-                encoding=UTF8,
-            ) as fptr:
-                data = orjson.loads(fptr.read())
-                if (converted_hash := hash_sha256(value=data)) == self.last_hash_saved:
-                    return DataOperationResult.NO_LOAD
-                self._persistant_cache.clear()
-                self._persistant_cache.update(data)
-                self.last_hash_saved = converted_hash
-            return DataOperationResult.LOAD_SUCCESS
+        interface_ids = self._central.interface_ids
+        loaded_checksums = dict(self._loaded_checksums)
+
+        def _load() -> tuple[dict[str, dict[str, str]] | None, dict[str, list[Any]]]:
+            if (manifest := self._read_manifest()) is None:
+                return None, {}
+            # {region, {shard_name, manifest_entry}}
+            regions: dict[str, dict[str, dict[str, str]]] = {}
+            for shard_name, entry in manifest.items():
+                regions.setdefault(entry[_FILE_KEY_REGION], {})[shard_name] = entry
+            # {region, [shard_content]}
+            region_contents: dict[str, list[Any]] = {}
+            for region, shards in regions.items():
+                if region not in interface_ids or all(
+                    loaded_checksums.get(shard_name) == entry[_FILE_KEY_CHECKSUM]
+                    for shard_name, entry in shards.items()
+                ):
+                    continue
+                if (contents := self._read_shards(shards=shards)) is not None:
+                    region_contents[region] = contents
+            return manifest, region_contents
 
         async with self._sema_save_or_load:
-            return await self._central.looper.async_add_executor_job(
+            manifest, region_contents = await self._central.looper.async_add_executor_job(
+                _load, name=f"load-persistent-cache-{self._filename}"
+            )
+            if manifest is None:
+                return await self._load_legacy_file()
+            for region, contents in region_contents.items():
+                self._clear_region(region=region)
+                for content in contents:
+                    self._add_shard(region=region, content=content)
+                for shard_name, entry in manifest.items():
+                    if entry[_FILE_KEY_REGION] == region:
+                        self._loaded_checksums[shard_name] = entry[_FILE_KEY_CHECKSUM]
+            self._manifest = manifest
+            if not region_contents:
+                return DataOperationResult.NO_LOAD
+            # the cache content is the content of the files
+            self._mark_clean(change_count=self._change_count)
+            return DataOperationResult.LOAD_SUCCESS
+
+    async def _load_legacy_file(self) -> DataOperationResult:
+        """Load the file, that has been used before the shards."""
+
+        def _load() -> dict[str, Any] | None:
+            if not os.path.exists(legacy_path := os.path.join(self._cache_dir, self._filename)):
+                return None
+            with open(file=legacy_path, mode="rb") as fptr:
+                return self._from_legacy_file_data(data=orjson.loads(fptr.read()))
+
+        if (
+            data := await self._central.looper.async_add_executor_job(
                 _load, name=f"load-persistent-cache-{self._filename}"
             )
+        ) is None:
+            return DataOperationResult.NO_LOAD
+        self._persistant_cache.clear()
+        self._persistant_cache.update(data)
+        self._mark_clean(change_count=self._change_count)
+        # the file is migrated with the next save
+        for region in self._persistant_cache:
+            self._mark_dirty(region=region)
+        return DataOperationResult.LOAD_SUCCESS
 
     async def clear(self) -> None:
-        """Remove stored file from disk."""
+        """Remove stored files from disk."""
 
         def _clear() -> None:
+            if os.path.exists(self._shard_dir):
+                for file_name in os.listdir(self._shard_dir):
+                    delete_file(folder=self._shard_dir, file_name=file_name)
             delete_file(folder=self._cache_dir, file_name=self._filename)
             self._persistant_cache.clear()
 
         await self._central.looper.async_add_executor_job(_clear, name="clear-persistent-cache")
+        self._manifest = None
+        self._loaded_checksums.clear()
+        self._mark_clean(change_count=self._change_count)
+
+
+def _get_fingerprint(data: bytes) -> str:
+    """Return the fingerprint of the serialized cache."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def _is_valid_manifest(manifest: Any) -> bool:
+    """Return if the manifest has the structure of the current version."""
+    if not isinstance(manifest, dict) or not isinstance(
+        shards := manifest.get(_FILE_KEY_SHARDS), dict
+    ):
+        return False
+    return all(
+        isinstance(entry, dict)
+        and all(
+            isinstance(entry.get(key), str)
+            for key in (_FILE_KEY_REGION, _FILE_KEY_MODEL, _FILE_KEY_CHECKSUM)
+        )
+        for entry in shards.values()
+    )
+
+
+def _get_shard_file_name(shard_name: str, checksum: str) -> str:
+    """Return the file name of a shard with the checksum of its content."""
+    return f"{shard_name}_{checksum[:16]}.json"
+
+
+def _write_file(folder: str, file_name: str, data: bytes) -> None:
+    """Write a file atomically by replacing it with a completely written temporary file."""
+    file_path = os.path.join(folder, file_name)
+    tmp_file_path = f"{file_path}.tmp"
+    with open(file=tmp_file_path, mode="wb") as fptr:
+        fptr.write(data)
+        fptr.flush()
+        os.fsync(fptr.fileno())
+    os.replace(tmp_file_path, file_path)
 
 
 class DeviceDescriptionCache(BasePersistentCache):
@@ -161,6 +487,7 @@ class DeviceDescriptionCache(BasePersistentCache):
             deleted_addresses=[device_description["ADDRESS"]],
         )
         self._raw_device_descriptions[interface_id].append(device_description)
+        self._mark_dirty(region=interface_id)
 
         self._convert_device_description(
             interface_id=interface_id, device_description=device_description
@@ -176,6 +503,7 @@ class DeviceDescriptionCache(BasePersistentCache):
             interface_id=device.interface_id,
             deleted_addresses=[device.address, *list(device.channels.keys())],
         )
+        self._mark_dirty(region=device.interface_id)
 
     def _remove_device(self, interface_id: str, deleted_addresses: list[str]) -> None:
         """Remove device from cache."""
@@ -265,6 +593,32 @@ class DeviceDescriptionCache(BasePersistentCache):
                 self._addresses[interface_id][device_address] = set()
             self._addresses[interface_id][device_address].add(address)
 
+    def _get_shards(self, region: str) -> dict[str, list[DeviceDescription]]:
+        """Return the device descriptions of an interface by model."""
+        device_descriptions = self._raw_device_descriptions.get(region, [])
+        models = {
+            device_description["ADDRESS"]: device_description["TYPE"]
+            for device_description in device_descriptions
+            if not device_description.get("PARENT")
+        }
+        shards: dict[str, list[DeviceDescription]] = {}
+        for device_description in device_descriptions:
+            model = models.get(
+                device_description.get("PARENT") or device_description["ADDRESS"], ""
+            )
+            shards.setdefault(model, []).append(device_description)
+        return shards
+
+    def _add_shard(self, region: str, content: list[DeviceDescription]) -> None:
+        """Add the loaded device descriptions of a model."""
+        self._raw_device_descriptions.setdefault(region, []).extend(content)
+
+    def _clear_region(self, region: str) -> None:
+        """Remove the device descriptions of an interface."""
+        self._raw_device_descriptions.pop(region, None)
+        self._addresses.pop(region, None)
+        self._device_descriptions.pop(region, None)
+
     async def load(self) -> DataOperationResult:
         """Load device data from disk into _device_description_cache."""
         if not self._central.config.use_caches:
@@ -297,6 +651,10 @@ class ParamsetDescriptionCache(BasePersistentCache):
 
         # {(device_address, parameter), [channel_no]}
         self._address_parameter_cache: Final[dict[tuple[str, str], set[int | None]]] = {}
+        # {(model, firmware, channel_no), {paramset_key, paramset_description}}
+        self._shared_paramset_descriptions: Final[
+            dict[tuple[str, str, int | None], dict[ParamsetKey, dict[str, ParameterData]]]
+        ] = {}
 
     @property
     def raw_paramset_descriptions(
@@ -321,8 +679,14 @@ class ParamsetDescriptionCache(BasePersistentCache):
             self._raw_paramset_descriptions[interface_id][channel_address][paramset_key] = {}
 
         self._raw_paramset_descriptions[interface_id][channel_address][paramset_key] = (
-            paramset_description
+            self._get_shared_paramset_description(
+                interface_id=interface_id,
+                channel_address=channel_address,
+                paramset_key=paramset_key,
+                paramset_description=paramset_description,
+            )
         )
+        self._mark_dirty(region=interface_id)
 
         self._add_address_parameter(
             channel_address=channel_address, paramsets=[paramset_description]
@@ -334,6 +698,115 @@ class ParamsetDescriptionCache(BasePersistentCache):
             for channel_address in device.channels:
                 if channel_address in interface:
                     del self._raw_paramset_descriptions[device.interface_id][channel_address]
+                    self._mark_dirty(region=device.interface_id)
+
+    def _get_shared_paramset_description(
+        self,
+        interface_id: str,
+        channel_address: str,
+        paramset_key: ParamsetKey,
+        paramset_description: dict[str, ParameterData],
+    ) -> dict[str, ParameterData]:
+        """
+        Return the equal paramset description of the same model, firmware and channel.
+
+        The paramset descriptions are only stored once for all devices of a model.
+        """
+        device_address, channel_no = get_split_channel_address(channel_address)
+        if not (
+            device_description := self._central.device_descriptions.find_device_description(
+                interface_id=interface_id, device_address=device_address
+            )
+        ):
+            return paramset_description
+        model_key = (
+            device_description["TYPE"],
+            device_description.get("FIRMWARE", ""),
+            channel_no,
+        )
+        if (
+            model_paramset_descriptions := self._shared_paramset_descriptions.get(model_key)
+        ) is None:
+            model_paramset_descriptions = self._shared_paramset_descriptions[model_key] = {}
+        paramset_key = ParamsetKey(paramset_key)
+        if (shared_paramset_description := model_paramset_descriptions.get(paramset_key)) is None:
+            model_paramset_descriptions[paramset_key] = paramset_description
+            return paramset_description
+        if shared_paramset_description == paramset_description:
+            return shared_paramset_description
+        return paramset_description
+
+    def get_model_paramset_descriptions(
+        self, model: str, firmware: str, channel_no: int | None
+    ) -> Mapping[ParamsetKey, dict[str, ParameterData]]:
+        """Return the known paramset descriptions of a channel of a model and firmware."""
+        return self._shared_paramset_descriptions.get((model, firmware, channel_no), {})
+
+    def _share_paramset_descriptions(self) -> None:
+        """Share the equal paramset descriptions of the loaded cache."""
+        self._shared_paramset_descriptions.clear()
+        for interface_id, channel_paramsets in self._raw_paramset_descriptions.items():
+            for channel_address, paramsets in channel_paramsets.items():
+                for paramset_key, paramset_description in paramsets.items():
+                    paramsets[paramset_key] = self._get_shared_paramset_description(
+                        interface_id=interface_id,
+                        channel_address=channel_address,
+                        paramset_key=paramset_key,
+                        paramset_description=paramset_description,
+                    )
+
+    def _get_shards(
+        self, region: str
+    ) -> dict[str, dict[str, dict[ParamsetKey, dict[str, ParameterData]]]]:
+        """Return the paramset descriptions of an interface by model."""
+        shards: dict[str, dict[str, dict[ParamsetKey, dict[str, ParameterData]]]] = {}
+        for channel_address, paramsets in self._raw_paramset_descriptions.get(region, {}).items():
+            device_description = self._central.device_descriptions.find_device_description(
+                interface_id=region, device_address=get_device_address(channel_address)
+            )
+            model = device_description["TYPE"] if device_description else ""
+            shards.setdefault(model, {})[channel_address] = paramsets
+        return shards
+
+    def _add_shard(
+        self, region: str, content: dict[str, dict[ParamsetKey, dict[str, ParameterData]]]
+    ) -> None:
+        """Add the loaded paramset descriptions of a model."""
+        self._raw_paramset_descriptions.setdefault(region, {}).update(content)
+
+    def _to_file_data(
+        self, content: dict[str, dict[ParamsetKey, dict[str, ParameterData]]]
+    ) -> dict[str, Any]:
+        """Return the paramset descriptions with the shared ones written once."""
+        descriptions: list[dict[str, ParameterData]] = []
+        # {id(paramset_description), index}
+        indexes: dict[int, int] = {}
+        channels: dict[str, dict[ParamsetKey, int]] = {}
+        for channel_address, paramsets in content.items():
+            channels[channel_address] = {}
+            for paramset_key, paramset_description in paramsets.items():
+                if (index := indexes.get(id(paramset_description))) is None:
+                    index = indexes[id(paramset_description)] = len(descriptions)
+                    descriptions.append(paramset_description)
+                channels[channel_address][paramset_key] = index
+        return {_FILE_KEY_DESCRIPTIONS: descriptions, _FILE_KEY_CHANNELS: channels}
+
+    def _from_file_data(self, data: Any) -> dict[str, Any]:
+        """Return the paramset descriptions of a shard."""
+        return _get_channel_paramset_descriptions(
+            descriptions=data[_FILE_KEY_DESCRIPTIONS], channels=data[_FILE_KEY_CHANNELS]
+        )
+
+    def _from_legacy_file_data(self, data: Any) -> dict[str, Any]:
+        """Return the paramset descriptions of the file, also of the format with sharing."""
+        if _FILE_KEY_CHANNELS not in data:
+            return cast(dict[str, Any], data)
+        return {
+            interface_id: _get_channel_paramset_descriptions(
+                descriptions=data[_FILE_KEY_DESCRIPTIONS], channels=channels
+            )
+            for interface_id, channels in data[_FILE_KEY_CHANNELS].items()
+        }
 
     def has_interface_id(self, interface_id: str) -> bool:
         """Return if interface is in paramset_descriptions cache."""
@@ -433,9 +906,22 @@ class ParamsetDescriptionCache(BasePersistentCache):
             _LOGGER.debug("load: not caching device descriptions for %s", self._central.name)
             return DataOperationResult.NO_LOAD
         result = await super().load()
+        self._share_paramset_descriptions()
         self._init_address_parameter_list()
         return result
 
     async def save(self) -> DataOperationResult:
         """Save current paramset descriptions to disk."""
         return await super().save()
+
+
+def _get_channel_paramset_descriptions(
+    descriptions: list[dict[str, ParameterData]], channels: dict[str, dict[str, int]]
+) -> dict[str, dict[str, dict[str, ParameterData]]]:
+    """Return the paramset descriptions by channel of the shared descriptions of a file."""
+    return {
+        channel_address: {
+            paramset_key: descriptions[index] for paramset_key, index in paramsets.items()
+        }
+        for channel_address, paramsets in channels.items()
+    }
@@ -24,25 +24,38 @@ from hahomematic.async_support import Looper, loop_check
 from hahomematic.caches.dynamic import CentralDataCache, DeviceDetailsCache
 from hahomematic.caches.persistent import DeviceDescriptionCache, ParamsetDescriptionCache
 from hahomematic.caches.visibility import ParameterVisibilityCache
-from hahomematic.central import xml_rpc_server as xmlrpc
+from hahomematic.central import bin_rpc_server as binrpc, xml_rpc_server as xmlrpc
 from hahomematic.central.decorators import callback_backend_system, callback_event
+from hahomematic.central.event_queue import EventQueue
 from hahomematic.client.json_rpc import JsonRpcAioHttpClient
-from hahomematic.client.xml_rpc import XmlRpcProxy
+from hahomematic.client.xml_rpc import BaseXmlRpcProxy
 from hahomematic.const import (
     CALLBACK_TYPE,
     CATEGORIES,
     DATA_POINT_EVENTS,
     DATETIME_FORMAT_MILLIS,
+    DEFAULT_BOOTSTRAP_ENABLED,
+    DEFAULT_COMMAND_BURST_SIZE,
+    DEFAULT_COMMAND_RATE_LIMIT,
+    DEFAULT_EVENT_COALESCING,
+    DEFAULT_EVENT_QUEUE_OVERFLOW_POLICY,
+    DEFAULT_EVENT_QUEUE_SIZE,
     DEFAULT_INCLUDE_INTERNAL_PROGRAMS,
     DEFAULT_INCLUDE_INTERNAL_SYSVARS,
+    DEFAULT_MAX_BACKGROUND_READS,
+    DEFAULT_MAX_JSON_RPC_CONCURRENCY,
     DEFAULT_MAX_READ_WORKERS,
+    DEFAULT_MULTICALL_BATCH_SIZE,
     DEFAULT_PERIODIC_REFRESH_INTERVAL,
     DEFAULT_PROGRAM_SCAN_ENABLED,
+    DEFAULT_RPC_SERVER_TYPE,
     DEFAULT_SYS_SCAN_INTERVAL,
     DEFAULT_SYSVAR_SCAN_ENABLED,
     DEFAULT_TLS,
     DEFAULT_UN_IGNORES,
     DEFAULT_VERIFY_TLS,
+    DEFAULT_XML_RPC_DECODER_TYPE,
+    DEFAULT_XML_RPC_PROXY_TYPE,
     DP_KEY,
     IGNORE_FOR_UN_IGNORE_PARAMETERS,
     INTERFACES_REQUIRING_PERIODIC_REFRESH,
@@ -52,10 +65,12 @@ from hahomematic.const import (
     PRIMARY_CLIENT_CANDIDATE_INTERFACES,
     UN_IGNORE_WILDCARD,
     BackendSystemEvent,
+    BootstrapData,
     DataPointCategory,
     DeviceDescription,
     DeviceFirmwareState,
     EventKey,
+    EventQueueOverflowPolicy,
     EventType,
     Interface,
     InterfaceEventType,
@@ -63,8 +78,13 @@ from hahomematic.const import (
     Parameter,
     ParamsetKey,
     ProxyInitState,
+    RpcProtocol,
+    RpcServerType,
     SystemInformation,
+    XmlRpcDecoderType,
+    XmlRpcProxyType,
 )
+from hahomematic.context import background_requests
 from hahomematic.decorators import service
 from hahomematic.exceptions import (
     BaseHomematicException,
@@ -97,7 +117,7 @@ _LOGGER: Final = logging.getLogger(__name__)
 
 # {instance_name, central}
 CENTRAL_INSTANCES: Final[dict[str, CentralUnit]] = {}
-ConnectionProblemIssuer = JsonRpcAioHttpClient | XmlRpcProxy
+ConnectionProblemIssuer = JsonRpcAioHttpClient | BaseXmlRpcProxy
 
 INTERFACE_EVENT_SCHEMA = vol.Schema(
     {
@@ -122,7 +142,8 @@ class CentralUnit(PayloadMixin):
         self._config: Final = central_config
         self._model: str | None = None
         self._looper = Looper()
-        self._xml_rpc_server: xmlrpc.XmlRpcServer | None = None
+        self._xml_rpc_server: xmlrpc.RpcServer | None = None
+        self._bin_rpc_server: binrpc.BinRpcServer | None = None
         self._json_rpc_client: Final = central_config.json_rpc_client
 
         # Caches for CCU data
@@ -139,6 +160,16 @@ class CentralUnit(PayloadMixin):
             dict[DP_KEY, list[Callable[[Any], Coroutine[Any, Any, None]]]]
         ] = {}
         self._data_point_path_event_subscriptions: Final[dict[str, DP_KEY]] = {}
+        # {(interface_id, channel_address, parameter)}, read by the xml rpc server
+        self._event_subscription_keys: Final[set[tuple[str, str, str]]] = set()
+        self._event_subscription_lock: Final = threading.Lock()
+        self._dropped_event_count: int = 0
+        self._event_queue: Final = EventQueue(
+            central=self,
+            coalesce=central_config.event_coalescing,
+            max_size=central_config.event_queue_size,
+            overflow_policy=central_config.event_queue_overflow_policy,
+        )
         self._sysvar_data_point_event_subscriptions: Final[dict[str, Callable]] = {}
         # {device_address, device}
         self._devices: Final[dict[str, Device]] = {}
@@ -151,7 +182,9 @@ class CentralUnit(PayloadMixin):
         self._backend_system_callbacks: Final[set[Callable]] = set()
         # Signature: (interface_id, channel_address, parameter, value)
         # Re-Fired events from CCU for parameter updates
-        self._backend_parameter_callbacks: Final[set[Callable]] = set()
+        # {callback, parameters, that are processed without subscription}
+        self._backend_parameter_callbacks: Final[dict[Callable, frozenset[str]]] = {}
+        self._backend_callback_parameters: frozenset[str] = frozenset()
         # Signature: (event_type, event_data)
         # Events like INTERFACE, KEYPRESS, ...
         self._homematic_callbacks: Final[set[Callable]] = set()
@@ -165,12 +198,18 @@ class CentralUnit(PayloadMixin):
         self._callback_ip_addr: str = IP_ANY_V4
         self._listen_ip_addr: str = IP_ANY_V4
         self._listen_port: int = PORT_ANY
+        self._bin_rpc_listen_port: int = PORT_ANY
 
     @property
     def available(self) -> bool:
         """Return the availability of the central."""
         return all(client.available for client in self._clients.values())
 
+    @property
+    def bin_rpc_listen_port(self) -> int:
+        """Return the bin rpc listening server port."""
+        return self._bin_rpc_listen_port
+
     @property
     def callback_ip_addr(self) -> str:
         """Return the xml rpc server callback ip address."""
@@ -211,13 +250,23 @@ class CentralUnit(PayloadMixin):
         """Return all devices."""
         return tuple(self._devices.values())
 
+    @property
+    def event_queue(self) -> EventQueue:
+        """Return the event queue."""
+        return self._event_queue
+
+    @property
+    def dropped_event_count(self) -> int:
+        """Return the approximate number of events, that have been dropped without subscription."""
+        return self._dropped_event_count
+
     @property
     def _has_active_threads(self) -> bool:
         """Return if active sub threads are alive."""
         if self._connection_checker.is_alive():
             return True
         return bool(
-            self._xml_rpc_server
+            isinstance(self._xml_rpc_server, xmlrpc.XmlRpcServer)
             and self._xml_rpc_server.no_central_assigned
             and self._xml_rpc_server.is_alive()
         )
@@ -357,11 +406,16 @@ class CentralUnit(PayloadMixin):
     async def save_caches(
         self, save_device_descriptions: bool = False, save_paramset_descriptions: bool = False
     ) -> None:
-        """Save persistent caches."""
+        """Save persistent caches in the background, the changes of a burst are saved together."""
         if save_device_descriptions:
-            await self._device_descriptions.save()
+            self._device_descriptions.schedule_save()
         if save_paramset_descriptions:
-            await self._paramset_descriptions.save()
+            self._paramset_descriptions.schedule_save()
+
+    async def flush_caches(self) -> None:
+        """Save the scheduled changes of the persistent caches now."""
+        await self._device_descriptions.flush()
+        await self._paramset_descriptions.flush()
 
     async def start(self) -> None:
         """Start processing of the central unit."""
@@ -385,16 +439,16 @@ class CentralUnit(PayloadMixin):
             else self._config.callback_port or self._config.default_callback_port
         )
         try:
-            if (
-                xml_rpc_server := xmlrpc.create_xml_rpc_server(
-                    ip_addr=self._listen_ip_addr, port=listen_port
-                )
-                if self._config.enable_server
-                else None
-            ):
+            if xml_rpc_server := await self._create_xml_rpc_server(port=listen_port):
                 self._xml_rpc_server = xml_rpc_server
                 self._listen_port = xml_rpc_server.listen_port
                 self._xml_rpc_server.add_central(self)
+            if bin_rpc_server := await self._create_bin_rpc_server(
+                port=self._config.bin_rpc_listen_port or PORT_ANY
+            ):
+                self._bin_rpc_server = bin_rpc_server
+                self._bin_rpc_listen_port = bin_rpc_server.listen_port
+                self._bin_rpc_server.add_central(self)
         except OSError as oserr:
             raise HaHomematicException(
                 f"START: Failed to start central unit {self.name}: {reduce_args(args=oserr.args)}"
@@ -412,12 +466,40 @@ class CentralUnit(PayloadMixin):
 
         self._started = True
 
+    async def _create_xml_rpc_server(self, port: int) -> xmlrpc.RpcServer | None:
+        """Create the configured xml rpc server, that receives the callbacks of the backend."""
+        if not self._config.enable_server:
+            return None
+        if self._config.rpc_server_type == RpcServerType.ASYNC:
+            return await xmlrpc.create_async_xml_rpc_server(
+                ip_addr=self._listen_ip_addr, port=port
+            )
+        return xmlrpc.create_xml_rpc_server(ip_addr=self._listen_ip_addr, port=port)
+
+    async def _create_bin_rpc_server(self, port: int) -> binrpc.BinRpcServer | None:
+        """Create the bin rpc server, if an interface receives the callbacks via BIN-RPC."""
+        if not self._config.enable_server or not any(
+            interface_config.rpc_protocol == RpcProtocol.BIN_RPC
+            for interface_config in self._config.enabled_interface_configs
+        ):
+            return None
+        return await binrpc.create_bin_rpc_server(ip_addr=self._listen_ip_addr, port=port)
+
+    @property
+    def _rpc_servers(self) -> tuple[xmlrpc.RpcServer, ...]:
+        """Return the rpc servers, that receive the callbacks of the backend."""
+        return tuple(
+            rpc_server
+            for rpc_server in (self._xml_rpc_server, self._bin_rpc_server)
+            if rpc_server is not None
+        )
+
     async def stop(self) -> None:
         """Stop processing of the central unit."""
         if not self._started:
             _LOGGER.debug("STOP: Central %s not started", self.name)
             return
-        await self.save_caches(save_device_descriptions=True, save_paramset_descriptions=True)
+        await self.flush_caches()
         self._stop_connection_checker()
         await self._stop_clients()
         if self._json_rpc_client.is_activated:
@@ -428,13 +510,18 @@ class CentralUnit(PayloadMixin):
             self._xml_rpc_server.remove_central(central=self)
             # un-register and stop XmlRPC-Server, if possible
             if self._xml_rpc_server.no_central_assigned:
-                self._xml_rpc_server.stop()
+                await self._xml_rpc_server.stop()
             _LOGGER.debug("STOP: XmlRPC-Server stopped")
         else:
             _LOGGER.debug(
                 "STOP: shared XmlRPC-Server NOT stopped. "
                 "There is still another central instance registered"
             )
+        if self._bin_rpc_server:
+            self._bin_rpc_server.remove_central(central=self)
+            if self._bin_rpc_server.no_central_assigned:
+                await self._bin_rpc_server.stop()
+            _LOGGER.debug("STOP: BinRPC-Server stopped")
 
         _LOGGER.debug("STOP: Removing instance")
         if self.name in CENTRAL_INSTANCES:
@@ -455,21 +542,22 @@ class CentralUnit(PayloadMixin):
 
     async def refresh_firmware_data(self, device_address: str | None = None) -> None:
         """Refresh device firmware data."""
-        if (
-            device_address
-            and (device := self.get_device(address=device_address)) is not None
-            and device.is_updatable
-        ):
-            await self._refresh_device_descriptions(
-                client=device.client, device_address=device_address
-            )
-            device.refresh_firmware_data()
-        else:
-            for client in self._clients.values():
-                await self._refresh_device_descriptions(client=client)
-            for device in self._devices.values():
-                if device.is_updatable:
-                    device.refresh_firmware_data()
+        with background_requests():
+            if (
+                device_address
+                and (device := self.get_device(address=device_address)) is not None
+                and device.is_updatable
+            ):
+                await self._refresh_device_descriptions(
+                    client=device.client, device_address=device_address
+                )
+                device.refresh_firmware_data()
+            else:
+                for client in self._clients.values():
+                    await self._refresh_device_descriptions(client=client)
+                for device in self._devices.values():
+                    if device.is_updatable:
+                        device.refresh_firmware_data()
 
     async def refresh_firmware_data_by_state(
         self, device_firmware_states: tuple[DeviceFirmwareState, ...]
@@ -509,18 +597,28 @@ class CentralUnit(PayloadMixin):
     async def _start_clients(self) -> None:
         """Start clients ."""
         if await self._create_clients():
+            bootstrap_data = await self._fetch_bootstrap_data()
             await self._load_caches()
             if new_device_addresses := self._check_for_new_device_addresses():
                 await self._create_devices(new_device_addresses=new_device_addresses)
-            await self._init_hub()
+            await self._init_hub(bootstrap_data=bootstrap_data)
             await self._init_clients()
 
+    async def _fetch_bootstrap_data(self) -> BootstrapData | None:
+        """Fetch the data required on start in one request, and add it to the caches."""
+        if not self._config.bootstrap_enabled or not (client := self.primary_client):
+            return None
+        self._device_details.clear()
+        return await client.fetch_bootstrap_data()
+
     async def _stop_clients(self) -> None:
         """Stop clients."""
         await self._de_init_clients()
         for client in self._clients.values():
             _LOGGER.debug("STOP_CLIENTS: Stopping %s", client.interface_id)
             await client.stop()
+            for rpc_server in self._rpc_servers:
+                rpc_server.remove_interface_id(interface_id=client.interface_id)
         _LOGGER.debug("STOP_CLIENTS: Clearing existing clients.")
         self._clients.clear()
 
@@ -592,6 +690,8 @@ class CentralUnit(PayloadMixin):
                     self.name,
                 )
                 self._clients[client.interface_id] = client
+                for rpc_server in self._rpc_servers:
+                    rpc_server.add_interface_id(interface_id=client.interface_id, central=self)
         except BaseHomematicException as ex:
             self.fire_interface_event(
                 interface_id=interface_config.interface_id,
@@ -615,6 +715,8 @@ class CentralUnit(PayloadMixin):
                     self.name,
                 )
                 del self._clients[client.interface_id]
+                for rpc_server in self._rpc_servers:
+                    rpc_server.remove_interface_id(interface_id=client.interface_id)
                 continue
             if await client.proxy_init() == ProxyInitState.INIT_SUCCESS:
                 _LOGGER.debug(
@@ -627,10 +729,15 @@ class CentralUnit(PayloadMixin):
             if await client.proxy_de_init():
                 _LOGGER.debug("DE_INIT_CLIENTS: Proxy de-initialized: %s", name)
 
-    async def _init_hub(self) -> None:
+    async def _init_hub(self, bootstrap_data: BootstrapData | None = None) -> None:
         """Init the hub."""
-        await self._hub.fetch_program_data(scheduled=True)
-        await self._hub.fetch_sysvar_data(scheduled=True)
+        await self._hub.fetch_program_data(
+            scheduled=True, programs=bootstrap_data.programs if bootstrap_data else None
+        )
+        await self._hub.fetch_sysvar_data(
+            scheduled=True,
+            variables=bootstrap_data.system_variables if bootstrap_data else None,
+        )
 
     @loop_check
     def fire_interface_event(
@@ -914,7 +1021,7 @@ class CentralUnit(PayloadMixin):
         for address in addresses:
             if device := self._devices.get(address):
                 self.remove_device(device=device)
-        await self.save_caches()
+        await self.save_caches(save_device_descriptions=True, save_paramset_descriptions=True)
 
     @callback_backend_system(system_event=BackendSystemEvent.NEW_DEVICES)
     async def add_new_devices(
@@ -954,6 +1061,7 @@ class CentralUnit(PayloadMixin):
             client = self._clients[interface_id]
             save_paramset_descriptions = False
             save_device_descriptions = False
+            new_device_descriptions: list[DeviceDescription] = []
             for dev_desc in device_descriptions:
                 try:
                     self._device_descriptions.add_device_description(
@@ -961,8 +1069,21 @@ class CentralUnit(PayloadMixin):
                     )
                     save_device_descriptions = True
                     if dev_desc["ADDRESS"] not in known_addresses:
-                        await client.fetch_paramset_descriptions(device_description=dev_desc)
-                        save_paramset_descriptions = True
+                        new_device_descriptions.append(dev_desc)
+                except Exception as ex:  # pragma: no cover
+                    _LOGGER.error(
+                        "ADD_NEW_DEVICES failed: %s [%s]",
+                        type(ex).__name__,
+                        reduce_args(args=ex.args),
+                    )
+            if new_device_descriptions:
+                try:
+                    # fetch the paramset descriptions of all new devices in batches,
+                    # and clone them for devices of the same model
+                    await client.fetch_new_paramset_descriptions(
+                        device_descriptions=tuple(new_device_descriptions)
+                    )
+                    save_paramset_descriptions = True
                 except Exception as ex:  # pragma: no cover
                     _LOGGER.error(
                         "ADD_NEW_DEVICES failed: %s [%s]",
@@ -1033,6 +1154,53 @@ class CentralUnit(PayloadMixin):
             return
 
         self.set_last_event_dt(interface_id=interface_id)
+        await self._process_data_point_event(
+            interface_id=interface_id,
+            channel_address=channel_address,
+            parameter=parameter,
+            value=value,
+        )
+
+    async def data_point_events(
+        self, interface_id: str, events: tuple[tuple[str, str, Any], ...]
+    ) -> None:
+        """Handle a batch of events (channel_address, parameter, value) of an interface."""
+        _LOGGER.debug(
+            "EVENTS: interface_id = %s, count = %i",
+            interface_id,
+            len(events),
+        )
+        if not self.has_client(interface_id=interface_id):
+            return
+
+        self.set_last_event_dt(interface_id=interface_id)
+        for channel_address, parameter, value in events:
+            await self._process_data_point_event(
+                interface_id=interface_id,
+                channel_address=channel_address,
+                parameter=parameter,
+                value=value,
+            )
+
+        self._clients[interface_id].modified_at = datetime.now()
+        for channel_address, parameter, value in events:
+            self.fire_backend_parameter_callback(
+                interface_id=interface_id,
+                channel_address=channel_address,
+                parameter=parameter,
+                value=value,
+            )
+
+    def schedule_data_point_events(
+        self, interface_id: str, events: tuple[tuple[str, str, Any], ...]
+    ) -> None:
+        """Schedule the processing of events (channel_address, parameter, value) from any thread."""
+        self._event_queue.put_events(interface_id=interface_id, events=events)
+
+    async def _process_data_point_event(
+        self, interface_id: str, channel_address: str, parameter: str, value: Any
+    ) -> None:
+        """Update the subscribed data points of an event."""
         # No need to check the response of a XmlRPC-PING
         if parameter == Parameter.PONG:
             if "#" in value:
@@ -1047,6 +1215,14 @@ class CentralUnit(PayloadMixin):
                     )
             return
 
+        # The duty cycle level of the interface paces the commands
+        if (
+            parameter == Parameter.DUTY_CYCLE_LEVEL
+            and self.has_client(interface_id=interface_id)
+            and (rate_limiter := self.get_client(interface_id=interface_id).rate_limiter)
+        ):
+            rate_limiter.update_duty_cycle(value=value)
+
         data_point_key = get_data_point_key(
             interface_id=interface_id,
             channel_address=channel_address,
@@ -1145,6 +1321,8 @@ class CentralUnit(PayloadMixin):
             self._data_point_key_event_subscriptions[data_point.data_point_key].append(
                 data_point.event
             )
+            with self._event_subscription_lock:
+                self._event_subscription_keys.add(_get_event_subscription_key(data_point))
             if (
                 not data_point.channel.device.client.supports_xml_rpc
                 and data_point.state_path not in self._data_point_path_event_subscriptions
@@ -1185,9 +1363,30 @@ class CentralUnit(PayloadMixin):
         if isinstance(data_point, (GenericDataPoint, GenericEvent)) and data_point.supports_events:
             if data_point.data_point_key in self._data_point_key_event_subscriptions:
                 del self._data_point_key_event_subscriptions[data_point.data_point_key]
+            with self._event_subscription_lock:
+                self._event_subscription_keys.discard(_get_event_subscription_key(data_point))
             if data_point.state_path in self._data_point_path_event_subscriptions:
                 del self._data_point_path_event_subscriptions[data_point.state_path]
 
+    def accept_event(self, interface_id: str, channel_address: str, parameter: str) -> bool:
+        """
+        Return if an event should be processed.
+
+        Called by the xml rpc server before scheduling to drop events without subscription.
+        The events of the parameters requested by backend parameter callbacks are processed too.
+        """
+        if (
+            parameter in (Parameter.PONG, Parameter.DUTY_CYCLE_LEVEL)
+            or parameter in self._backend_callback_parameters
+            or (interface_id, channel_address, parameter) in self._event_subscription_keys
+        ):
+            return True
+        # the event still proves, that the callback is alive
+        self._last_events[interface_id] = datetime.now()
+        # not synchronized with the rpc server threads, so the count is approximate
+        self._dropped_event_count += 1
+        return False
+
     def get_last_event_dt(self, interface_id: str) -> datetime | None:
         """Return the last event dt."""
         return self._last_events.get(interface_id)
@@ -1438,17 +1637,33 @@ class CentralUnit(PayloadMixin):
                     reduce_args(args=ex.args),
                 )
 
-    def register_backend_parameter_callback(self, cb: Callable) -> CALLBACK_TYPE:
-        """Register backend_parameter callback in central."""
+    def register_backend_parameter_callback(
+        self, cb: Callable, parameters: tuple[str, ...] = ()
+    ) -> CALLBACK_TYPE:
+        """
+        Register backend_parameter callback in central.
+
+        The callback receives the events of subscribed data points,
+        and the events of the given parameters of all channels.
+        """
         if callable(cb) and cb not in self._backend_parameter_callbacks:
-            self._backend_parameter_callbacks.add(cb)
+            self._backend_parameter_callbacks[cb] = frozenset(parameters)
+            self._update_backend_callback_parameters()
             return partial(self._unregister_backend_parameter_callback, cb=cb)
         return None
 
     def _unregister_backend_parameter_callback(self, cb: Callable) -> None:
         """Un register backend_parameter callback in central."""
         if cb in self._backend_parameter_callbacks:
-            self._backend_parameter_callbacks.remove(cb)
+            del self._backend_parameter_callbacks[cb]
+            self._update_backend_callback_parameters()
+
+    def _update_backend_callback_parameters(self) -> None:
+        """Update the parameters, that are requested by the backend parameter callbacks."""
+        # replaced as a whole, so the rpc server threads always read a complete set
+        self._backend_callback_parameters = frozenset().union(
+            *self._backend_parameter_callbacks.values()
+        )
 
     @loop_check
     def fire_backend_parameter_callback(
@@ -1582,8 +1797,7 @@ class _Scheduler(threading.Thread):
                 )
                 await self._central.restart_clients()
             else:
-                reconnects: list[Any] = []
-                reloads: list[Any] = []
+                reconnect_clients: list[hmcl.Client] = []
                 for interface_id in self._central.interface_ids:
                     # check:
                     #  - client is available
@@ -1595,16 +1809,24 @@ class _Scheduler(threading.Thread):
                         or not await client.is_connected()
                         or not client.is_callback_alive()
                     ):
-                        reconnects.append(client.reconnect())
-                        reloads.append(
-                            self._central.load_and_refresh_data_point_data(
-                                interface=client.interface
+                        reconnect_clients.append(client)
+                if reconnect_clients:
+                    # the circuit breakers of the clients stagger the reconnects
+                    results = await asyncio.gather(
+                        *(client.reconnect() for client in reconnect_clients)
+                    )
+                    if self._central.available:
+                        await asyncio.gather(
+                            *(
+                                self._central.load_and_refresh_data_point_data(
+                                    interface=client.interface
+                                )
+                                for client, reconnected in zip(
+                                    reconnect_clients, results, strict=True
+                                )
+                                if reconnected
                             )
                         )
-                if reconnects:
-                    await asyncio.gather(*reconnects)
-                    if self._central.available:
-                        await asyncio.gather(*reloads)
         except NoConnectionException as nex:
             _LOGGER.error("CHECK_CONNECTION failed: no connection: %s", reduce_args(args=nex.args))
         except Exception as ex:
@@ -1620,9 +1842,10 @@ class _Scheduler(threading.Thread):
         if not self._central.available:
             return
         _LOGGER.debug("REFRESH_CLIENT_DATA: Checking connection to server %s", self._central.name)
-        for client in poll_clients:
-            await self._central.load_and_refresh_data_point_data(interface=client.interface)
-            self._central.set_last_event_dt(interface_id=client.interface_id)
+        with background_requests():
+            for client in poll_clients:
+                await self._central.load_and_refresh_data_point_data(interface=client.interface)
+                self._central.set_last_event_dt(interface_id=client.interface_id)
 
     @service(re_raise=False)
     async def _refresh_sysvar_data(self) -> None:
@@ -1630,7 +1853,8 @@ class _Scheduler(threading.Thread):
         if not self._central.available:
             return
         _LOGGER.debug("REFRESH_SYSVAR_DATA: For %s", self._central.name)
-        await self._central.fetch_sysvar_data(scheduled=True)
+        with background_requests():
+            await self._central.fetch_sysvar_data(scheduled=True)
 
     @service(re_raise=False)
     async def _refresh_program_data(self) -> None:
@@ -1638,7 +1862,8 @@ class _Scheduler(threading.Thread):
         if not self._central.available:
             return
         _LOGGER.debug("REFRESH_PROGRAM_DATA: For %s", self._central.name)
-        await self._central.fetch_program_data(scheduled=True)
+        with background_requests():
+            await self._central.fetch_program_data(scheduled=True)
 
 
 class CentralConfig:
@@ -1655,8 +1880,15 @@ class CentralConfig:
         password: str,
         storage_folder: str,
         username: str,
+        bin_rpc_listen_port: int | None = None,
+        bootstrap_enabled: bool = DEFAULT_BOOTSTRAP_ENABLED,
         callback_host: str | None = None,
         callback_port: int | None = None,
+        command_burst_size: int = DEFAULT_COMMAND_BURST_SIZE,
+        command_rate_limit: float = DEFAULT_COMMAND_RATE_LIMIT,
+        event_coalescing: bool = DEFAULT_EVENT_COALESCING,
+        event_queue_overflow_policy: EventQueueOverflowPolicy = DEFAULT_EVENT_QUEUE_OVERFLOW_POLICY,
+        event_queue_size: int = DEFAULT_EVENT_QUEUE_SIZE,
         include_internal_programs: bool = DEFAULT_INCLUDE_INTERNAL_PROGRAMS,
         include_internal_sysvars: bool = DEFAULT_INCLUDE_INTERNAL_SYSVARS,
         interfaces_requiring_periodic_refresh: tuple[
@@ -1665,25 +1897,38 @@ class CentralConfig:
         json_port: int | None = None,
         listen_ip_addr: str | None = None,
         listen_port: int | None = None,
+        max_background_reads: int = DEFAULT_MAX_BACKGROUND_READS,
+        max_json_rpc_concurrency: int = DEFAULT_MAX_JSON_RPC_CONCURRENCY,
         max_read_workers: int = DEFAULT_MAX_READ_WORKERS,
+        multicall_batch_size: int = DEFAULT_MULTICALL_BATCH_SIZE,
         periodic_refresh_interval: int = DEFAULT_PERIODIC_REFRESH_INTERVAL,
         program_scan_enabled: bool = DEFAULT_PROGRAM_SCAN_ENABLED,
+        rpc_server_type: RpcServerType = DEFAULT_RPC_SERVER_TYPE,
         start_direct: bool = False,
         sys_scan_interval: int = DEFAULT_SYS_SCAN_INTERVAL,
         sysvar_scan_enabled: bool = DEFAULT_SYSVAR_SCAN_ENABLED,
         tls: bool = DEFAULT_TLS,
         un_ignore_list: tuple[str, ...] = DEFAULT_UN_IGNORES,
         verify_tls: bool = DEFAULT_VERIFY_TLS,
+        xml_rpc_decoder_type: XmlRpcDecoderType = DEFAULT_XML_RPC_DECODER_TYPE,
+        xml_rpc_proxy_type: XmlRpcProxyType = DEFAULT_XML_RPC_PROXY_TYPE,
     ) -> None:
         """Init the client config."""
         self._interface_configs: Final = interface_configs
         self._json_rpc_client: JsonRpcAioHttpClient | None = None
+        self.bin_rpc_listen_port: Final = bin_rpc_listen_port
+        self.bootstrap_enabled: Final = bootstrap_enabled
         self.callback_host: Final = callback_host
         self.callback_port: Final = callback_port
+        self.command_burst_size: Final = command_burst_size
+        self.command_rate_limit: Final = command_rate_limit
         self.central_id: Final = central_id
         self.client_session: Final = client_session
         self.connection_state: Final = CentralConnectionState()
         self.default_callback_port: Final = default_callback_port
+        self.event_coalescing: Final = event_coalescing
+        self.event_queue_overflow_policy: Final = event_queue_overflow_policy
+        self.event_queue_size: Final = event_queue_size
         self.host: Final = host
         self.include_internal_programs: Final = include_internal_programs
         self.include_internal_sysvars: Final = include_internal_sysvars
@@ -1691,11 +1936,15 @@ class CentralConfig:
         self.json_port: Final = json_port
         self.listen_ip_addr: Final = listen_ip_addr
         self.listen_port: Final = listen_port
+        self.max_background_reads: Final = max_background_reads
+        self.max_json_rpc_concurrency: Final = max_json_rpc_concurrency
         self.max_read_workers = max_read_workers
+        self.multicall_batch_size: Final = multicall_batch_size
         self.name: Final = name
         self.password: Final = password
         self.periodic_refresh_interval = periodic_refresh_interval
         self.program_scan_enabled: Final = program_scan_enabled
+        self.rpc_server_type: Final = rpc_server_type
         self.start_direct: Final = start_direct
         self.storage_folder: Final = storage_folder
         self.sys_scan_interval: Final = sys_scan_interval
@@ -1704,6 +1953,8 @@ class CentralConfig:
         self.un_ignore_list: Final = un_ignore_list
         self.username: Final = username
         self.verify_tls: Final = verify_tls
+        self.xml_rpc_decoder_type: Final = xml_rpc_decoder_type
+        self.xml_rpc_proxy_type: Final = xml_rpc_proxy_type
 
     @property
     def central_url(self) -> str:
@@ -1748,6 +1999,7 @@ class CentralConfig:
                 client_session=self.client_session,
                 tls=self.tls,
                 verify_tls=self.verify_tls,
+                max_concurrency=self.max_json_rpc_concurrency,
             )
         return self._json_rpc_client
 
@@ -1792,7 +2044,7 @@ class CentralConnectionState:
             self._json_issues.append(iid)
             _LOGGER.debug("add_issue: add issue  [%s] for JsonRpcAioHttpClient", iid)
             return True
-        if isinstance(issuer, XmlRpcProxy) and iid not in self._xml_proxy_issues:
+        if isinstance(issuer, BaseXmlRpcProxy) and iid not in self._xml_proxy_issues:
             self._xml_proxy_issues.append(iid)
             _LOGGER.debug("add_issue: add issue [%s] for %s", iid, issuer.interface_id)
             return True
@@ -1804,7 +2056,7 @@ class CentralConnectionState:
             self._json_issues.remove(iid)
             _LOGGER.debug("remove_issue: removing issue [%s] for JsonRpcAioHttpClient", iid)
             return True
-        if isinstance(issuer, XmlRpcProxy) and issuer.interface_id in self._xml_proxy_issues:
+        if isinstance(issuer, BaseXmlRpcProxy) and issuer.interface_id in self._xml_proxy_issues:
             self._xml_proxy_issues.remove(iid)
             _LOGGER.debug("remove_issue: removing issue [%s] for %s", iid, issuer.interface_id)
             return True
@@ -1814,7 +2066,7 @@ class CentralConnectionState:
         """Add issue to collection."""
         if isinstance(issuer, JsonRpcAioHttpClient):
             return iid in self._json_issues
-        if isinstance(issuer, XmlRpcProxy):
+        if isinstance(issuer, BaseXmlRpcProxy):
             return iid in self._xml_proxy_issues
 
     def handle_exception_log(
@@ -1883,3 +2135,9 @@ def _get_new_channel_events(new_devices: set[Device]) -> tuple[tuple[GenericEven
                 channel_events.append(hm_channel_events)  # type: ignore[arg-type] # noqa:PERF401
 
     return tuple(channel_events)
+
+
+def _get_event_subscription_key(data_point: BaseParameterDataPoint) -> tuple[str, str, str]:
+    """Return the key (interface_id, channel_address, parameter) of an event subscription."""
+    interface_id, channel_address, _, parameter = data_point.data_point_key
+    return interface_id, channel_address, parameter
@@ -0,0 +1,135 @@
+"""
+BIN-RPC server module.
+
+Provides the BIN-RPC server which handles the callbacks of backends,
+that are initialized with a xmlrpc_bin:// url.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Final
+import xmlrpc.client
+
+from hahomematic.central.xml_rpc_server import HaHomematicXMLRPCDispatcher, RpcServer
+from hahomematic.client.bin_rpc import (
+    MESSAGE_REQUEST,
+    decode_request,
+    encode_fault,
+    encode_response,
+    read_message,
+)
+from hahomematic.const import IP_ANY_V4, PORT_ANY
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+
+class BinRpcServer(RpcServer):
+    """
+    BIN-RPC server running on the event loop to handle messages from CCU / Homegear.
+
+    The requests are dispatched to the same RPCFunctions as the XML-RPC requests.
+    """
+
+    _instances: dict[tuple[str, int], RpcServer] = {}
+
+    def __init__(
+        self,
+        ip_addr: str,
+        port: int,
+    ) -> None:
+        """Init BinRPC server."""
+        if self._initialized:
+            return
+        super().__init__(ip_addr=ip_addr, port=port)
+        self._dispatcher: Final = HaHomematicXMLRPCDispatcher(allow_none=True)
+        self._dispatcher.register_introspection_functions()
+        self._dispatcher.register_multicall_functions()
+        self._dispatcher.register_instance(self._rpc_functions, allow_dotted_names=True)
+        self._server: asyncio.Server | None = None
+        self._writers: Final[set[asyncio.StreamWriter]] = set()
+
+    async def start(self) -> None:
+        """Start the BinRPC-Server."""
+        if self._server is not None:
+            return
+        _LOGGER.debug(
+            "START: Starting BinRPC-Server listening on xmlrpc_bin://%s:%i",
+            self._listen_ip_addr,
+            self._listen_port,
+        )
+        self._server = await asyncio.start_server(
+            self._handle_connection,
+            host=self._listen_ip_addr,
+            port=self._listen_port,
+            reuse_address=True,
+        )
+
+    async def stop(self) -> None:
+        """Stop the BinRPC-Server."""
+        _LOGGER.debug("STOP: Stopping BinRPC-Server")
+        if (server := self._server) is not None:
+            self._server = None
+            server.close()
+            # the kept open connections of the backend are not closed by the server
+            for writer in tuple(self._writers):
+                writer.close()
+            await server.wait_closed()
+        _LOGGER.debug("STOP: BinRPC-Server stopped")
+        self._remove_instance()
+
+    @property
+    def started(self) -> bool:
+        """Return if the server is started."""
+        return self._server is not None
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Handle the requests of a connection, until it is closed by the backend."""
+        self._writers.add(writer)
+        try:
+            while True:
+                try:
+                    message_type, _, data = await read_message(reader=reader)
+                except asyncio.IncompleteReadError:
+                    break
+                writer.write(self._handle_request(message_type=message_type, data=data))
+                await writer.drain()
+        except (OSError, xmlrpc.client.ResponseError) as err:
+            _LOGGER.debug("HANDLE_CONNECTION: Closing connection: %s", err)
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    def _handle_request(self, message_type: int, data: bytes) -> bytes:
+        """Handle a BIN-RPC request, and return the encoded response."""
+        try:
+            if message_type != MESSAGE_REQUEST:
+                raise xmlrpc.client.ResponseError(
+                    f"BIN-RPC: Unexpected message type {message_type:#x}"
+                )
+            method, params = decode_request(data=data)
+            result: Any = self._dispatcher._dispatch(  # pylint: disable=protected-access
+                method, params
+            )
+            return encode_response(value=result)
+        except xmlrpc.client.Fault as fault:
+            return encode_fault(fault_code=fault.faultCode, fault_string=fault.faultString)
+        except Exception as ex:
+            _LOGGER.debug("HANDLE_REQUEST: Failed to handle request: %s", ex)
+            return encode_fault(fault_code=1, fault_string=f"{type(ex).__name__}:{ex}")
+
+
+async def create_bin_rpc_server(ip_addr: str = IP_ANY_V4, port: int = PORT_ANY) -> BinRpcServer:
+    """Register the bin rpc server."""
+    bin_rpc = BinRpcServer(ip_addr=ip_addr, port=port)
+    if not bin_rpc.started:
+        await bin_rpc.start()
+        _LOGGER.debug(
+            "CREATE_BIN_RPC_SERVER: Starting BinRPC-Server listening on %s:%i",
+            bin_rpc.listen_ip_addr,
+            bin_rpc.listen_port,
+        )
+    return bin_rpc
@@ -0,0 +1,422 @@
+"""
+Event queue module.
+
+Buffers the events received by the rpc server until the central
+processes them on its event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable, Hashable
+import itertools
+import logging
+import threading
+import time
+from typing import Any, Final
+
+from hahomematic import central as hmcu
+from hahomematic.const import (
+    BULK_EVENT_PARAMETERS,
+    CLICK_EVENTS,
+    CONNECTIVITY_EVENT_PARAMETERS,
+    IMPULSE_EVENTS,
+    EventPriority,
+    EventQueueOverflowPolicy,
+    Parameter,
+)
+from hahomematic.support import get_device_address, reduce_args
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+_MAX_BATCH_SIZE: Final = 100
+_MAX_DISPATCHED_DEVICE_EVENTS: Final = 100
+_MAX_DISPATCHED_EVENTS: Final = 1000
+
+_BULK_PARAMETERS: Final[frozenset[str]] = frozenset(BULK_EVENT_PARAMETERS)
+_CONNECTIVITY_PARAMETERS: Final[frozenset[str]] = frozenset(CONNECTIVITY_EVENT_PARAMETERS)
+# Events of these parameters must be processed one by one.
+_NOT_COALESCIBLE_PARAMETERS: Final[frozenset[str]] = frozenset(
+    (Parameter.CONFIG_PENDING, *CLICK_EVENTS, *CONNECTIVITY_EVENT_PARAMETERS, *IMPULSE_EVENTS)
+)
+
+type _EVENT = tuple[str, str, str, Any]
+# (interface_id, device_address)
+type _DEVICE_KEY = tuple[str, str]
+# (interface_id, channel_address, parameter, value, enqueued_at)
+type _QUEUED_EVENT = tuple[str, str, str, Any, float]
+
+
+class EventQueue:
+    """
+    Bounded queue for events, that are handed over from the rpc server to the central.
+
+    Events can be added from any thread. They are taken in batches on the
+    event loop of the central, and handed over to the EventDispatcher.
+    The priority of the pending events decides, which device is served first,
+    while the events of a device are taken in the order of their arrival. If the queue is full,
+    events are dropped according to the overflow policy. If coalescing is
+    enabled, pending events for the same data point are merged, so only the
+    latest value is processed.
+    """
+
+    def __init__(
+        self,
+        central: hmcu.CentralUnit,
+        coalesce: bool,
+        max_size: int,
+        overflow_policy: EventQueueOverflowPolicy,
+    ) -> None:
+        """Init the event queue."""
+        self._central: Final = central
+        self._coalesce: Final = coalesce
+        self._max_size: Final = max_size
+        self._overflow_policy: Final = overflow_policy
+        self._lock: Final = threading.Lock()
+        self._pending: Final[dict[EventPriority, dict[Hashable, _QUEUED_EVENT]]] = {
+            priority: {} for priority in EventPriority
+        }
+        # {device_key, {(priority, key)}} in the order of arrival
+        self._device_events: Final[
+            dict[_DEVICE_KEY, dict[tuple[EventPriority, Hashable], None]]
+        ] = {}
+        self._size: int = 0
+        self._sequence: Final = itertools.count()
+        self._processing: bool = False
+        self._dropped_counts: Final[dict[EventPriority, int]] = {
+            priority: 0 for priority in EventPriority
+        }
+        self._merged_count: int = 0
+        self._last_wait_time: float = 0.0
+        self._max_wait_time: float = 0.0
+        self._wait_times: list[float] | None = None
+        self._dispatcher: Final = EventDispatcher(
+            central=central,
+            max_pending=_MAX_DISPATCHED_EVENTS,
+            max_device_pending=_MAX_DISPATCHED_DEVICE_EVENTS,
+            device_ready_callback=self._start_processing,
+        )
+
+    @property
+    def depth(self) -> int:
+        """Return the number of pending events."""
+        return self._size
+
+    @property
+    def dispatcher(self) -> EventDispatcher:
+        """Return the event dispatcher."""
+        return self._dispatcher
+
+    @property
+    def dropped_count(self) -> int:
+        """Return the number of events, that have been dropped because of a full queue."""
+        return sum(self._dropped_counts.values())
+
+    @property
+    def last_wait_time(self) -> float:
+        """Return the time in seconds, the last processed event has been waiting in the queue."""
+        return self._last_wait_time
+
+    @property
+    def max_size(self) -> int:
+        """Return the max number of pending events."""
+        return self._max_size
+
+    @property
+    def max_wait_time(self) -> float:
+        """Return the max time in seconds, an event has been waiting in the queue."""
+        return self._max_wait_time
+
+    @property
+    def merged_count(self) -> int:
+        """Return the number of events, that have been merged into a newer event."""
+        return self._merged_count
+
+    def start_wait_time_recording(self) -> None:
+        """Start to record the wait time of every event taken from the queue, e.g. for a benchmark."""
+        with self._lock:
+            self._wait_times = []
+
+    def stop_wait_time_recording(self) -> tuple[float, ...]:
+        """Stop the recording and return the recorded wait times in seconds."""
+        with self._lock:
+            wait_times = self._wait_times or []
+            self._wait_times = None
+        return tuple(wait_times)
+
+    def get_depth(self, priority: EventPriority) -> int:
+        """Return the number of pending events by priority."""
+        return len(self._pending[priority])
+
+    def get_dropped_count(self, priority: EventPriority) -> int:
+        """Return the number of dropped events by priority."""
+        return self._dropped_counts[priority]
+
+    def put(self, interface_id: str, channel_address: str, parameter: str, value: Any) -> None:
+        """Add an event to the queue."""
+        self.put_events(interface_id=interface_id, events=((channel_address, parameter, value),))
+
+    def put_events(self, interface_id: str, events: tuple[tuple[str, str, Any], ...]) -> None:
+        """Add events (channel_address, parameter, value) of an interface to the queue."""
+        enqueued_at = time.monotonic()
+        with self._lock:
+            for channel_address, parameter, value in events:
+                priority = _get_priority(parameter=parameter)
+                queue = self._pending[priority]
+                key: Hashable
+                if self._coalesce and parameter not in _NOT_COALESCIBLE_PARAMETERS:
+                    key = (interface_id, channel_address, parameter)
+                    if (queued_event := queue.get(key)) is not None:
+                        # keep the position and the age of the pending event
+                        queue[key] = (
+                            interface_id,
+                            channel_address,
+                            parameter,
+                            value,
+                            queued_event[4],
+                        )
+                        self._merged_count += 1
+                        continue
+                else:
+                    key = next(self._sequence)
+                if self._size >= self._max_size and not self._drop_event(priority=priority):
+                    self._dropped_counts[priority] += 1
+                    _LOGGER.debug(
+                        "PUT_EVENTS: Event queue full. Dropped event for %s, %s, %s",
+                        interface_id,
+                        channel_address,
+                        parameter,
+                    )
+                    continue
+                queue[key] = (interface_id, channel_address, parameter, value, enqueued_at)
+                self._device_events.setdefault(
+                    (interface_id, get_device_address(channel_address)), {}
+                )[(priority, key)] = None
+                self._size += 1
+        self._start_processing()
+
+    def _start_processing(self) -> None:
+        """Start the process task, if events are pending and no process task is running."""
+        with self._lock:
+            if self._processing or self._size == 0:
+                return
+            self._processing = True
+        self._central.looper.create_task(self._process(), name="event-queue")
+
+    def _drop_event(self, priority: EventPriority) -> bool:
+        """Drop the oldest pending event with the lowest priority, that is not above the given one."""
+        if self._overflow_policy == EventQueueOverflowPolicy.DROP_NEWEST:
+            return False
+        for drop_priority in reversed(EventPriority):
+            if drop_priority < priority:
+                return False
+            if queue := self._pending[drop_priority]:
+                self._pop(priority=drop_priority, key=next(iter(queue)))
+                self._dropped_counts[drop_priority] += 1
+                return True
+        return False
+
+    def _pop(self, priority: EventPriority, key: Hashable) -> _QUEUED_EVENT:
+        """Remove a pending event from the queue. Needs the lock."""
+        queued_event = self._pending[priority].pop(key)
+        device_key = (queued_event[0], get_device_address(queued_event[1]))
+        device_events = self._device_events[device_key]
+        del device_events[(priority, key)]
+        if not device_events:
+            del self._device_events[device_key]
+        self._size -= 1
+        return queued_event
+
+    def _take(self) -> tuple[_EVENT, ...]:
+        """
+        Take the next batch of pending events.
+
+        The devices are selected by the priority of their pending events. For every
+        selected device all events up to its last event of this priority are taken,
+        so the events of a device keep their order of arrival. The events of a device,
+        that has reached its limit of dispatched events, stay in the queue.
+        """
+        now = time.monotonic()
+        events: list[_EVENT] = []
+        with self._lock:
+            for priority, queue in self._pending.items():
+                # collect the devices before the events are removed from the queue
+                device_keys: dict[_DEVICE_KEY, None] = {}
+                for interface_id, channel_address, *_ in queue.values():
+                    if len(device_keys) >= _MAX_BATCH_SIZE - len(events):
+                        break
+                    device_key = (interface_id, get_device_address(channel_address))
+                    if self._dispatcher.get_device_capacity(key=device_key) > 0:
+                        device_keys[device_key] = None
+                for device_key in device_keys:
+                    if len(events) >= _MAX_BATCH_SIZE:
+                        break
+                    self._take_device_events(
+                        device_key=device_key, priority=priority, events=events, now=now
+                    )
+            if not events:
+                self._processing = False
+        return tuple(events)
+
+    def _take_device_events(
+        self, device_key: _DEVICE_KEY, priority: EventPriority, events: list[_EVENT], now: float
+    ) -> None:
+        """Take the events of a device up to its last event of the priority. Needs the lock."""
+        device_events = self._device_events[device_key]
+        count = 0
+        for index, (event_priority, _) in enumerate(device_events, start=1):
+            if event_priority <= priority:
+                count = index
+        count = min(
+            count,
+            _MAX_BATCH_SIZE - len(events),
+            self._dispatcher.get_device_capacity(key=device_key),
+        )
+        for event_priority, key in tuple(itertools.islice(device_events, count)):
+            interface_id, channel_address, parameter, value, enqueued_at = self._pop(
+                priority=event_priority, key=key
+            )
+            events.append((interface_id, channel_address, parameter, value))
+            self._last_wait_time = now - enqueued_at
+            self._max_wait_time = max(self._max_wait_time, self._last_wait_time)
+            if self._wait_times is not None:
+                self._wait_times.append(self._last_wait_time)
+
+    async def _process(self) -> None:
+        """Process the pending events, until the queue is empty."""
+        completed = False
+        try:
+            while events := self._take():
+                self._dispatcher.dispatch(events=events)
+                # keep the events in the bounded queue, while the devices are busy
+                await self._dispatcher.wait_for_capacity()
+                # give the rpc server the chance to add new events with a higher priority
+                await asyncio.sleep(0)
+            completed = True
+        finally:
+            if not completed:
+                self._restart_processing()
+
+    def _restart_processing(self) -> None:
+        """Restart the processing of the pending events after an aborted process task."""
+        with self._lock:
+            self._processing = False
+        self._start_processing()
+
+
+class EventDispatcher:
+    """
+    Dispatcher for the events of the event queue.
+
+    Events of a device are processed strictly in FIFO order,
+    while events of different devices are processed concurrently.
+    The number of pending events is limited in total and per device.
+    """
+
+    def __init__(
+        self,
+        central: hmcu.CentralUnit,
+        max_pending: int,
+        max_device_pending: int,
+        device_ready_callback: Callable[[], None] | None = None,
+    ) -> None:
+        """Init the event dispatcher."""
+        self._central: Final = central
+        self._max_pending: Final = max_pending
+        self._max_device_pending: Final = max_device_pending
+        # called, when a device at its limit accepts events again
+        self._device_ready_callback: Final = device_ready_callback
+        # {(interface_id, device_address), events}
+        self._device_queues: Final[dict[_DEVICE_KEY, deque[_EVENT]]] = {}
+        # {(interface_id, device_address), number of pending events}
+        self._device_pending: Final[dict[_DEVICE_KEY, int]] = {}
+        self._pending: int = 0
+        self._capacity: Final = asyncio.Event()
+        self._capacity.set()
+
+    @property
+    def active_devices(self) -> int:
+        """Return the number of devices with events in process."""
+        return len(self._device_queues)
+
+    @property
+    def pending(self) -> int:
+        """Return the number of dispatched events, that are not processed yet."""
+        return self._pending
+
+    def get_device_capacity(self, key: _DEVICE_KEY) -> int:
+        """Return the number of events, that can be dispatched to a device."""
+        return max(self._max_device_pending - self._device_pending.get(key, 0), 0)
+
+    def dispatch(self, events: tuple[_EVENT, ...]) -> None:
+        """Dispatch events to the queues of their devices. Must be run in the event loop."""
+        for event in events:
+            key = (event[0], get_device_address(event[1]))
+            self._device_pending[key] = self._device_pending.get(key, 0) + 1
+            if (queue := self._device_queues.get(key)) is None:
+                queue = deque()
+                self._device_queues[key] = queue
+                self._central.looper.create_task(
+                    self._process_device_events(key=key, queue=queue),
+                    name=f"device-events-{key[1]}",
+                )
+            queue.append(event)
+        self._pending += len(events)
+        if self._pending >= self._max_pending:
+            self._capacity.clear()
+
+    async def wait_for_capacity(self) -> None:
+        """Wait until the number of pending events is below the limit."""
+        await self._capacity.wait()
+
+    async def _process_device_events(self, key: _DEVICE_KEY, queue: deque[_EVENT]) -> None:
+        """Process the events of a device in FIFO order, until its queue is empty."""
+        interface_id = key[0]
+        try:
+            while queue:
+                events = tuple(queue)
+                queue.clear()
+                try:
+                    await self._central.data_point_events(
+                        interface_id=interface_id,
+                        events=tuple((e[1], e[2], e[3]) for e in events),
+                    )
+                except Exception as ex:  # pragma: no cover
+                    _LOGGER.warning(
+                        "EVENT_DISPATCHER failed: Unable to process events for %s, %s: %s",
+                        interface_id,
+                        key[1],
+                        reduce_args(args=ex.args),
+                    )
+                finally:
+                    self._release(key=key, count=len(events))
+        finally:
+            del self._device_queues[key]
+            # the events of a cancelled task are not processed anymore
+            self._release(key=key, count=len(queue))
+            queue.clear()
+
+    def _release(self, key: _DEVICE_KEY, count: int) -> None:
+        """Release the capacity of processed events."""
+        if count == 0:
+            return
+        self._pending -= count
+        if self._pending < self._max_pending:
+            self._capacity.set()
+        if (device_pending := self._device_pending.pop(key) - count) > 0:
+            self._device_pending[key] = device_pending
+        if (
+            device_pending < self._max_device_pending <= device_pending + count
+            and self._device_ready_callback is not None
+        ):
+            self._device_ready_callback()
+
+
+def _get_priority(parameter: str) -> EventPriority:
+    """Return the priority of an event."""
+    if parameter in _CONNECTIVITY_PARAMETERS:
+        return EventPriority.CONNECTIVITY
+    if parameter in _BULK_PARAMETERS:
+        return EventPriority.BULK
+    return EventPriority.USER_VISIBLE
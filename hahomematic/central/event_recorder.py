@@ -0,0 +1,185 @@
+"""
+Event recorder module.
+
+Records the callbacks received by the rpc server to an append-only binary file.
+
+File layout: A header (magic) followed by records. Each record consists of
+a monotonic timestamp (double), the record type (byte), the payload length
+(uint32) and the payload with the json encoded arguments of the call.
+Every recording session starts with a session record, because the monotonic
+timestamps of different sessions are not related. Values, that have no json
+representation (DateTime, Binary, bytes, datetime), are encoded as tagged objects.
+"""
+
+from __future__ import annotations
+
+import base64
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+import os
+import struct
+import threading
+import time
+from typing import Any, BinaryIO, Final
+import xmlrpc.client
+
+import orjson
+
+from hahomematic.const import RecordType
+from hahomematic.exceptions import HaHomematicException
+from hahomematic.support import check_or_create_directory, reduce_args
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+_MAGIC: Final = b"HMREC\x01"
+_RECORD_HEADER: Final = struct.Struct("<dBI")
+_TAG_TYPE: Final = "__hm_type__"
+_TAG_VALUE: Final = "__hm_value__"
+_TYPE_BINARY: Final = "binary"
+_TYPE_BYTES: Final = "bytes"
+_TYPE_DATETIME: Final = "datetime"
+_TYPE_XMLRPC_DATETIME: Final = "xmlrpc_datetime"
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class Record:
+    """Dataclass for a recorded call."""
+
+    timestamp: float
+    record_type: RecordType
+    args: tuple[Any, ...]
+
+
+class EventRecorder:
+    """Recorder for the calls of the backend to the rpc server."""
+
+    def __init__(self, file_path: str) -> None:
+        """Init the event recorder."""
+        self._file_path: Final = file_path
+        self._lock: Final = threading.Lock()
+        self._file: BinaryIO | None = None
+        self._record_count: int = 0
+
+    @property
+    def file_path(self) -> str:
+        """Return the path of the recording file."""
+        return self._file_path
+
+    @property
+    def is_recording(self) -> bool:
+        """Return if the recorder is open for recording."""
+        return self._file is not None
+
+    @property
+    def record_count(self) -> int:
+        """Return the number of records written by this recorder."""
+        return self._record_count
+
+    def open(self) -> None:
+        """Open the recording file for appending, and start a new session."""
+        with self._lock:
+            if self._file is not None:
+                return
+            check_or_create_directory(os.path.dirname(self._file_path))
+            try:
+                self._file = open(self._file_path, "ab")  # noqa: SIM115 # pylint: disable=consider-using-with
+                if self._file.tell() == 0:
+                    self._file.write(_MAGIC)
+                self._write(
+                    timestamp=time.monotonic(),
+                    record_type=RecordType.SESSION,
+                    payload=orjson.dumps((datetime.now().isoformat(),)),
+                )
+            except OSError as oserr:
+                raise HaHomematicException(
+                    f"OPEN failed: Unable to open recording file {self._file_path}: {reduce_args(args=oserr.args)}"
+                ) from oserr
+
+    def close(self) -> None:
+        """Close the recording file."""
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.close()
+            self._file = None
+
+    def record(self, record_type: RecordType, args: tuple[Any, ...]) -> None:
+        """Append a call to the recording file."""
+        if not self.is_recording:
+            return
+        timestamp = time.monotonic()
+        try:
+            payload = orjson.dumps(
+                args, default=_encode_value, option=orjson.OPT_PASSTHROUGH_DATETIME
+            )
+        except TypeError as terr:
+            _LOGGER.debug(
+                "RECORD failed: Unable to encode %s: %s",
+                record_type.name,
+                reduce_args(args=terr.args),
+            )
+            return
+        with self._lock:
+            if self._file is None:
+                return
+            self._write(timestamp=timestamp, record_type=record_type, payload=payload)
+            self._record_count += 1
+
+    def _write(self, timestamp: float, record_type: RecordType, payload: bytes) -> None:
+        """Write a record. Must be called with the lock."""
+        if self._file is not None:
+            self._file.write(_RECORD_HEADER.pack(timestamp, record_type, len(payload)) + payload)
+
+
+def _encode_value(value: Any) -> Any:
+    """Return the tagged json representation of a value, that has no json representation."""
+    if isinstance(value, xmlrpc.client.DateTime):
+        return {_TAG_TYPE: _TYPE_XMLRPC_DATETIME, _TAG_VALUE: value.value}
+    if isinstance(value, xmlrpc.client.Binary):
+        return {_TAG_TYPE: _TYPE_BINARY, _TAG_VALUE: base64.b64encode(value.data).decode()}
+    if isinstance(value, bytes | bytearray):
+        return {_TAG_TYPE: _TYPE_BYTES, _TAG_VALUE: base64.b64encode(value).decode()}
+    if isinstance(value, datetime):
+        return {_TAG_TYPE: _TYPE_DATETIME, _TAG_VALUE: value.isoformat()}
+    raise TypeError(f"Type {type(value).__name__} is not serializable")
+
+
+def _decode_value(value: Any) -> Any:
+    """Return the value with the tagged json representations replaced by the original values."""
+    if isinstance(value, list):
+        return [_decode_value(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if (value_type := value.get(_TAG_TYPE)) is not None and _TAG_VALUE in value:
+        tagged_value = value[_TAG_VALUE]
+        if value_type == _TYPE_XMLRPC_DATETIME:
+            return xmlrpc.client.DateTime(tagged_value)
+        if value_type == _TYPE_BINARY:
+            return xmlrpc.client.Binary(base64.b64decode(tagged_value))
+        if value_type == _TYPE_BYTES:
+            return base64.b64decode(tagged_value)
+        if value_type == _TYPE_DATETIME:
+            return datetime.fromisoformat(tagged_value)
+    return {key: _decode_value(item) for key, item in value.items()}
+
+
+def read_records(file_path: str) -> Iterator[Record]:
+    """Read the records of a recording file."""
+    with open(file_path, "rb") as file:
+        if file.read(len(_MAGIC)) != _MAGIC:
+            raise HaHomematicException(f"READ_RECORDS failed: {file_path} is no recording file")
+        while header := file.read(_RECORD_HEADER.size):
+            if len(header) < _RECORD_HEADER.size:
+                _LOGGER.debug("READ_RECORDS: Ignoring truncated record in %s", file_path)
+                return
+            timestamp, record_type, length = _RECORD_HEADER.unpack(header)
+            if len(payload := file.read(length)) < length:
+                _LOGGER.debug("READ_RECORDS: Ignoring truncated record in %s", file_path)
+                return
+            yield Record(
+                timestamp=timestamp,
+                record_type=RecordType(record_type),
+                args=tuple(_decode_value(orjson.loads(payload))),
+            )
@@ -7,38 +7,53 @@ with the CCU or Homegear.
 
 from __future__ import annotations
 
+from abc import ABC, abstractmethod
 import logging
 import threading
 from typing import Any, Final
-from xmlrpc.server import SimpleXMLRPCRequestHandler, SimpleXMLRPCServer
+from xmlrpc.server import SimpleXMLRPCDispatcher, SimpleXMLRPCRequestHandler, SimpleXMLRPCServer
+
+from aiohttp import web
 
 from hahomematic import central as hmcu
 from hahomematic.central.decorators import callback_backend_system
-from hahomematic.const import IP_ANY_V4, PORT_ANY, BackendSystemEvent
+from hahomematic.central.event_recorder import EventRecorder
+from hahomematic.const import IP_ANY_V4, PORT_ANY, BackendSystemEvent, RecordType
 from hahomematic.support import find_free_port
 
 _LOGGER: Final = logging.getLogger(__name__)
 
+_RPC_PATHS: Final[tuple[str, ...]] = (
+    "/",
+    "/RPC2",
+)
+
 
 # pylint: disable=invalid-name
 class RPCFunctions:
     """The XML-RPC functions the CCU or Homegear will expect."""
 
-    def __init__(self, xml_rpc_server: XmlRpcServer) -> None:
+    def __init__(self, xml_rpc_server: RpcServer) -> None:
         """Init RPCFunctions."""
         self._xml_rpc_server: Final = xml_rpc_server
 
+    @property
+    def recorder(self) -> EventRecorder | None:
+        """Return the event recorder of the server."""
+        return self._xml_rpc_server.recorder
+
     def event(self, interface_id: str, channel_address: str, parameter: str, value: Any) -> None:
         """If a device emits some sort event, we will handle it here."""
-        if central := self.get_central(interface_id):
-            central.looper.create_task(
-                central.data_point_event(
-                    interface_id=interface_id,
-                    channel_address=channel_address,
-                    parameter=parameter,
-                    value=value,
-                ),
-                name=f"event-{interface_id}-{channel_address}-{parameter}",
+        if recorder := self.recorder:
+            recorder.record(
+                record_type=RecordType.EVENT,
+                args=(interface_id, channel_address, parameter, value),
+            )
+        if (central := self.get_central(interface_id)) and central.accept_event(
+            interface_id=interface_id, channel_address=channel_address, parameter=parameter
+        ):
+            central.schedule_data_point_events(
+                interface_id=interface_id, events=((channel_address, parameter, value),)
             )
 
     @callback_backend_system(system_event=BackendSystemEvent.ERROR)
@@ -59,6 +74,10 @@ class RPCFunctions:
 
     def newDevices(self, interface_id: str, device_descriptions: list[dict[str, Any]]) -> None:
         """Add new devices send from backend."""
+        if recorder := self.recorder:
+            recorder.record(
+                record_type=RecordType.NEW_DEVICES, args=(interface_id, device_descriptions)
+            )
         central: hmcu.CentralUnit | None
         if central := self.get_central(interface_id):
             central.looper.create_task(
@@ -70,6 +89,8 @@ class RPCFunctions:
 
     def deleteDevices(self, interface_id: str, addresses: list[str]) -> None:
         """Delete devices send from backend."""
+        if recorder := self.recorder:
+            recorder.record(record_type=RecordType.DELETE_DEVICES, args=(interface_id, addresses))
         central: hmcu.CentralUnit | None
         if central := self.get_central(interface_id):
             central.looper.create_task(
@@ -128,21 +149,12 @@ class RPCFunctions:
 class RequestHandler(SimpleXMLRPCRequestHandler):
     """We handle requests to / and /RPC2."""
 
-    rpc_paths = (
-        "/",
-        "/RPC2",
-    )
+    rpc_paths = _RPC_PATHS
 
 
-class HaHomematicXMLRPCServer(SimpleXMLRPCServer):
+class HaHomematicXMLRPCDispatcher(SimpleXMLRPCDispatcher):
     """
-    Simple XML-RPC server.
-
-    Simple XML-RPC server that allows functions and a single instance
-    to be installed to handle requests. The default implementation
-    attempts to dispatch XML-RPC calls to the functions or instance
-    installed in the server. Override the _dispatch method inherited
-    from SimpleXMLRPCDispatcher to change this behavior.
+    XML-RPC dispatcher.
 
     This implementation adds an additional method:
     system_listMethods(self, interface_id: str.
@@ -155,28 +167,202 @@ class HaHomematicXMLRPCServer(SimpleXMLRPCServer):
         system.listMethods() => ['add', 'subtract', 'multiple']
         Required for HomeMatic CCU usage.
         """
-        return SimpleXMLRPCServer.system_listMethods(self)
+        return SimpleXMLRPCDispatcher.system_listMethods(self)
 
+    def system_multicall(self, call_list: list[dict[str, Any]]) -> list[Any]:
+        """
+        Execute multiple calls in a single request.
 
-class XmlRpcServer(threading.Thread):
-    """XML-RPC server thread to handle messages from CCU / Homegear."""
+        Events are collected and handed over to the central as one batch per interface,
+        instead of scheduling a task per event.
+        """
+        results: list[Any] = []
+        events: list[tuple[str, str, str, Any]] = []
+        recorder: EventRecorder | None = (
+            self.instance.recorder if isinstance(self.instance, RPCFunctions) else None
+        )
+        for call in call_list:
+            if (
+                isinstance(call, dict)
+                and call.get("methodName") == "event"
+                and isinstance(params := call.get("params"), list | tuple)
+                and len(params) == 4
+            ):
+                events.append(tuple(params))
+                if recorder:
+                    recorder.record(record_type=RecordType.EVENT, args=tuple(params))
+                results.append([None])
+                continue
+            # keep the order of events and other calls
+            self._schedule_events(events=events)
+            events = []
+            results.extend(SimpleXMLRPCDispatcher.system_multicall(self, [call]))
+        self._schedule_events(events=events)
+        return results
+
+    def _schedule_events(self, events: list[tuple[str, str, str, Any]]) -> None:
+        """Schedule the processing of the collected events per interface."""
+        if not events or not isinstance(self.instance, RPCFunctions):
+            return
+        interface_events: dict[str, list[tuple[str, str, Any]]] = {}
+        for interface_id, channel_address, parameter, value in events:
+            interface_events.setdefault(interface_id, []).append(
+                (channel_address, parameter, value)
+            )
+        for interface_id, batch in interface_events.items():
+            if (central := self.instance.get_central(interface_id)) and (
+                accepted_events := tuple(
+                    event
+                    for event in batch
+                    if central.accept_event(
+                        interface_id=interface_id, channel_address=event[0], parameter=event[1]
+                    )
+                )
+            ):
+                central.schedule_data_point_events(
+                    interface_id=interface_id, events=accepted_events
+                )
+
+
+class HaHomematicXMLRPCServer(HaHomematicXMLRPCDispatcher, SimpleXMLRPCServer):
+    """
+    Simple XML-RPC server.
+
+    Simple XML-RPC server that allows functions and a single instance
+    to be installed to handle requests. The default implementation
+    attempts to dispatch XML-RPC calls to the functions or instance
+    installed in the server. Override the _dispatch method inherited
+    from SimpleXMLRPCDispatcher to change this behavior.
+    """
+
+
+class RpcServer(ABC):
+    """Base class for the servers, that handle the messages from CCU / Homegear."""
 
     _initialized: bool = False
-    _instances: Final[dict[tuple[str, int], XmlRpcServer]] = {}
+    _instances: dict[tuple[str, int], RpcServer]
 
     def __init__(
         self,
         ip_addr: str,
         port: int,
     ) -> None:
-        """Init XmlRPC server."""
-        if self._initialized:
-            return
+        """Init the rpc server."""
         self._initialized = True
         self._listen_ip_addr: Final = ip_addr
         self._listen_port: Final[int] = find_free_port() if port == PORT_ANY else port
         self._address: Final[tuple[str, int]] = (ip_addr, self._listen_port)
         self._instances[self._address] = self
+        self._rpc_functions: Final = RPCFunctions(self)
+        self._centrals: Final[dict[str, hmcu.CentralUnit]] = {}
+        self._recorder: EventRecorder | None = None
+        # {interface_id, central}
+        self._interface_centrals: Final[dict[str, hmcu.CentralUnit]] = {}
+
+    def __new__(cls, ip_addr: str, port: int) -> RpcServer:  # noqa: PYI034
+        """Create new rpc server."""
+        if (rpc_server := cls._instances.get((ip_addr, port))) is None:
+            _LOGGER.debug("Creating %s", cls.__name__)
+            return super().__new__(cls)
+        return rpc_server
+
+    @property
+    def listen_ip_addr(self) -> str:
+        """Return the local ip address."""
+        return self._listen_ip_addr
+
+    @property
+    def listen_port(self) -> int:
+        """Return the local port."""
+        return self._listen_port
+
+    @property
+    def recorder(self) -> EventRecorder | None:
+        """Return the event recorder."""
+        return self._recorder
+
+    @property
+    @abstractmethod
+    def started(self) -> bool:
+        """Return if the server is started."""
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """Stop the rpc server."""
+
+    def start_recording(self, file_path: str) -> EventRecorder:
+        """Start recording the calls of the backend to a file."""
+        self.stop_recording()
+        recorder = EventRecorder(file_path=file_path)
+        recorder.open()
+        self._recorder = recorder
+        _LOGGER.debug("START_RECORDING: Recording calls to %s", file_path)
+        return recorder
+
+    def stop_recording(self) -> None:
+        """Stop recording the calls of the backend."""
+        if (recorder := self._recorder) is None:
+            return
+        self._recorder = None
+        recorder.close()
+        _LOGGER.debug(
+            "STOP_RECORDING: Recorded %i calls to %s", recorder.record_count, recorder.file_path
+        )
+
+    def _remove_instance(self) -> None:
+        """Remove the server from the registered instances."""
+        self.stop_recording()
+        if self._address in self._instances:
+            del self._instances[self._address]
+
+    def add_central(self, central: hmcu.CentralUnit) -> None:
+        """Register a central in the XmlRPC-Server."""
+        if not self._centrals.get(central.name):
+            self._centrals[central.name] = central
+            for interface_id in central.interface_ids:
+                self.add_interface_id(interface_id=interface_id, central=central)
+
+    def remove_central(self, central: hmcu.CentralUnit) -> None:
+        """Unregister a central from XmlRPC-Server."""
+        if self._centrals.get(central.name):
+            del self._centrals[central.name]
+            for interface_id, interface_central in tuple(self._interface_centrals.items()):
+                if interface_central is central:
+                    del self._interface_centrals[interface_id]
+
+    def add_interface_id(self, interface_id: str, central: hmcu.CentralUnit) -> None:
+        """Register the interface_id of a client for the routing to its central."""
+        if central.name in self._centrals:
+            self._interface_centrals[interface_id] = central
+
+    def remove_interface_id(self, interface_id: str) -> None:
+        """Unregister the interface_id of a client."""
+        self._interface_centrals.pop(interface_id, None)
+
+    def get_central(self, interface_id: str) -> hmcu.CentralUnit | None:
+        """Return a central by interface_id."""
+        return self._interface_centrals.get(interface_id)
+
+    @property
+    def no_central_assigned(self) -> bool:
+        """Return if no central is assigned."""
+        return len(self._centrals) == 0
+
+
+class XmlRpcServer(RpcServer, threading.Thread):
+    """XML-RPC server thread to handle messages from CCU / Homegear."""
+
+    _instances: dict[tuple[str, int], RpcServer] = {}
+
+    def __init__(
+        self,
+        ip_addr: str,
+        port: int,
+    ) -> None:
+        """Init XmlRPC server."""
+        if self._initialized:
+            return
+        RpcServer.__init__(self, ip_addr=ip_addr, port=port)
         threading.Thread.__init__(self, name=f"XmlRpcServer {ip_addr}:{self._listen_port}")
         self._simple_xml_rpc_server = HaHomematicXMLRPCServer(
             addr=self._address,
@@ -186,15 +372,7 @@ class XmlRpcServer(threading.Thread):
         )
         self._simple_xml_rpc_server.register_introspection_functions()
         self._simple_xml_rpc_server.register_multicall_functions()
-        self._simple_xml_rpc_server.register_instance(RPCFunctions(self), allow_dotted_names=True)
-        self._centrals: Final[dict[str, hmcu.CentralUnit]] = {}
-
-    def __new__(cls, ip_addr: str, port: int) -> XmlRpcServer:  # noqa: PYI034
-        """Create new XmlRPC server."""
-        if (xml_rpc := cls._instances.get((ip_addr, port))) is None:
-            _LOGGER.debug("Creating XmlRpc server")
-            return super().__new__(cls)
-        return xml_rpc
+        self._simple_xml_rpc_server.register_instance(self._rpc_functions, allow_dotted_names=True)
 
     def run(self) -> None:
         """Run the XmlRPC-Server thread."""
@@ -206,52 +384,87 @@ class XmlRpcServer(threading.Thread):
         if self._simple_xml_rpc_server:
             self._simple_xml_rpc_server.serve_forever()
 
-    def stop(self) -> None:
+    async def stop(self) -> None:
         """Stop the XmlRPC-Server."""
         _LOGGER.debug("STOP: Shutting down XmlRPC-Server")
         self._simple_xml_rpc_server.shutdown()
         _LOGGER.debug("STOP: Stopping XmlRPC-Server")
         self._simple_xml_rpc_server.server_close()
         _LOGGER.debug("STOP: XmlRPC-Server stopped")
-        if self._address in self._instances:
-            del self._instances[self._address]
-
-    @property
-    def listen_ip_addr(self) -> str:
-        """Return the local ip address."""
-        return self._listen_ip_addr
-
-    @property
-    def listen_port(self) -> int:
-        """Return the local port."""
-        return self._listen_port
+        self._remove_instance()
 
     @property
     def started(self) -> bool:
         """Return if thread is active."""
         return self._started.is_set() is True  # type: ignore[attr-defined]
 
-    def add_central(self, central: hmcu.CentralUnit) -> None:
-        """Register a central in the XmlRPC-Server."""
-        if not self._centrals.get(central.name):
-            self._centrals[central.name] = central
 
-    def remove_central(self, central: hmcu.CentralUnit) -> None:
-        """Unregister a central from XmlRPC-Server."""
-        if self._centrals.get(central.name):
-            del self._centrals[central.name]
+class AsyncXmlRpcServer(RpcServer):
+    """
+    XML-RPC server running on the event loop to handle messages from CCU / Homegear.
 
-    def get_central(self, interface_id: str) -> hmcu.CentralUnit | None:
-        """Return a central by interface_id."""
-        for central in self._centrals.values():
-            if central.has_client(interface_id=interface_id):
-                return central
-        return None
+    Requests are handled by aiohttp, which supports HTTP/1.1 keep-alive,
+    and are dispatched within the event loop without a thread handoff.
+    """
+
+    _instances: dict[tuple[str, int], RpcServer] = {}
+
+    def __init__(
+        self,
+        ip_addr: str,
+        port: int,
+    ) -> None:
+        """Init async XmlRPC server."""
+        if self._initialized:
+            return
+        super().__init__(ip_addr=ip_addr, port=port)
+        self._dispatcher: Final = HaHomematicXMLRPCDispatcher(allow_none=True)
+        self._dispatcher.register_introspection_functions()
+        self._dispatcher.register_multicall_functions()
+        self._dispatcher.register_instance(self._rpc_functions, allow_dotted_names=True)
+        self._app: Final = web.Application()
+        for path in _RPC_PATHS:
+            self._app.router.add_post(path, self._handle_request)
+        self._runner: web.AppRunner | None = None
+
+    async def start(self) -> None:
+        """Start the async XmlRPC-Server."""
+        if self._runner is not None:
+            return
+        _LOGGER.debug(
+            "START: Starting async XmlRPC-Server listening on http://%s:%i",
+            self._listen_ip_addr,
+            self._listen_port,
+        )
+        self._runner = web.AppRunner(self._app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(
+            runner=self._runner,
+            host=self._listen_ip_addr,
+            port=self._listen_port,
+            reuse_address=True,
+        ).start()
+
+    async def stop(self) -> None:
+        """Stop the async XmlRPC-Server."""
+        _LOGGER.debug("STOP: Stopping async XmlRPC-Server")
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+        _LOGGER.debug("STOP: Async XmlRPC-Server stopped")
+        self._remove_instance()
 
     @property
-    def no_central_assigned(self) -> bool:
-        """Return if no central is assigned."""
-        return len(self._centrals) == 0
+    def started(self) -> bool:
+        """Return if the server is started."""
+        return self._runner is not None
+
+    async def _handle_request(self, request: web.Request) -> web.Response:
+        """Handle a XML-RPC request."""
+        response = self._dispatcher._marshaled_dispatch(  # pylint: disable=protected-access
+            await request.read()
+        )
+        return web.Response(body=response, content_type="text/xml")
 
 
 def create_xml_rpc_server(ip_addr: str = IP_ANY_V4, port: int = PORT_ANY) -> XmlRpcServer:
@@ -265,3 +478,18 @@ def create_xml_rpc_server(ip_addr: str = IP_ANY_V4, port: int = PORT_ANY) -> Xml
             xml_rpc.listen_port,
         )
     return xml_rpc
+
+
+async def create_async_xml_rpc_server(
+    ip_addr: str = IP_ANY_V4, port: int = PORT_ANY
+) -> AsyncXmlRpcServer:
+    """Register the async xml rpc server."""
+    xml_rpc = AsyncXmlRpcServer(ip_addr=ip_addr, port=port)
+    if not xml_rpc.started:
+        await xml_rpc.start()
+        _LOGGER.debug(
+            "CREATE_ASYNC_XML_RPC_SERVER: Starting async XmlRPC-Server listening on %s:%i",
+            xml_rpc.listen_ip_addr,
+            xml_rpc.listen_port,
+        )
+    return xml_rpc
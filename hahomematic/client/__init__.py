@@ -4,26 +4,45 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 import asyncio
+from collections.abc import Iterable, Mapping
+import contextlib
 from datetime import datetime
+from itertools import chain
 import logging
+import random
 from typing import Any, Final, cast
 
 from hahomematic import central as hmcu
+from hahomematic.async_support import SingleFlight
 from hahomematic.caches.dynamic import CommandCache, PingPongCache
-from hahomematic.client.xml_rpc import XmlRpcProxy
-from hahomematic.config import CALLBACK_WARN_INTERVAL, RECONNECT_WAIT, WAIT_FOR_CALLBACK
+from hahomematic.client.bin_rpc import BinRpcProxy
+from hahomematic.client.circuit_breaker import CircuitBreaker
+from hahomematic.client.rate_limiter import CommandRateLimiter
+from hahomematic.client.request_scheduler import RequestScheduler
+from hahomematic.client.xml_rpc import AioHttpXmlRpcProxy, BaseXmlRpcProxy, XmlRpcProxy
+from hahomematic.config import (
+    CALLBACK_WARN_INTERVAL,
+    CONNECTION_CHECKER_INTERVAL,
+    RECONNECT_BACKOFF_MAX,
+    RECONNECT_WAIT,
+    WAIT_FOR_CALLBACK,
+)
 from hahomematic.const import (
     DATETIME_FORMAT_MILLIS,
     DEFAULT_CUSTOM_ID,
     DEFAULT_MAX_WORKERS,
+    DEFAULT_RPC_PROTOCOL,
     DP_KEY_VALUE,
     DUMMY_SERIAL,
     INIT_DATETIME,
+    INTERFACES_SUPPORTING_DUTY_CYCLE,
     INTERFACES_SUPPORTING_FIRMWARE_UPDATES,
     INTERFACES_SUPPORTING_XML_RPC,
     VIRTUAL_REMOTE_MODELS,
     Backend,
+    BootstrapData,
     CallSource,
+    CircuitBreakerState,
     CommandRxMode,
     DeviceDescription,
     EventKey,
@@ -36,9 +55,13 @@ from hahomematic.const import (
     ProductGroup,
     ProgramData,
     ProxyInitState,
+    RequestLane,
+    RpcProtocol,
     SystemInformation,
     SystemVariableData,
+    XmlRpcProxyType,
 )
+from hahomematic.context import REQUEST_LANE_VAR
 from hahomematic.decorators import measure_execution_time, service
 from hahomematic.exceptions import BaseHomematicException, ClientException, NoConnectionException
 from hahomematic.model.device import Device
@@ -47,6 +70,7 @@ from hahomematic.support import (
     build_headers,
     build_xml_rpc_uri,
     get_device_address,
+    get_split_channel_address,
     is_channel_address,
     is_paramset_key,
     reduce_args,
@@ -63,6 +87,7 @@ _JSON_ID: Final = "id"
 _JSON_INTERFACE: Final = "interface"
 _JSON_NAME: Final = "name"
 _NAME: Final = "NAME"
+_SYSTEM_MULTICALL: Final = "system.multicall"
 
 _CCU_JSON_VALUE_TYPE: Final = {
     "ACTION": "bool",
@@ -89,8 +114,31 @@ class Client(ABC):
         self._ping_pong_cache: Final = PingPongCache(
             central=client_config.central, interface_id=client_config.interface_id
         )
-        self._proxy: XmlRpcProxy
-        self._proxy_read: XmlRpcProxy
+        self._single_flight: Final = SingleFlight()
+        self._circuit_breaker: Final = CircuitBreaker(
+            interface_id=client_config.interface_id,
+            base_delay=CONNECTION_CHECKER_INTERVAL,
+            max_delay=RECONNECT_BACKOFF_MAX,
+            on_state_change=self._on_circuit_breaker_state_change,
+        )
+        self._rate_limiter: Final = (
+            CommandRateLimiter(
+                interface_id=client_config.interface_id,
+                rate=client_config.command_rate_limit,
+                burst_size=client_config.command_burst_size,
+            )
+            if self.interface in INTERFACES_SUPPORTING_DUTY_CYCLE
+            and client_config.command_rate_limit > 0
+            else None
+        )
+        self._request_scheduler: Final = RequestScheduler(
+            interface_id=client_config.interface_id,
+            max_writes=DEFAULT_MAX_WORKERS,
+            max_reads=client_config.max_read_workers,
+            max_background_reads=client_config.max_background_reads,
+        )
+        self._proxy: BaseXmlRpcProxy
+        self._proxy_read: BaseXmlRpcProxy
         self._system_information: SystemInformation
         self.modified_at: datetime = INIT_DATETIME
 
@@ -115,6 +163,11 @@ class Client(ABC):
         """Return the central of the client."""
         return self._config.central
 
+    @property
+    def circuit_breaker(self) -> CircuitBreaker:
+        """Return the circuit breaker for the reconnects of the client."""
+        return self._circuit_breaker
+
     @property
     def interface(self) -> Interface:
         """Return the interface of the client."""
@@ -181,6 +234,29 @@ class Client(ABC):
         """Return the client supports push update."""
         return self.interface not in self.central.config.interfaces_requiring_periodic_refresh
 
+    @property
+    def rate_limiter(self) -> CommandRateLimiter | None:
+        """Return the rate limiter for the commands of the interface."""
+        return self._rate_limiter
+
+    @property
+    def request_scheduler(self) -> RequestScheduler:
+        """Return the request scheduler with the priority lanes of the requests."""
+        return self._request_scheduler
+
+    @property
+    def single_flight(self) -> SingleFlight:
+        """Return the single flight helper with the statistics of the shared reads."""
+        return self._single_flight
+
+    @property
+    def supports_multicall(self) -> bool:
+        """Return if read requests can be batched by system.multicall."""
+        return (
+            self._config.multicall_batch_size > 0
+            and _SYSTEM_MULTICALL in self._proxy_read.supported_methods
+        )
+
     @property
     def supports_firmware_updates(self) -> bool:
         """Return the supports_ping_pong info of the backend."""
@@ -269,22 +345,43 @@ class Client(ABC):
 
     async def reconnect(self) -> bool:
         """re-init all RPC clients."""
+        if not self._circuit_breaker.allow_request():
+            _LOGGER.debug(
+                "RECONNECT: circuit breaker for %s is open. Next attempt in %is",
+                self.interface_id,
+                int(self._circuit_breaker.retry_in),
+            )
+            return False
         if await self.is_connected():
+            # jitter the wait, so that the clients do not re-init in lockstep
+            reconnect_wait = RECONNECT_WAIT * random.uniform(1.0, 1.25)  # noqa: S311
             _LOGGER.debug(
                 "RECONNECT: waiting to re-connect client %s for %is",
                 self.interface_id,
-                int(RECONNECT_WAIT),
+                int(reconnect_wait),
             )
-            await asyncio.sleep(RECONNECT_WAIT)
+            await asyncio.sleep(reconnect_wait)
 
-            await self.proxy_re_init()
-            _LOGGER.info(
-                "RECONNECT: re-connected client %s",
-                self.interface_id,
-            )
-            return True
+            if await self.proxy_re_init() == ProxyInitState.INIT_SUCCESS:
+                self._circuit_breaker.record_success()
+                _LOGGER.info(
+                    "RECONNECT: re-connected client %s",
+                    self.interface_id,
+                )
+                return True
+        self._circuit_breaker.record_failure()
         return False
 
+    def _on_circuit_breaker_state_change(
+        self, state: CircuitBreakerState, retry_in: float
+    ) -> None:
+        """Fire an event about the state of the circuit breaker."""
+        self.central.fire_interface_event(
+            interface_id=self.interface_id,
+            interface_event_type=InterfaceEventType.CIRCUIT_BREAKER,
+            data={EventKey.STATE: state, EventKey.RETRY_IN: int(retry_in)},
+        )
+
     async def stop(self) -> None:
         """Stop depending services."""
         if not self.supports_xml_rpc:
@@ -293,13 +390,17 @@ class Client(ABC):
         await self._proxy_read.stop()
 
     @abstractmethod
-    async def fetch_all_device_data(self) -> None:
-        """Fetch all device data from CCU."""
+    async def fetch_all_device_data(self, since: datetime | None = None) -> None:
+        """Fetch all device data from CCU, or only the data changed since the timestamp."""
 
     @abstractmethod
     async def fetch_device_details(self) -> None:
         """Fetch names from backend."""
 
+    async def fetch_bootstrap_data(self) -> BootstrapData | None:
+        """Fetch the data required on start in one request, if supported by the backend."""
+        return None
+
     @service(re_raise=False, no_raise_return=False)
     async def is_connected(self) -> bool:
         """
@@ -413,7 +514,7 @@ class Client(ABC):
         try:
             if device_description := cast(
                 DeviceDescription | None,
-                await self._proxy_read.getDeviceDescription(device_address),
+                await self._read("getDeviceDescription", device_address),
             ):
                 return device_description
         except BaseHomematicException as ex:
@@ -535,10 +636,8 @@ class Client(ABC):
                 call_source,
             )
             if paramset_key == ParamsetKey.VALUES:
-                return await self._proxy_read.getValue(channel_address, parameter)
-            paramset = (
-                await self._proxy_read.getParamset(channel_address, ParamsetKey.MASTER) or {}
-            )
+                return await self._read("getValue", channel_address, parameter)
+            paramset = await self._read("getParamset", channel_address, ParamsetKey.MASTER) or {}
             return paramset.get(parameter)
         except BaseHomematicException as ex:
             raise ClientException(
@@ -568,20 +667,24 @@ class Client(ABC):
                 else value
             )
             _LOGGER.debug("SET_VALUE: %s, %s, %s", channel_address, parameter, checked_value)
-            if rx_mode and (device := self.central.get_device(address=channel_address)):
-                if supports_rx_mode(command_rx_mode=rx_mode, rx_modes=device.rx_modes):
+            # wait for the rate limit before occupying the write lane
+            if self._rate_limiter:
+                await self._rate_limiter.acquire()
+            async with self._request_scheduler.lane(RequestLane.WRITE):
+                if rx_mode and (device := self.central.get_device(address=channel_address)):
+                    if supports_rx_mode(command_rx_mode=rx_mode, rx_modes=device.rx_modes):
+                        await self._exec_set_value(
+                            channel_address=channel_address,
+                            parameter=parameter,
+                            value=value,
+                            rx_mode=rx_mode,
+                        )
+                    else:
+                        raise ClientException(f"Unsupported rx_mode: {rx_mode}")
+                else:
                     await self._exec_set_value(
-                        channel_address=channel_address,
-                        parameter=parameter,
-                        value=value,
-                        rx_mode=rx_mode,
+                        channel_address=channel_address, parameter=parameter, value=value
                     )
-                else:
-                    raise ClientException(f"Unsupported rx_mode: {rx_mode}")
-            else:
-                await self._exec_set_value(
-                    channel_address=channel_address, parameter=parameter, value=value
-                )
             # store the send value in the last_value_send_cache
             data_point_key_values = self._last_value_send_cache.add_set_value(
                 channel_address=channel_address, parameter=parameter, value=checked_value
@@ -693,7 +796,7 @@ class Client(ABC):
                 paramset_key,
                 call_source,
             )
-            return await self._proxy_read.getParamset(address, paramset_key)  # type: ignore[no-any-return]
+            return await self._read("getParamset", address, paramset_key)  # type: ignore[no-any-return]
         except BaseHomematicException as ex:
             raise ClientException(
                 f"GET_PARAMSET failed with for {address}/{paramset_key}: {reduce_args(args=ex.args)}"
@@ -741,22 +844,26 @@ class Client(ABC):
             _LOGGER.debug(
                 "PUT_PARAMSET: %s, %s, %s", channel_address, paramset_key, checked_values
             )
-            if rx_mode and (device := self.central.get_device(address=channel_address)):
-                if supports_rx_mode(command_rx_mode=rx_mode, rx_modes=device.rx_modes):
+            # wait for the rate limit before occupying the write lane
+            if self._rate_limiter:
+                await self._rate_limiter.acquire()
+            async with self._request_scheduler.lane(RequestLane.WRITE):
+                if rx_mode and (device := self.central.get_device(address=channel_address)):
+                    if supports_rx_mode(command_rx_mode=rx_mode, rx_modes=device.rx_modes):
+                        await self._exec_put_paramset(
+                            channel_address=channel_address,
+                            paramset_key=paramset_key,
+                            values=checked_values,
+                            rx_mode=rx_mode,
+                        )
+                    else:
+                        raise ClientException(f"Unsupported rx_mode: {rx_mode}")
+                else:
                     await self._exec_put_paramset(
                         channel_address=channel_address,
                         paramset_key=paramset_key,
                         values=checked_values,
-                        rx_mode=rx_mode,
                     )
-                else:
-                    raise ClientException(f"Unsupported rx_mode: {rx_mode}")
-            else:
-                await self._exec_put_paramset(
-                    channel_address=channel_address,
-                    paramset_key=paramset_key,
-                    values=checked_values,
-                )
 
             # if a call is related to a link then no further action is needed
             if is_link_call:
@@ -880,10 +987,35 @@ class Client(ABC):
                 paramset_description=paramset_description,
             )
 
+    async def fetch_paramset_description_batch(
+        self, channel_paramset_keys: tuple[tuple[str, ParamsetKey], ...]
+    ) -> None:
+        """Fetch specific paramsets by (channel_address, paramset_key) and add them to the known ones."""
+        _LOGGER.debug("FETCH_PARAMSET_DESCRIPTION_BATCH: %i paramsets", len(channel_paramset_keys))
+        for (channel_address, paramset_key), paramset_description in zip(
+            channel_paramset_keys,
+            await self._get_paramset_description_batch(keys=channel_paramset_keys),
+            strict=True,
+        ):
+            if paramset_description:
+                self.central.paramset_descriptions.add(
+                    interface_id=self.interface_id,
+                    channel_address=channel_address,
+                    paramset_key=paramset_key,
+                    paramset_description=paramset_description,
+                )
+
     @service(re_raise=False)
     async def fetch_paramset_descriptions(self, device_description: DeviceDescription) -> None:
         """Fetch paramsets for provided device description."""
-        data = await self.get_paramset_descriptions(device_description=device_description)
+        await self.fetch_all_paramset_descriptions(device_descriptions=(device_description,))
+
+    @service(re_raise=False)
+    async def fetch_all_paramset_descriptions(
+        self, device_descriptions: tuple[DeviceDescription, ...]
+    ) -> None:
+        """Fetch paramsets for provided device descriptions."""
+        data = await self.get_all_paramset_descriptions(device_descriptions=device_descriptions)
         for address, paramsets in data.items():
             _LOGGER.debug("FETCH_PARAMSET_DESCRIPTIONS for %s", address)
             for paramset_key, paramset_description in paramsets.items():
@@ -894,23 +1026,196 @@ class Client(ABC):
                     paramset_description=paramset_description,
                 )
 
+    @service(re_raise=False, measure_performance=True)
+    async def fetch_new_paramset_descriptions(
+        self, device_descriptions: tuple[DeviceDescription, ...]
+    ) -> None:
+        """
+        Fetch paramsets for the provided device descriptions of new devices.
+
+        The paramsets of a device are cloned from a known device of the same model
+        and firmware. Only one device per model is fetched, and the known paramsets
+        are verified with one sample request.
+        """
+        # {(model, firmware), {device_address, [device_descriptions]}}
+        models: dict[tuple[str, str], dict[str, list[DeviceDescription]]] = {}
+        to_fetch: list[DeviceDescription] = []
+        for device_description in device_descriptions:
+            device_address = get_device_address(device_description["ADDRESS"])
+            if parent_description := self.central.device_descriptions.find_device_description(
+                interface_id=self.interface_id, device_address=device_address
+            ):
+                models.setdefault(
+                    (parent_description["TYPE"], parent_description.get("FIRMWARE", "")), {}
+                ).setdefault(device_address, []).append(device_description)
+            else:
+                to_fetch.append(device_description)
+
+        to_clone: list[tuple[str, str, list[DeviceDescription]]] = []
+        for (model, firmware), devices in models.items():
+            device_groups = list(devices.values())
+            if not self._has_model_paramset_descriptions(
+                model=model, firmware=firmware, device_descriptions=device_groups[0]
+            ):
+                # the first device of a model is fetched, the other ones are cloned from it
+                to_fetch.extend(device_groups[0])
+                to_clone.extend((model, firmware, group) for group in device_groups[1:])
+            elif await self._verify_model_paramset_descriptions(
+                model=model, firmware=firmware, device_descriptions=device_groups[0]
+            ):
+                to_clone.extend((model, firmware, group) for group in device_groups)
+            else:
+                to_fetch.extend(chain.from_iterable(device_groups))
+
+        if to_fetch:
+            await self.fetch_all_paramset_descriptions(device_descriptions=tuple(to_fetch))
+
+        not_cloned: list[DeviceDescription] = []
+        for model, firmware, group in to_clone:
+            if not self._clone_model_paramset_descriptions(
+                model=model, firmware=firmware, device_descriptions=group
+            ):
+                not_cloned.extend(group)
+        if not_cloned:
+            await self.fetch_all_paramset_descriptions(device_descriptions=tuple(not_cloned))
+        cloned_device_addresses = {
+            get_device_address(dd["ADDRESS"]) for _, _, group in to_clone for dd in group
+        } - {get_device_address(dd["ADDRESS"]) for dd in not_cloned}
+        _LOGGER.debug(
+            "FETCH_NEW_PARAMSET_DESCRIPTIONS: Cloned paramsets of %i of %i new devices for %s",
+            len(cloned_device_addresses),
+            len({get_device_address(dd["ADDRESS"]) for dd in device_descriptions}),
+            self.interface_id,
+        )
+
+    def _has_model_paramset_descriptions(
+        self, model: str, firmware: str, device_descriptions: list[DeviceDescription]
+    ) -> bool:
+        """Return if all paramsets of all channels of a model are known."""
+        for device_description in device_descriptions:
+            model_paramset_descriptions = (
+                self.central.paramset_descriptions.get_model_paramset_descriptions(
+                    model=model,
+                    firmware=firmware,
+                    channel_no=get_split_channel_address(device_description["ADDRESS"])[1],
+                )
+            )
+            if any(
+                ParamsetKey(p_key) not in model_paramset_descriptions
+                for p_key in device_description["PARAMSETS"]
+            ):
+                return False
+        return True
+
+    async def _verify_model_paramset_descriptions(
+        self, model: str, firmware: str, device_descriptions: list[DeviceDescription]
+    ) -> bool:
+        """Verify the known paramsets of a model with a sample of a new device."""
+        for device_description in device_descriptions:
+            address = device_description["ADDRESS"]
+            for (
+                paramset_key,
+                known_description,
+            ) in self.central.paramset_descriptions.get_model_paramset_descriptions(
+                model=model, firmware=firmware, channel_no=get_split_channel_address(address)[1]
+            ).items():
+                if paramset_key != ParamsetKey.VALUES:
+                    continue
+                # the known descriptions may have been adjusted, so only the parameters are compared
+                sample_description = await self._get_paramset_description(
+                    address=address, paramset_key=paramset_key
+                )
+                return sample_description is not None and set(sample_description) == set(
+                    known_description
+                )
+        return True
+
+    def _clone_model_paramset_descriptions(
+        self, model: str, firmware: str, device_descriptions: list[DeviceDescription]
+    ) -> bool:
+        """Add the known paramsets of a model for the new device."""
+        if not self._has_model_paramset_descriptions(
+            model=model, firmware=firmware, device_descriptions=device_descriptions
+        ):
+            return False
+        for device_description in device_descriptions:
+            address = device_description["ADDRESS"]
+            model_paramset_descriptions = (
+                self.central.paramset_descriptions.get_model_paramset_descriptions(
+                    model=model,
+                    firmware=firmware,
+                    channel_no=get_split_channel_address(address)[1],
+                )
+            )
+            for p_key in device_description["PARAMSETS"]:
+                self.central.paramset_descriptions.add(
+                    interface_id=self.interface_id,
+                    channel_address=address,
+                    paramset_key=ParamsetKey(p_key),
+                    paramset_description=model_paramset_descriptions[ParamsetKey(p_key)],
+                )
+        return True
+
     @service(re_raise=False, no_raise_return={})
     async def get_paramset_descriptions(
         self, device_description: DeviceDescription
     ) -> dict[str, dict[ParamsetKey, dict[str, ParameterData]]]:
         """Get paramsets for provided device description."""
-        paramsets: dict[str, dict[ParamsetKey, dict[str, ParameterData]]] = {}
-        address = device_description["ADDRESS"]
-        paramsets[address] = {}
-        _LOGGER.debug("GET_PARAMSET_DESCRIPTIONS for %s", address)
-        for p_key in device_description["PARAMSETS"]:
-            paramset_key = ParamsetKey(p_key)
-            if paramset_description := await self._get_paramset_description(
-                address=address, paramset_key=paramset_key
-            ):
+        _LOGGER.debug("GET_PARAMSET_DESCRIPTIONS for %s", device_description["ADDRESS"])
+        return await self._get_paramset_descriptions(device_descriptions=(device_description,))
+
+    async def _get_paramset_descriptions(
+        self, device_descriptions: tuple[DeviceDescription, ...]
+    ) -> dict[str, dict[ParamsetKey, dict[str, ParameterData]]]:
+        """Get paramsets for provided device descriptions."""
+        paramsets: dict[str, dict[ParamsetKey, dict[str, ParameterData]]] = {
+            device_description["ADDRESS"]: {} for device_description in device_descriptions
+        }
+        keys = tuple(
+            (device_description["ADDRESS"], ParamsetKey(p_key))
+            for device_description in device_descriptions
+            for p_key in device_description["PARAMSETS"]
+        )
+        for (address, paramset_key), paramset_description in zip(
+            keys, await self._get_paramset_description_batch(keys=keys), strict=True
+        ):
+            # the empty paramsets are kept, so that a failed request can be told apart
+            if paramset_description is not None:
                 paramsets[address][paramset_key] = paramset_description
         return paramsets
 
+    async def _get_paramset_description_batch(
+        self, keys: tuple[tuple[str, ParamsetKey], ...]
+    ) -> tuple[dict[str, ParameterData] | None, ...]:
+        """Get paramset descriptions by (address, paramset_key) from CCU."""
+        if not self.supports_multicall:
+            return tuple(
+                [
+                    await self._get_paramset_description(
+                        address=address, paramset_key=paramset_key
+                    )
+                    for address, paramset_key in keys
+                ]
+            )
+        paramset_descriptions: list[dict[str, ParameterData] | None] = []
+        for (address, paramset_key), result in zip(
+            keys,
+            await self._multicall(method="getParamsetDescription", calls=keys),
+            strict=True,
+        ):
+            if isinstance(result, BaseHomematicException):
+                _LOGGER.debug(
+                    "GET_PARAMSET_DESCRIPTIONS failed with %s [%s] for %s address %s",
+                    result.name,
+                    reduce_args(args=result.args),
+                    paramset_key,
+                    address,
+                )
+                paramset_descriptions.append(None)
+            else:
+                paramset_descriptions.append(cast(dict[str, ParameterData], result))
+        return tuple(paramset_descriptions)
+
     async def _get_paramset_description(
         self, address: str, paramset_key: ParamsetKey
     ) -> dict[str, ParameterData] | None:
@@ -918,7 +1223,7 @@ class Client(ABC):
         try:
             return cast(
                 dict[str, ParameterData],
-                await self._proxy_read.getParamsetDescription(address, paramset_key),
+                await self._read("getParamsetDescription", address, paramset_key),
             )
         except BaseHomematicException as ex:
             _LOGGER.debug(
@@ -935,12 +1240,118 @@ class Client(ABC):
         self, device_descriptions: tuple[DeviceDescription, ...]
     ) -> dict[str, dict[ParamsetKey, dict[str, ParameterData]]]:
         """Get all paramset descriptions for provided device descriptions."""
-        all_paramsets: dict[str, dict[ParamsetKey, dict[str, ParameterData]]] = {}
-        for device_description in device_descriptions:
-            all_paramsets.update(
-                await self.get_paramset_descriptions(device_description=device_description)
+        return await self._get_paramset_descriptions(device_descriptions=device_descriptions)
+
+    @service(re_raise=False, no_raise_return={})
+    async def get_value_batch(
+        self,
+        channel_parameters: tuple[tuple[str, str], ...],
+        call_source: CallSource = CallSource.MANUAL_OR_SCHEDULED,
+    ) -> dict[tuple[str, str], Any]:
+        """Return values of paramset VALUES by (channel_address, parameter). Failed reads are omitted."""
+        _LOGGER.debug(
+            "GET_VALUE_BATCH: %i values, source:%s", len(channel_parameters), call_source
+        )
+        if not self.supports_multicall:
+            values: dict[tuple[str, str], Any] = {}
+            for channel_address, parameter in channel_parameters:
+                with contextlib.suppress(BaseHomematicException):
+                    values[(channel_address, parameter)] = await self.get_value(
+                        channel_address=channel_address,
+                        paramset_key=ParamsetKey.VALUES,
+                        parameter=parameter,
+                        call_source=call_source,
+                    )
+            return values
+        return {
+            key: result
+            for key, result in zip(
+                channel_parameters,
+                await self._multicall(method="getValue", calls=channel_parameters),
+                strict=True,
             )
-        return all_paramsets
+            if not isinstance(result, BaseHomematicException)
+        }
+
+    @service(re_raise=False, no_raise_return={})
+    async def get_paramset_batch(
+        self,
+        addresses: tuple[str, ...],
+        paramset_key: ParamsetKey,
+        call_source: CallSource = CallSource.MANUAL_OR_SCHEDULED,
+    ) -> dict[str, dict[str, Any]]:
+        """Return a paramset by address. Failed reads are omitted."""
+        _LOGGER.debug(
+            "GET_PARAMSET_BATCH: %i paramsets %s, source:%s",
+            len(addresses),
+            paramset_key,
+            call_source,
+        )
+        if not self.supports_multicall:
+            paramsets: dict[str, dict[str, Any]] = {}
+            for address in addresses:
+                with contextlib.suppress(BaseHomematicException):
+                    paramsets[address] = await self.get_paramset(
+                        address=address, paramset_key=paramset_key, call_source=call_source
+                    )
+            return paramsets
+        return {
+            address: result or {}
+            for address, result in zip(
+                addresses,
+                await self._multicall(
+                    method="getParamset",
+                    calls=tuple((address, paramset_key) for address in addresses),
+                ),
+                strict=True,
+            )
+            if not isinstance(result, BaseHomematicException)
+        }
+
+    async def _read(self, method: str, *args: Any) -> Any:
+        """Call a read method of the backend. Identical concurrent reads of a lane share one request."""
+        # an interactive read must not wait for a shared background read
+        return await self._single_flight.run(
+            key=(REQUEST_LANE_VAR.get(), method, *args),
+            call=lambda: self._send_read(method, *args),
+        )
+
+    async def _send_read(self, method: str, *args: Any) -> Any:
+        """Send a read request in the lane of the context."""
+        async with self._request_scheduler.lane():
+            return await getattr(self._proxy_read, method)(*args)
+
+    async def _multicall(
+        self, method: str, calls: tuple[tuple[Any, ...], ...]
+    ) -> tuple[Any | BaseHomematicException, ...]:
+        """
+        Execute calls of a read method batched by system.multicall.
+
+        Returns the result of each call, or the exception, if the call failed.
+        """
+        results: list[Any | BaseHomematicException] = []
+        batch_size = self._config.multicall_batch_size
+        for start in range(0, len(calls), batch_size):
+            batch = calls[start : start + batch_size]
+            try:
+                async with self._request_scheduler.lane():
+                    responses = await self._proxy_read.system.multicall(
+                        [{"methodName": method, "params": list(params)} for params in batch]
+                    )
+            except BaseHomematicException as ex:
+                results.extend(ex for _ in batch)
+                continue
+            for response in responses:
+                # A failed call returns a fault struct instead of a list with the result.
+                if isinstance(response, dict):
+                    results.append(
+                        ClientException(
+                            f"XMLRPC Fault from backend: {response.get('faultCode')} {response.get('faultString')}"
+                        )
+                    )
+                else:
+                    results.append(response[0])
+        return tuple(results)
 
     @service()
     async def has_program_ids(self, channel_hmid: str) -> bool:
@@ -951,7 +1362,7 @@ class Client(ABC):
     async def list_devices(self) -> tuple[DeviceDescription, ...] | None:
         """List devices of homematic backend."""
         try:
-            return tuple(await self._proxy_read.listDevices())
+            return tuple(await self._read("listDevices"))
         except BaseHomematicException as ex:
             _LOGGER.debug(
                 "LIST_DEVICES failed: %s [%s]",
@@ -1046,45 +1457,99 @@ class ClientCCU(Client):
     async def fetch_device_details(self) -> None:
         """Get all names via JSON-RPS and store in data.NAMES."""
         if json_result := await self._json_rpc_client.get_device_details():
-            for device in json_result:
-                # ignore unknown interfaces
-                if (interface := device[_JSON_INTERFACE]) and interface not in Interface:
-                    continue
+            self._add_device_details(device_details=json_result)
+        else:
+            _LOGGER.debug("FETCH_DEVICE_DETAILS: Unable to fetch device details via JSON-RPC")
 
-                device_address = device[_JSON_ADDRESS]
-                self.central.device_details.add_interface(
-                    address=device_address, interface=Interface(interface)
-                )
+    @service(re_raise=False, no_raise_return=None, measure_performance=True)
+    async def fetch_bootstrap_data(self) -> BootstrapData | None:
+        """Fetch the device details, device data, system variables and programs in one request."""
+        fetched_at = datetime.now()
+        bootstrap_data = await self._json_rpc_client.get_bootstrap_data(
+            interfaces=self.central.interfaces,
+            include_internal_programs=self.central.config.include_internal_programs,
+            include_internal_sysvars=self.central.config.include_internal_sysvars,
+        )
+        _LOGGER.debug("FETCH_BOOTSTRAP_DATA: Fetched the bootstrap data for %s", self.central.name)
+        self._add_device_details(device_details=bootstrap_data.device_details)
+        self.central.device_details.set_rooms_and_functions(
+            rooms=self._get_names_by_address(names_by_channel_id=bootstrap_data.channel_ids_room),
+            functions=self._get_names_by_address(
+                names_by_channel_id=bootstrap_data.channel_ids_function
+            ),
+            refreshed_at=fetched_at,
+        )
+        for interface, all_device_data in bootstrap_data.all_device_data.items():
+            self.central.data_cache.add_data(
+                interface=interface, all_device_data=all_device_data, refreshed_at=fetched_at
+            )
+        return bootstrap_data
+
+    def _add_device_details(self, device_details: Iterable[dict[str, Any]]) -> None:
+        """Add the names, interfaces and ids of the devices and channels to the device details."""
+        for device in device_details:
+            # ignore unknown interfaces
+            if (interface := device[_JSON_INTERFACE]) and interface not in Interface:
+                continue
+
+            device_address = device[_JSON_ADDRESS]
+            self.central.device_details.add_interface(
+                address=device_address, interface=Interface(interface)
+            )
+            self.central.device_details.add_name(address=device_address, name=device[_JSON_NAME])
+            self.central.device_details.add_address_id(
+                address=device_address, hmid=device[_JSON_ID]
+            )
+            for channel in device.get(_JSON_CHANNELS, []):
+                channel_address = channel[_JSON_ADDRESS]
                 self.central.device_details.add_name(
-                    address=device_address, name=device[_JSON_NAME]
+                    address=channel_address, name=channel[_JSON_NAME]
                 )
                 self.central.device_details.add_address_id(
-                    address=device_address, hmid=device[_JSON_ID]
+                    address=channel_address, hmid=channel[_JSON_ID]
                 )
-                for channel in device.get(_JSON_CHANNELS, []):
-                    channel_address = channel[_JSON_ADDRESS]
-                    self.central.device_details.add_name(
-                        address=channel_address, name=channel[_JSON_NAME]
-                    )
-                    self.central.device_details.add_address_id(
-                        address=channel_address, hmid=channel[_JSON_ID]
-                    )
-        else:
-            _LOGGER.debug("FETCH_DEVICE_DETAILS: Unable to fetch device details via JSON-RPC")
+
+    def _get_names_by_address(
+        self, names_by_channel_id: Mapping[str, set[str]]
+    ) -> dict[str, set[str]]:
+        """Return the names of rooms / functions by the addresses of the devices and channels."""
+        names_by_address: dict[str, set[str]] = {}
+        for address, channel_id in self.central.device_details.device_channel_ids.items():
+            if names := names_by_channel_id.get(channel_id):
+                if address not in names_by_address:
+                    names_by_address[address] = set()
+                names_by_address[address].update(names)
+        return names_by_address
 
     @service(re_raise=False, measure_performance=True)
-    async def fetch_all_device_data(self) -> None:
-        """Fetch all device data from CCU."""
+    async def fetch_all_device_data(self, since: datetime | None = None) -> None:
+        """Fetch all device data from CCU, or only the data changed since the timestamp."""
+        fetched_at = datetime.now()
         try:
-            if all_device_data := await self._json_rpc_client.get_all_device_data(
-                interface=self.interface
-            ):
+            all_device_data = await self._json_rpc_client.get_all_device_data(
+                interface=self.interface, since=since
+            )
+            if since is not None:
+                _LOGGER.debug(
+                    "FETCH_ALL_DEVICE_DATA: Fetched changed device data of %i channels for interface %s",
+                    len(all_device_data),
+                    self.interface,
+                )
+                self.central.data_cache.merge_data(
+                    interface=self.interface,
+                    all_device_data=all_device_data,
+                    refreshed_at=fetched_at,
+                )
+                return
+            if all_device_data:
                 _LOGGER.debug(
                     "FETCH_ALL_DEVICE_DATA: Fetched all device data for interface %s",
                     self.interface,
                 )
                 self.central.data_cache.add_data(
-                    interface=self.interface, all_device_data=all_device_data
+                    interface=self.interface,
+                    all_device_data=all_device_data,
+                    refreshed_at=fetched_at,
                 )
                 return
         except ClientException:
@@ -1177,26 +1642,16 @@ class ClientCCU(Client):
     @service(re_raise=False, no_raise_return={})
     async def get_all_rooms(self) -> dict[str, set[str]]:
         """Get all rooms from CCU."""
-        rooms: dict[str, set[str]] = {}
-        channel_ids_room = await self._json_rpc_client.get_all_channel_ids_room()
-        for address, channel_id in self.central.device_details.device_channel_ids.items():
-            if names := channel_ids_room.get(channel_id):
-                if address not in rooms:
-                    rooms[address] = set()
-                rooms[address].update(names)
-        return rooms
+        return self._get_names_by_address(
+            names_by_channel_id=await self._json_rpc_client.get_all_channel_ids_room()
+        )
 
     @service(re_raise=False, no_raise_return={})
     async def get_all_functions(self) -> dict[str, set[str]]:
         """Get all functions from CCU."""
-        functions: dict[str, set[str]] = {}
-        channel_ids_function = await self._json_rpc_client.get_all_channel_ids_function()
-        for address, channel_id in self.central.device_details.device_channel_ids.items():
-            if sections := channel_ids_function.get(channel_id):
-                if address not in functions:
-                    functions[address] = set()
-                functions[address].update(sections)
-        return functions
+        return self._get_names_by_address(
+            names_by_channel_id=await self._json_rpc_client.get_all_channel_ids_function()
+        )
 
     async def _get_system_information(self) -> SystemInformation:
         """Get system information of the backend."""
@@ -1220,6 +1675,11 @@ class ClientJsonCCU(ClientCCU):
         """Return the supports_ping_pong info of the backend."""
         return False
 
+    @property
+    def supports_multicall(self) -> bool:
+        """Return if read requests can be batched by system.multicall."""
+        return False
+
     @service(re_raise=False)
     async def get_device_description(self, device_address: str) -> DeviceDescription | None:
         """Get device descriptions from CCU / Homegear."""
@@ -1429,8 +1889,8 @@ class ClientHomegear(Client):
         return False
 
     @service(re_raise=False)
-    async def fetch_all_device_data(self) -> None:
-        """Fetch all device data from CCU."""
+    async def fetch_all_device_data(self, since: datetime | None = None) -> None:
+        """Fetch all device data from CCU, or only the data changed since the timestamp."""
         return
 
     @service(re_raise=False, measure_performance=True)
@@ -1540,14 +2000,27 @@ class _ClientConfig:
         self.interface: Final = interface_config.interface
         self.interface_id: Final = interface_config.interface_id
         self.max_read_workers: Final[int] = central.config.max_read_workers
+        self.multicall_batch_size: Final[int] = central.config.multicall_batch_size
+        self.command_burst_size: Final[int] = central.config.command_burst_size
+        self.command_rate_limit: Final[float] = central.config.command_rate_limit
+        self.max_background_reads: Final[int] = central.config.max_background_reads
         self.has_credentials: Final[bool] = (
             central.config.username is not None and central.config.password is not None
         )
-        self.init_url: Final[str] = f"http://{central.config.callback_host
+        self.rpc_protocol: Final = interface_config.rpc_protocol
+        callback_host = (
+            central.config.callback_host
             if central.config.callback_host
-            else central.callback_ip_addr}:{central.config.callback_port
-            if central.config.callback_port
-            else central.listen_port}"
+            else central.callback_ip_addr
+        )
+        callback_port = (
+            central.config.callback_port if central.config.callback_port else central.listen_port
+        )
+        self.init_url: Final[str] = (
+            f"xmlrpc_bin://{callback_host}:{central.bin_rpc_listen_port}"
+            if self.rpc_protocol == RpcProtocol.BIN_RPC
+            else f"http://{callback_host}:{callback_port}"
+        )
         self.xml_rpc_uri: Final = build_xml_rpc_uri(
             host=central.config.host,
             port=interface_config.port,
@@ -1590,11 +2063,13 @@ class _ClientConfig:
                 return cast(str, await check_proxy.getVersion())
         except Exception as ex:
             raise NoConnectionException(f"Unable to connect {reduce_args(args=ex.args)}.") from ex
+        finally:
+            await check_proxy.stop()
         return "0"
 
     async def get_xml_rpc_proxy(
         self, auth_enabled: bool | None = None, max_workers: int = DEFAULT_MAX_WORKERS
-    ) -> XmlRpcProxy:
+    ) -> BaseXmlRpcProxy:
         """Return a XmlRPC proxy for backend communication."""
         central_config = self.central.config
         xml_rpc_headers = (
@@ -1605,19 +2080,47 @@ class _ClientConfig:
             if auth_enabled
             else []
         )
-        xml_proxy = XmlRpcProxy(
-            max_workers=max_workers,
-            interface_id=self.interface_id,
-            connection_state=central_config.connection_state,
-            uri=self.xml_rpc_uri,
-            headers=xml_rpc_headers,
-            tls=central_config.tls,
-            verify_tls=central_config.verify_tls,
-        )
-        await xml_proxy.do_init()
+        xml_proxy: BaseXmlRpcProxy
+        if self.rpc_protocol == RpcProtocol.BIN_RPC:
+            xml_proxy = BinRpcProxy(
+                interface_id=self.interface_id,
+                connection_state=central_config.connection_state,
+                host=central_config.host,
+                port=cast(int, self.interface_config.port),
+                headers=xml_rpc_headers,
+                tls=central_config.tls,
+                verify_tls=central_config.verify_tls,
+            )
+        elif central_config.xml_rpc_proxy_type == XmlRpcProxyType.ASYNC:
+            xml_proxy = AioHttpXmlRpcProxy(
+                interface_id=self.interface_id,
+                connection_state=central_config.connection_state,
+                uri=self.xml_rpc_uri,
+                headers=xml_rpc_headers,
+                client_session=central_config.client_session,
+                tls=central_config.tls,
+                verify_tls=central_config.verify_tls,
+                decoder_type=central_config.xml_rpc_decoder_type,
+            )
+        else:
+            xml_proxy = XmlRpcProxy(
+                max_workers=max_workers,
+                interface_id=self.interface_id,
+                connection_state=central_config.connection_state,
+                uri=self.xml_rpc_uri,
+                headers=xml_rpc_headers,
+                tls=central_config.tls,
+                verify_tls=central_config.verify_tls,
+                decoder_type=central_config.xml_rpc_decoder_type,
+            )
+        try:
+            await xml_proxy.do_init()
+        except BaseException:
+            await xml_proxy.stop()
+            raise
         return xml_proxy
 
-    async def _get_simple_xml_rpc_proxy(self) -> XmlRpcProxy:
+    async def _get_simple_xml_rpc_proxy(self) -> BaseXmlRpcProxy:
         """Return a XmlRPC proxy for backend communication."""
         return await self.get_xml_rpc_proxy(auth_enabled=True, max_workers=0)
 
@@ -1631,12 +2134,14 @@ class InterfaceConfig:
         interface: Interface,
         port: int | None = None,
         remote_path: str | None = None,
+        rpc_protocol: RpcProtocol = DEFAULT_RPC_PROTOCOL,
     ) -> None:
         """Init the interface config."""
         self.interface: Final[Interface] = interface
         self.interface_id: Final[str] = f"{central_name}-{self.interface}"
         self.port: Final = port
         self.remote_path: Final = remote_path
+        self.rpc_protocol: Final = rpc_protocol
         self._init_validate()
         self._enabled: bool = True
 
@@ -0,0 +1,366 @@
+"""
+Implementation of the BIN-RPC protocol and a proxy for the BIN-RPC communication.
+
+BIN-RPC is the binary counterpart of XML-RPC, that is spoken by rfd, HMIPServer
+and Homegear. A message starts with b"Bin" and the message type, followed by the
+length and the data. A request contains the method name and the params, a response
+a single value. All integers are big endian. Values are prefixed by their type:
+
+- integer: int32
+- boolean: uint8
+- string: uint32 length and the ISO-8859-1 encoded text
+- double: int32 mantissa (scaled by 0x40000000) and int32 exponent
+- base64: uint32 length and the base64 encoded text
+- integer64: int64 (Homegear)
+- array: uint32 count and the values
+- struct: uint32 count and per member the name (like a string without type) and the value
+
+A request can carry headers (e.g. for the authorization), that are placed in front
+of the data.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+from collections.abc import Iterable, Mapping
+import errno
+import logging
+import math
+import struct
+import sys
+from typing import Any, Final
+import xmlrpc.client
+
+from hahomematic import central as hmcu, config
+from hahomematic.client.xml_rpc import BaseXmlRpcProxy
+from hahomematic.const import DEFAULT_MAX_XML_RPC_CONNECTIONS
+from hahomematic.support import get_tls_context
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+_ENCODING_ISO_8859_1: Final = "ISO-8859-1"
+_MAX_MESSAGE_SIZE: Final = 64 * 1024 * 1024
+_PREFIX: Final = b"Bin"
+# doubles are transferred with about 9 significant digits
+_SIGNIFICANT_DIGITS: Final = 9
+
+MESSAGE_FAULT: Final = 0xFF
+MESSAGE_REQUEST: Final = 0x00
+MESSAGE_RESPONSE: Final = 0x01
+_MESSAGE_REQUEST_WITH_HEADERS: Final = 0x40
+_MESSAGE_RESPONSE_WITH_HEADERS: Final = 0x41
+
+_TYPE_ARRAY: Final = 0x100
+_TYPE_BASE64: Final = 0x11
+_TYPE_BOOLEAN: Final = 0x02
+_TYPE_DOUBLE: Final = 0x04
+_TYPE_INTEGER: Final = 0x01
+_TYPE_INTEGER64: Final = 0xD1
+_TYPE_STRING: Final = 0x03
+_TYPE_STRUCT: Final = 0x101
+
+_DOUBLE: Final = struct.Struct(">ii")
+_INT32: Final = struct.Struct(">i")
+_INT64: Final = struct.Struct(">q")
+_UINT32: Final = struct.Struct(">I")
+
+_INT32_MAX: Final = 2**31 - 1
+_INT32_MIN: Final = -(2**31)
+_MANTISSA_SCALE: Final = 0x40000000
+
+_FAULT_CODE: Final = "faultCode"
+_FAULT_STRING: Final = "faultString"
+
+
+def _encode_string(buffer: bytearray, value: str) -> None:
+    """Encode a string without type."""
+    data = value.encode(_ENCODING_ISO_8859_1, "replace")
+    buffer += _UINT32.pack(len(data))
+    buffer += data
+
+
+def _encode_value(buffer: bytearray, value: Any) -> None:
+    """Encode a value with its type."""
+    if value is None:
+        # BIN-RPC has no nil, like the CCU an empty string is sent
+        value = ""
+    if isinstance(value, str):
+        buffer += _UINT32.pack(_TYPE_STRING)
+        _encode_string(buffer=buffer, value=value)
+    elif isinstance(value, bool):
+        buffer += _UINT32.pack(_TYPE_BOOLEAN)
+        buffer.append(1 if value else 0)
+    elif isinstance(value, int):
+        if _INT32_MIN <= value <= _INT32_MAX:
+            buffer += _UINT32.pack(_TYPE_INTEGER)
+            buffer += _INT32.pack(value)
+        else:
+            buffer += _UINT32.pack(_TYPE_INTEGER64)
+            buffer += _INT64.pack(value)
+    elif isinstance(value, float):
+        mantissa, exponent = math.frexp(value)
+        buffer += _UINT32.pack(_TYPE_DOUBLE)
+        buffer += _DOUBLE.pack(int(mantissa * _MANTISSA_SCALE), exponent)
+    elif isinstance(value, Mapping):
+        buffer += _UINT32.pack(_TYPE_STRUCT)
+        buffer += _UINT32.pack(len(value))
+        for name, member in value.items():
+            _encode_string(buffer=buffer, value=str(name))
+            _encode_value(buffer=buffer, value=member)
+    elif isinstance(value, list | tuple):
+        buffer += _UINT32.pack(_TYPE_ARRAY)
+        buffer += _UINT32.pack(len(value))
+        for item in value:
+            _encode_value(buffer=buffer, value=item)
+    elif isinstance(value, bytes | bytearray | xmlrpc.client.Binary):
+        data = value.data if isinstance(value, xmlrpc.client.Binary) else value
+        buffer += _UINT32.pack(_TYPE_BASE64)
+        _encode_string(buffer=buffer, value=base64.b64encode(data).decode("ascii"))
+    else:
+        raise TypeError(f"BIN-RPC: Cannot marshal {type(value).__name__} objects")
+
+
+def _encode_message(
+    message_type: int, data: bytes | bytearray, headers: Iterable[tuple[str, str]] = ()
+) -> bytes:
+    """Encode a message with the optional headers."""
+    if header_items := tuple(headers):
+        header = bytearray(_UINT32.pack(len(header_items)))
+        for name, value in header_items:
+            _encode_string(buffer=header, value=name)
+            _encode_string(buffer=header, value=value)
+        return b"".join(
+            (
+                _PREFIX,
+                bytes((message_type | _MESSAGE_REQUEST_WITH_HEADERS,)),
+                _UINT32.pack(len(header)),
+                header,
+                _UINT32.pack(len(data)),
+                data,
+            )
+        )
+    return b"".join((_PREFIX, bytes((message_type,)), _UINT32.pack(len(data)), data))
+
+
+def encode_request(
+    method: str, params: Iterable[Any], headers: Iterable[tuple[str, str]] = ()
+) -> bytes:
+    """Encode a request."""
+    buffer = bytearray()
+    _encode_string(buffer=buffer, value=method)
+    params = tuple(params)
+    buffer += _UINT32.pack(len(params))
+    for param in params:
+        _encode_value(buffer=buffer, value=param)
+    return _encode_message(message_type=MESSAGE_REQUEST, data=buffer, headers=headers)
+
+
+def encode_response(value: Any) -> bytes:
+    """Encode a response."""
+    buffer = bytearray()
+    _encode_value(buffer=buffer, value=value)
+    return _encode_message(message_type=MESSAGE_RESPONSE, data=buffer)
+
+
+def encode_fault(fault_code: int, fault_string: str) -> bytes:
+    """Encode a fault response."""
+    buffer = bytearray()
+    _encode_value(buffer=buffer, value={_FAULT_CODE: fault_code, _FAULT_STRING: fault_string})
+    return _encode_message(message_type=MESSAGE_FAULT, data=buffer)
+
+
+def _to_double(mantissa: int, exponent: int) -> float:
+    """Return the value of a double rounded to the transferred precision."""
+    if (value := math.ldexp(mantissa / _MANTISSA_SCALE, exponent)) == 0:
+        return 0.0
+    return round(value, _SIGNIFICANT_DIGITS - 1 - math.floor(math.log10(abs(value))))
+
+
+def _decode_string(data: bytes, offset: int) -> tuple[str, int]:
+    """Decode a string without type."""
+    (length,) = _UINT32.unpack_from(data, offset)
+    offset += 4
+    if offset + length > len(data):
+        raise xmlrpc.client.ResponseError("BIN-RPC: String exceeds the message")
+    return data[offset : offset + length].decode(_ENCODING_ISO_8859_1), offset + length
+
+
+def _decode_value(data: bytes, offset: int) -> tuple[Any, int]:
+    """Decode a value with its type."""
+    (value_type,) = _UINT32.unpack_from(data, offset)
+    offset += 4
+    if value_type == _TYPE_STRING:
+        return _decode_string(data=data, offset=offset)
+    if value_type == _TYPE_INTEGER:
+        return _INT32.unpack_from(data, offset)[0], offset + 4
+    if value_type == _TYPE_BOOLEAN:
+        return data[offset] != 0, offset + 1
+    if value_type == _TYPE_DOUBLE:
+        mantissa, exponent = _DOUBLE.unpack_from(data, offset)
+        return _to_double(mantissa=mantissa, exponent=exponent), offset + 8
+    if value_type == _TYPE_STRUCT:
+        (count,) = _UINT32.unpack_from(data, offset)
+        offset += 4
+        members: dict[str, Any] = {}
+        for _ in range(count):
+            name, offset = _decode_string(data=data, offset=offset)
+            members[sys.intern(name)], offset = _decode_value(data=data, offset=offset)
+        return members, offset
+    if value_type == _TYPE_ARRAY:
+        (count,) = _UINT32.unpack_from(data, offset)
+        offset += 4
+        items: list[Any] = []
+        for _ in range(count):
+            item, offset = _decode_value(data=data, offset=offset)
+            items.append(item)
+        return items, offset
+    if value_type == _TYPE_INTEGER64:
+        return _INT64.unpack_from(data, offset)[0], offset + 8
+    if value_type == _TYPE_BASE64:
+        text, offset = _decode_string(data=data, offset=offset)
+        return xmlrpc.client.Binary(base64.b64decode(text)), offset
+    raise xmlrpc.client.ResponseError(f"BIN-RPC: Unknown type {value_type:#x}")
+
+
+def decode_request(data: bytes) -> tuple[str, tuple[Any, ...]]:
+    """Decode the data of a request into the method name and the params."""
+    try:
+        method, offset = _decode_string(data=data, offset=0)
+        (count,) = _UINT32.unpack_from(data, offset)
+        offset += 4
+        params: list[Any] = []
+        for _ in range(count):
+            param, offset = _decode_value(data=data, offset=offset)
+            params.append(param)
+    except (struct.error, IndexError) as err:
+        raise xmlrpc.client.ResponseError(f"BIN-RPC: Truncated request: {err}") from err
+    return method, tuple(params)
+
+
+def decode_response(message_type: int, data: bytes) -> Any:
+    """Decode the data of a response, or raise the fault of the response."""
+    try:
+        value = _decode_value(data=data, offset=0)[0] if data else ""
+    except (struct.error, IndexError) as err:
+        raise xmlrpc.client.ResponseError(f"BIN-RPC: Truncated response: {err}") from err
+    if message_type == MESSAGE_FAULT:
+        if not isinstance(value, dict):
+            raise xmlrpc.client.ResponseError("BIN-RPC: Invalid fault response")
+        raise xmlrpc.client.Fault(value.get(_FAULT_CODE, -1), value.get(_FAULT_STRING, ""))
+    return value
+
+
+def _decode_headers(data: bytes) -> dict[str, str]:
+    """Decode the headers of a message."""
+    (count,) = _UINT32.unpack_from(data, 0)
+    offset = 4
+    headers: dict[str, str] = {}
+    for _ in range(count):
+        name, offset = _decode_string(data=data, offset=offset)
+        headers[name], offset = _decode_string(data=data, offset=offset)
+    return headers
+
+
+async def _read_length(reader: asyncio.StreamReader) -> int:
+    """Read the length of a message part."""
+    if (length := int(_UINT32.unpack(await reader.readexactly(4))[0])) > _MAX_MESSAGE_SIZE:
+        raise xmlrpc.client.ResponseError(f"BIN-RPC: Message too large ({length} bytes)")
+    return length
+
+
+async def read_message(reader: asyncio.StreamReader) -> tuple[int, dict[str, str], bytes]:
+    """Read a message, and return the message type, the headers and the data."""
+    prefix = await reader.readexactly(4)
+    if prefix[:3] != _PREFIX:
+        raise xmlrpc.client.ResponseError("BIN-RPC: Invalid message prefix")
+    message_type = prefix[3]
+    headers: dict[str, str] = {}
+    if message_type in (_MESSAGE_REQUEST_WITH_HEADERS, _MESSAGE_RESPONSE_WITH_HEADERS):
+        message_type &= ~_MESSAGE_REQUEST_WITH_HEADERS
+        try:
+            headers = _decode_headers(
+                data=await reader.readexactly(await _read_length(reader=reader))
+            )
+        except (struct.error, IndexError) as err:
+            raise xmlrpc.client.ResponseError(f"BIN-RPC: Invalid headers: {err}") from err
+    return message_type, headers, await reader.readexactly(await _read_length(reader=reader))
+
+
+class BinRpcProxy(BaseXmlRpcProxy):
+    """
+    BIN-RPC proxy based on asyncio streams.
+
+    The connections are kept open and reused for the next requests.
+    Each connection handles one request at a time, so up to max_connections
+    requests can be in flight at the same time.
+    """
+
+    def __init__(
+        self,
+        interface_id: str,
+        connection_state: hmcu.CentralConnectionState,
+        host: str,
+        port: int,
+        headers: list[tuple[str, str]],
+        max_connections: int = DEFAULT_MAX_XML_RPC_CONNECTIONS,
+        tls: bool = False,
+        verify_tls: bool = True,
+    ) -> None:
+        """Initialize the proxy."""
+        super().__init__(interface_id=interface_id, connection_state=connection_state)
+        self._host: Final = host
+        self._port: Final = port
+        self._headers: Final = tuple(headers)
+        self._tls_context: Final = get_tls_context(verify_tls) if tls else None
+        self._semaphore: Final = asyncio.Semaphore(max_connections)
+        self._idle_connections: Final[list[tuple[asyncio.StreamReader, asyncio.StreamWriter]]] = []
+
+    async def _do_request(self, methodname: str, params: tuple[Any, ...]) -> Any:
+        """Send the request to the backend."""
+        request = encode_request(method=methodname, params=params, headers=self._headers)
+        async with self._semaphore:
+            # retry once with a new connection, if the backend closed a kept open connection
+            for attempt in (0, 1):
+                reused = not attempt and bool(self._idle_connections)
+                reader, writer = (
+                    self._idle_connections.pop()
+                    if reused
+                    else await asyncio.wait_for(
+                        asyncio.open_connection(
+                            host=self._host, port=self._port, ssl=self._tls_context
+                        ),
+                        timeout=config.TIMEOUT,
+                    )
+                )
+                try:
+                    writer.write(request)
+                    await writer.drain()
+                    message_type, _, data = await asyncio.wait_for(
+                        read_message(reader=reader), timeout=config.TIMEOUT
+                    )
+                except (asyncio.IncompleteReadError, ConnectionResetError) as err:
+                    writer.close()
+                    if reused:
+                        # the other kept open connections are most likely closed too
+                        self._close_idle_connections()
+                        continue
+                    raise ConnectionResetError(
+                        errno.ECONNRESET, f"Server disconnected: {err}"
+                    ) from err
+                except BaseException:
+                    writer.close()
+                    raise
+                self._idle_connections.append((reader, writer))
+                break
+        return decode_response(message_type=message_type, data=data)
+
+    def _close_idle_connections(self) -> None:
+        """Close the kept open connections."""
+        while self._idle_connections:
+            _, writer = self._idle_connections.pop()
+            writer.close()
+
+    async def stop(self) -> None:
+        """Stop depending services."""
+        self._close_idle_connections()
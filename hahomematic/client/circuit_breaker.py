@@ -0,0 +1,96 @@
+"""
+Circuit breaker for the reconnects of a client.
+
+After a failed reconnect the circuit opens, and no reconnect is attempted
+until a backoff has passed. The backoff grows exponentially with the
+number of consecutive failures up to a cap, and is jittered, so that the
+clients of several centrals and interfaces do not hammer a rebooting
+backend in lockstep. After the backoff, a single probe is allowed
+(half open), that closes the circuit on success or opens it again.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import logging
+import random
+import time
+from typing import Final
+
+from hahomematic.const import CircuitBreakerState
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """Circuit breaker with jittered exponential backoff."""
+
+    def __init__(
+        self,
+        interface_id: str,
+        base_delay: float,
+        max_delay: float,
+        on_state_change: Callable[[CircuitBreakerState, float], None] | None = None,
+    ) -> None:
+        """Init the circuit breaker."""
+        self._interface_id: Final = interface_id
+        self._base_delay: Final = base_delay
+        self._max_delay: Final = max_delay
+        self._on_state_change: Final = on_state_change
+        self._state: CircuitBreakerState = CircuitBreakerState.CLOSED
+        self._failure_count: int = 0
+        self._retry_at: float = 0.0
+
+    @property
+    def failure_count(self) -> int:
+        """Return the number of consecutive failures."""
+        return self._failure_count
+
+    @property
+    def retry_in(self) -> float:
+        """Return the seconds until the next probe is allowed."""
+        if self._state != CircuitBreakerState.OPEN:
+            return 0.0
+        return max(0.0, self._retry_at - time.monotonic())
+
+    @property
+    def state(self) -> CircuitBreakerState:
+        """Return the state of the circuit breaker."""
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Return if a reconnect may be attempted. An open circuit turns half open after the backoff."""
+        if self._state == CircuitBreakerState.OPEN:
+            if time.monotonic() < self._retry_at:
+                return False
+            self._set_state(state=CircuitBreakerState.HALF_OPEN)
+        return True
+
+    def record_failure(self) -> None:
+        """Record a failed reconnect, and open the circuit for the backoff."""
+        self._failure_count += 1
+        delay = min(self._max_delay, self._base_delay * 2 ** (self._failure_count - 1))
+        # equal jitter: keep at least half of the backoff
+        delay = random.uniform(delay / 2, delay)  # noqa: S311
+        self._retry_at = time.monotonic() + delay
+        _LOGGER.debug(
+            "RECORD_FAILURE: Reconnect of %s failed %i times. Next attempt in %.1fs",
+            self._interface_id,
+            self._failure_count,
+            delay,
+        )
+        self._set_state(state=CircuitBreakerState.OPEN, retry_in=delay)
+
+    def record_success(self) -> None:
+        """Record a successful reconnect, and close the circuit."""
+        self._failure_count = 0
+        self._retry_at = 0.0
+        self._set_state(state=CircuitBreakerState.CLOSED)
+
+    def _set_state(self, state: CircuitBreakerState, retry_in: float = 0.0) -> None:
+        """Set the state, and notify about changes."""
+        if self._state == state and state != CircuitBreakerState.OPEN:
+            return
+        self._state = state
+        if self._on_state_change:
+            self._on_state_change(state, retry_in)
@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable, Coroutine
 from datetime import datetime
 from enum import StrEnum
 from json import JSONDecodeError
 import logging
+import math
 import os
 from pathlib import Path
 from ssl import SSLContext
 from typing import Any, Final
+from urllib.parse import unquote
 
 from aiohttp import (
     ClientConnectorCertificateError,
@@ -21,14 +25,22 @@ from aiohttp import (
 import orjson
 
 from hahomematic import central as hmcu, config
-from hahomematic.async_support import Looper
+from hahomematic.async_support import Looper, SingleFlight
+from hahomematic.client.json_rpc_decoder import (
+    DeviceDataDecoder,
+    JsonRpcResponseDecoder,
+    JsonRpcResultDecoder,
+    add_device_data_value,
+)
 from hahomematic.const import (
+    DEFAULT_MAX_JSON_RPC_CONCURRENCY,
     DESCRIPTIONS_ERROR_MESSAGE,
     EXTENDED_SYSVAR_MARKER,
     HTMLTAG_PATTERN,
     PATH_JSON_RPC,
     REGA_SCRIPT_PATH,
     UTF8,
+    BootstrapData,
     DeviceDescription,
     Interface,
     ParameterData,
@@ -52,6 +64,10 @@ from hahomematic.support import get_tls_context, parse_sys_var, reduce_args
 
 _LOGGER: Final = logging.getLogger(__name__)
 
+_ENCODING_ISO_8859_1: Final = "ISO-8859-1"
+_DELTA_AGE_MARGIN: Final = 2  # timestamps of the backend have a resolution of seconds
+_STREAM_CHUNK_SIZE: Final = 65536
+
 
 class _JsonKey(StrEnum):
     """Enum for homematic json keys."""
@@ -59,23 +75,31 @@ class _JsonKey(StrEnum):
     ADDRESS = "address"
     CHANNEL_IDS = "channelIds"
     DESCRIPTION = "description"
+    DEVICE_DATA = "deviceData"
+    DEVICE_DETAILS = "deviceDetails"
     ERROR = "error"
+    FUNCTIONS = "functions"
     ID = "id"
     INTERFACE = "interface"
+    INTERFACES = "interfaces"
     IS_ACTIVE = "isActive"
     IS_INTERNAL = "isInternal"
     LAST_EXECUTE_TIME = "lastExecuteTime"
+    MAX_AGE = "max_age"
     MAX_VALUE = "maxValue"
     MESSAGE = "message"
     MIN_VALUE = "minValue"
     NAME = "name"
     PARAMSET_KEY = "paramsetKey"
     PASSWORD = "password"
+    PROGRAMS = "programs"
     RESULT = "result"
+    ROOMS = "rooms"
     SCRIPT = "script"
     SERIAL = "serial"
     SESSION_ID = "_session_id_"
     SET = "set"
+    SYSTEM_VARIABLES = "systemVariables"
     TYPE = "type"
     UNIT = "unit"
     USERNAME = "username"
@@ -117,6 +141,37 @@ class _JsonRpcMethod(StrEnum):
     SYSVAR_SET_FLOAT = "SysVar.setFloat"
 
 
+# Identical concurrent requests of these methods and scripts share one response.
+_READ_METHODS: Final[frozenset[str]] = frozenset(
+    (
+        _JsonRpcMethod.CHANNEL_HAS_PROGRAM_IDS,
+        _JsonRpcMethod.DEVICE_LIST_ALL_DETAIL,
+        _JsonRpcMethod.INTERFACE_GET_DEVICE_DESCRIPTION,
+        _JsonRpcMethod.INTERFACE_GET_MASTER_VALUE,
+        _JsonRpcMethod.INTERFACE_GET_PARAMSET,
+        _JsonRpcMethod.INTERFACE_GET_PARAMSET_DESCRIPTION,
+        _JsonRpcMethod.INTERFACE_GET_VALUE,
+        _JsonRpcMethod.INTERFACE_LIST_DEVICES,
+        _JsonRpcMethod.INTERFACE_LIST_INTERFACES,
+        _JsonRpcMethod.PROGRAM_GET_ALL,
+        _JsonRpcMethod.ROOM_GET_ALL,
+        _JsonRpcMethod.SUBSECTION_GET_ALL,
+        _JsonRpcMethod.SYSVAR_GET_ALL,
+        _JsonRpcMethod.SYSVAR_GET_VALUE_BY_NAME,
+    )
+)
+_READ_SCRIPTS: Final[frozenset[str]] = frozenset(
+    (
+        RegaScript.FETCH_ALL_DEVICE_DATA,
+        RegaScript.FETCH_ALL_DEVICE_DATA_DELTA,
+        RegaScript.GET_BOOTSTRAP_DATA,
+        RegaScript.GET_PROGRAM_DESCRIPTIONS,
+        RegaScript.GET_SERIAL,
+        RegaScript.GET_SYSTEM_VARIABLE_DESCRIPTIONS,
+    )
+)
+
+
 class JsonRpcAioHttpClient:
     """Connection to CCU JSON-RPC Server."""
 
@@ -129,9 +184,15 @@ class JsonRpcAioHttpClient:
         client_session: ClientSession | None = None,
         tls: bool = False,
         verify_tls: bool = False,
+        max_concurrency: int = DEFAULT_MAX_JSON_RPC_CONCURRENCY,
     ) -> None:
         """Session setup."""
         self._client_session: Final = client_session
+        self._max_concurrency: Final = max(1, max_concurrency)
+        self._concurrency: Final = asyncio.Semaphore(self._max_concurrency)
+        self._session_lock: Final = asyncio.Lock()
+        self._requests_in_flight: int = 0
+        self._max_requests_in_flight: int = 0
         self._connection_state: Final = connection_state
         self._username: Final = username
         self._password: Final = password
@@ -143,13 +204,30 @@ class JsonRpcAioHttpClient:
         self._last_session_id_refresh: datetime | None = None
         self._session_id: str | None = None
         self._supported_methods: tuple[str, ...] | None = None
+        self._single_flight: Final = SingleFlight()
 
     @property
     def is_activated(self) -> bool:
         """If session exists, then it is activated."""
         return self._session_id is not None
 
+    @property
+    def max_concurrency(self) -> int:
+        """Return the max number of concurrent requests."""
+        return self._max_concurrency
+
+    @property
+    def max_requests_in_flight(self) -> int:
+        """Return the max number of requests, that have been in flight at the same time."""
+        return self._max_requests_in_flight
+
     async def _login_or_renew(self) -> bool:
+        """Renew JSON-RPC session or perform login."""
+        # concurrent requests wait for the first one and reuse the validated session id
+        async with self._session_lock:
+            return await self._do_login_or_renew()
+
+    async def _do_login_or_renew(self) -> bool:
         """Renew JSON-RPC session or perform login."""
         if not self.is_activated:
             self._session_id = await self._do_login()
@@ -212,6 +290,35 @@ class JsonRpcAioHttpClient:
 
         return session_id
 
+    @property
+    def single_flight(self) -> SingleFlight:
+        """Return the single flight helper with the statistics of the shared requests."""
+        return self._single_flight
+
+    async def run_concurrently(
+        self, *calls: Callable[[], Coroutine[Any, Any, Any]]
+    ) -> tuple[Any, ...]:
+        """
+        Run independent calls concurrently over the shared client session.
+
+        The session is validated once before, so that all calls reuse the session id.
+        The number of requests in flight is limited by max_concurrency.
+        Return the results in the order of the calls. If a call fails, the others are cancelled.
+        """
+        await self._login_or_renew()
+        tasks: list[asyncio.Task[Any]] = [
+            asyncio.create_task(call(), name=f"json-rpc-call-{index}")
+            for index, call in enumerate(calls)
+        ]
+        try:
+            return tuple(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            # wait for the cancelled calls, so that none of them outlives the failed call
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
     async def _post(
         self,
         method: _JsonRpcMethod,
@@ -220,6 +327,31 @@ class JsonRpcAioHttpClient:
         keep_session: bool = True,
     ) -> dict[str, Any] | Any:
         """Reusable JSON-RPC POST function."""
+        if keep_session and method in _READ_METHODS:
+            return await self._single_flight.run(
+                key=(method, _get_params_key(extra_params=extra_params), use_default_params),
+                call=lambda: self._do_post_with_session(
+                    method=method,
+                    extra_params=extra_params,
+                    use_default_params=use_default_params,
+                    keep_session=keep_session,
+                ),
+            )
+        return await self._do_post_with_session(
+            method=method,
+            extra_params=extra_params,
+            use_default_params=use_default_params,
+            keep_session=keep_session,
+        )
+
+    async def _do_post_with_session(
+        self,
+        method: _JsonRpcMethod,
+        extra_params: dict[_JsonKey, Any] | None,
+        use_default_params: bool,
+        keep_session: bool,
+    ) -> dict[str, Any] | Any:
+        """Login or renew the session and post the request."""
         if keep_session:
             await self._login_or_renew()
             session_id = self._session_id
@@ -254,8 +386,34 @@ class JsonRpcAioHttpClient:
         script_name: str,
         extra_params: dict[_JsonKey, Any] | None = None,
         keep_session: bool = True,
+        result_decoder: Callable[[], JsonRpcResultDecoder] | None = None,
     ) -> dict[str, Any] | Any:
         """Reusable JSON-RPC POST_SCRIPT function."""
+        if keep_session and script_name in _READ_SCRIPTS:
+            return await self._single_flight.run(
+                key=(script_name, _get_params_key(extra_params=extra_params)),
+                call=lambda: self._do_post_script_with_session(
+                    script_name=script_name,
+                    extra_params=extra_params,
+                    keep_session=keep_session,
+                    result_decoder=result_decoder,
+                ),
+            )
+        return await self._do_post_script_with_session(
+            script_name=script_name,
+            extra_params=extra_params,
+            keep_session=keep_session,
+            result_decoder=result_decoder,
+        )
+
+    async def _do_post_script_with_session(
+        self,
+        script_name: str,
+        extra_params: dict[_JsonKey, Any] | None,
+        keep_session: bool,
+        result_decoder: Callable[[], JsonRpcResultDecoder] | None = None,
+    ) -> dict[str, Any] | Any:
+        """Login or renew the session and post the script."""
         if keep_session:
             await self._login_or_renew()
             session_id = self._session_id
@@ -280,12 +438,14 @@ class JsonRpcAioHttpClient:
             session_id=session_id,
             method=method,
             extra_params={_JsonKey.SCRIPT: script},
+            result_decoder=result_decoder,
         )
 
         _LOGGER.debug("POST_SCRIPT: method: %s [%s]", method, script_name)
 
         try:
-            if not response[_JsonKey.ERROR]:
+            # a streamed result is already decoded
+            if not response[_JsonKey.ERROR] and result_decoder is None:
                 response[_JsonKey.RESULT] = orjson.loads(response[_JsonKey.RESULT])
         finally:
             if not keep_session:
@@ -318,6 +478,7 @@ class JsonRpcAioHttpClient:
         method: _JsonRpcMethod,
         extra_params: dict[_JsonKey, Any] | None = None,
         use_default_params: bool = True,
+        result_decoder: Callable[[], JsonRpcResultDecoder] | None = None,
     ) -> dict[str, Any] | Any:
         """Reusable JSON-RPC POST function."""
         if not self._client_session:
@@ -339,20 +500,32 @@ class JsonRpcAioHttpClient:
                 "Content-Length": str(len(payload)),
             }
 
-            if (
-                response := await self._client_session.post(
-                    self._url,
-                    data=payload,
-                    headers=headers,
-                    timeout=ClientTimeout(total=config.TIMEOUT),
-                    ssl=self._tls_context,
+            async with self._concurrency:
+                self._requests_in_flight += 1
+                self._max_requests_in_flight = max(
+                    self._max_requests_in_flight, self._requests_in_flight
                 )
-            ) is None:
-                raise ClientException("POST method failed with no response")
+                try:
+                    if (
+                        response := await self._client_session.post(
+                            self._url,
+                            data=payload,
+                            headers=headers,
+                            timeout=ClientTimeout(total=config.TIMEOUT),
+                            ssl=self._tls_context,
+                        )
+                    ) is None:
+                        raise ClientException("POST method failed with no response")
+                    if result_decoder is None:
+                        json_response = await self._get_json_reponse(response=response)
+                    else:
+                        json_response = await self._get_streamed_json_response(
+                            response=response, result_decoder=result_decoder()
+                        )
+                finally:
+                    self._requests_in_flight -= 1
 
             if response.status == 200:
-                json_response = await self._get_json_reponse(response=response)
-
                 if error := json_response[_JsonKey.ERROR]:
                     error_message = error[_JsonKey.MESSAGE]
                     message = f"POST method '{method}' failed: {error_message}"
@@ -369,7 +542,6 @@ class JsonRpcAioHttpClient:
                 return json_response
 
             message = f"Status: {response.status}"
-            json_response = await self._get_json_reponse(response=response)
             if error := json_response[_JsonKey.ERROR]:
                 error_message = error[_JsonKey.MESSAGE]
                 message = f"{message}: {error_message}"
@@ -405,6 +577,15 @@ class JsonRpcAioHttpClient:
             # Workaround for bug in CCU
             return orjson.loads((await response.read()).decode(UTF8))
 
+    async def _get_streamed_json_response(
+        self, response: ClientResponse, result_decoder: JsonRpcResultDecoder
+    ) -> dict[str, Any]:
+        """Return the json object from response, with the result decoded while reading."""
+        decoder = JsonRpcResponseDecoder(result_decoder=result_decoder)
+        async for chunk in response.content.iter_chunked(_STREAM_CHUNK_SIZE):
+            decoder.feed(chunk)
+        return decoder.close()
+
     async def logout(self) -> None:
         """Logout of CCU."""
         try:
@@ -521,67 +702,19 @@ class JsonRpcAioHttpClient:
         self, include_internal: bool
     ) -> tuple[SystemVariableData, ...]:
         """Get all system variables from CCU / Homegear."""
-        variables: list[SystemVariableData] = []
-
-        response = await self._post(
-            method=_JsonRpcMethod.SYSVAR_GET_ALL,
+        response, descriptions = await self.run_concurrently(
+            lambda: self._post(method=_JsonRpcMethod.SYSVAR_GET_ALL),
+            self._get_system_variable_descriptions,
         )
 
         _LOGGER.debug("GET_ALL_SYSTEM_VARIABLES: Getting all system variables")
         if json_result := response[_JsonKey.RESULT]:
-            descriptions = await self._get_system_variable_descriptions()
-            for var in json_result:
-                is_internal = var[_JsonKey.IS_INTERNAL]
-                if include_internal is False and is_internal is True:
-                    continue
-                extended_sysvar = False
-                var_id = var[_JsonKey.ID]
-                name = var[_JsonKey.NAME]
-                org_data_type = var[_JsonKey.TYPE]
-                raw_value = var[_JsonKey.VALUE]
-                if org_data_type == SysvarType.NUMBER:
-                    data_type = SysvarType.FLOAT if "." in raw_value else SysvarType.INTEGER
-                else:
-                    data_type = org_data_type
-                if (description := descriptions.get(var_id)) and (
-                    extended_sysvar := EXTENDED_SYSVAR_MARKER in description
-                ):
-                    description = description.replace(EXTENDED_SYSVAR_MARKER, "").strip()
-                unit = var[_JsonKey.UNIT]
-                values: tuple[str, ...] | None = None
-                if val_list := var.get(_JsonKey.VALUE_LIST):
-                    values = tuple(val_list.split(";"))
-                try:
-                    value = parse_sys_var(data_type=data_type, raw_value=raw_value)
-                    max_value = None
-                    if raw_max_value := var.get(_JsonKey.MAX_VALUE):
-                        max_value = parse_sys_var(data_type=data_type, raw_value=raw_max_value)
-                    min_value = None
-                    if raw_min_value := var.get(_JsonKey.MIN_VALUE):
-                        min_value = parse_sys_var(data_type=data_type, raw_value=raw_min_value)
-                    variables.append(
-                        SystemVariableData(
-                            vid=var_id,
-                            name=name,
-                            data_type=data_type,
-                            description=description,
-                            unit=unit,
-                            value=value,
-                            values=values,
-                            max_value=max_value,
-                            min_value=min_value,
-                            extended_sysvar=extended_sysvar,
-                        )
-                    )
-                except (ValueError, TypeError) as vterr:
-                    _LOGGER.warning(
-                        "GET_ALL_SYSTEM_VARIABLES failed: %s [%s] Failed to parse SysVar %s ",
-                        vterr.__class__.__name__,
-                        reduce_args(args=vterr.args),
-                        name,
-                    )
-
-        return tuple(variables)
+            return _parse_system_variables(
+                json_result=json_result,
+                descriptions=descriptions,
+                include_internal=include_internal,
+            )
+        return ()
 
     async def _get_program_descriptions(self) -> dict[str, str]:
         """Get all program descriptions from CCU via script."""
@@ -624,49 +757,21 @@ class JsonRpcAioHttpClient:
 
     async def get_all_channel_ids_room(self) -> dict[str, set[str]]:
         """Get all channel_ids per room from CCU / Homegear."""
-        channel_ids_room: dict[str, set[str]] = {}
-
         response = await self._post(
             method=_JsonRpcMethod.ROOM_GET_ALL,
         )
 
         _LOGGER.debug("GET_ALL_CHANNEL_IDS_PER_ROOM: Getting all rooms")
-        if json_result := response[_JsonKey.RESULT]:
-            for room in json_result:
-                room_id = room[_JsonKey.ID]
-                room_name = room[_JsonKey.NAME]
-                if room_id not in channel_ids_room:
-                    channel_ids_room[room_id] = set()
-                channel_ids_room[room_id].add(room_name)
-                for channel_id in room[_JsonKey.CHANNEL_IDS]:
-                    if channel_id not in channel_ids_room:
-                        channel_ids_room[channel_id] = set()
-                    channel_ids_room[channel_id].add(room_name)
-
-        return channel_ids_room
+        return _get_names_by_channel_id(json_result=response[_JsonKey.RESULT])
 
     async def get_all_channel_ids_function(self) -> dict[str, set[str]]:
         """Get all channel_ids per function from CCU / Homegear."""
-        channel_ids_function: dict[str, set[str]] = {}
-
         response = await self._post(
             method=_JsonRpcMethod.SUBSECTION_GET_ALL,
         )
 
         _LOGGER.debug("GET_ALL_CHANNEL_IDS_PER_FUNCTION: Getting all functions")
-        if json_result := response[_JsonKey.RESULT]:
-            for function in json_result:
-                function_id = function[_JsonKey.ID]
-                function_name = function[_JsonKey.NAME]
-                if function_id not in channel_ids_function:
-                    channel_ids_function[function_id] = set()
-                channel_ids_function[function_id].add(function_name)
-                for channel_id in function[_JsonKey.CHANNEL_IDS]:
-                    if channel_id not in channel_ids_function:
-                        channel_ids_function[channel_id] = set()
-                    channel_ids_function[channel_id].add(function_name)
-
-        return channel_ids_function
+        return _get_names_by_channel_id(json_result=response[_JsonKey.RESULT])
 
     async def get_device_description(
         self, interface: Interface, address: str
@@ -889,15 +994,31 @@ class JsonRpcAioHttpClient:
 
         return parameter_data
 
-    async def get_all_device_data(self, interface: Interface) -> dict[str, Any]:
-        """Get the all device data of the backend."""
-        all_device_data: dict[str, dict[str, dict[str, Any]]] = {}
-        params = {
+    async def get_all_device_data(
+        self, interface: Interface, since: datetime | None = None
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Get the all device data of the backend by channel address and parameter.
+
+        If since is set, only the data, that has changed since then, is returned.
+        """
+        all_device_data: dict[str, dict[str, Any]] = {}
+        params: dict[_JsonKey, Any] = {
             _JsonKey.INTERFACE: interface,
         }
+        script_name = RegaScript.FETCH_ALL_DEVICE_DATA
+        if since is not None:
+            # the age is used, because the clock of the backend may differ
+            params[_JsonKey.MAX_AGE] = str(
+                math.ceil((datetime.now() - since).total_seconds()) + _DELTA_AGE_MARGIN
+            )
+            script_name = RegaScript.FETCH_ALL_DEVICE_DATA_DELTA
         try:
+            # the large result is decoded while it is read
             response = await self._post_script(
-                script_name=RegaScript.FETCH_ALL_DEVICE_DATA, extra_params=params
+                script_name=script_name,
+                extra_params=params,
+                result_decoder=DeviceDataDecoder,
             )
 
             _LOGGER.debug(
@@ -913,39 +1034,78 @@ class JsonRpcAioHttpClient:
 
         return all_device_data
 
+    async def get_bootstrap_data(
+        self,
+        interfaces: tuple[Interface, ...],
+        include_internal_programs: bool,
+        include_internal_sysvars: bool,
+    ) -> BootstrapData:
+        """Get the data, that is required on the start of a central, in one request."""
+        params = {
+            _JsonKey.INTERFACES: "\t".join(interfaces),
+        }
+        try:
+            response = await self._post_script(
+                script_name=RegaScript.GET_BOOTSTRAP_DATA, extra_params=params
+            )
+        except JSONDecodeError as err:
+            raise ClientException(
+                f"GET_BOOTSTRAP_DATA failed: Unable to decode json: {reduce_args(args=err.args)}"
+            ) from err
+
+        _LOGGER.debug("GET_BOOTSTRAP_DATA: Getting the bootstrap data")
+        if not (json_result := response[_JsonKey.RESULT]):
+            raise ClientException("GET_BOOTSTRAP_DATA failed: No data received")
+
+        all_device_data: dict[Interface, dict[str, dict[str, Any]]] = {}
+        for interface in interfaces:
+            if (device_data := json_result[_JsonKey.DEVICE_DATA].get(interface)) is None:
+                continue
+            interface_data: dict[str, dict[str, Any]] = {}
+            all_device_data[interface] = interface_data
+            for key, value in device_data.items():
+                add_device_data_value(device_data=interface_data, key=key, value=value)
+
+        system_variables = _unquote_texts(json_result[_JsonKey.SYSTEM_VARIABLES])
+        programs = _unquote_texts(json_result[_JsonKey.PROGRAMS])
+        return BootstrapData(
+            device_details=tuple(_unquote_texts(json_result[_JsonKey.DEVICE_DETAILS])),
+            channel_ids_room=_get_names_by_channel_id(
+                json_result=_unquote_texts(json_result[_JsonKey.ROOMS])
+            ),
+            channel_ids_function=_get_names_by_channel_id(
+                json_result=_unquote_texts(json_result[_JsonKey.FUNCTIONS])
+            ),
+            all_device_data=all_device_data,
+            system_variables=_parse_system_variables(
+                json_result=system_variables,
+                descriptions={
+                    var[_JsonKey.ID]: var[_JsonKey.DESCRIPTION] for var in system_variables
+                },
+                include_internal=include_internal_sysvars,
+            ),
+            programs=_parse_programs(
+                json_result=programs,
+                descriptions={prog[_JsonKey.ID]: prog[_JsonKey.DESCRIPTION] for prog in programs},
+                include_internal=include_internal_programs,
+            ),
+        )
+
     async def get_all_programs(self, include_internal: bool) -> tuple[ProgramData, ...]:
         """Get the all programs of the backend."""
-        all_programs: list[ProgramData] = []
-
-        response = await self._post(
-            method=_JsonRpcMethod.PROGRAM_GET_ALL,
+        response, descriptions = await self.run_concurrently(
+            lambda: self._post(method=_JsonRpcMethod.PROGRAM_GET_ALL),
+            self._get_program_descriptions,
         )
 
         _LOGGER.debug("GET_ALL_PROGRAMS: Getting all programs")
         if json_result := response[_JsonKey.RESULT]:
-            descriptions = await self._get_program_descriptions()
-            for prog in json_result:
-                is_internal = prog[_JsonKey.IS_INTERNAL]
-                if include_internal is False and is_internal is True:
-                    continue
-                pid = prog[_JsonKey.ID]
-                description = descriptions.get(pid)
-                name = prog[_JsonKey.NAME]
-                is_active = prog[_JsonKey.IS_ACTIVE]
-                last_execute_time = prog[_JsonKey.LAST_EXECUTE_TIME]
-
-                all_programs.append(
-                    ProgramData(
-                        pid=pid,
-                        name=name,
-                        description=description,
-                        is_active=is_active,
-                        is_internal=is_internal,
-                        last_execute_time=last_execute_time,
-                    )
-                )
-
-        return tuple(all_programs)
+            return _parse_programs(
+                json_result=json_result,
+                descriptions=descriptions,
+                include_internal=include_internal,
+            )
+        return ()
 
     async def is_present(self, interface: Interface) -> bool:
         """Get value from CCU."""
@@ -980,7 +1140,7 @@ class JsonRpcAioHttpClient:
         """Get the supported methods of the backend."""
         supported_methods: tuple[str, ...] = ()
 
-        await self._login_or_renew()
+        await self._do_login_or_renew()
         if not (session_id := self._session_id):
             raise ClientException("Error while logging in")
 
@@ -1002,8 +1162,9 @@ class JsonRpcAioHttpClient:
 
     async def _check_supported_methods(self) -> bool:
         """Check, if all required api methods are supported by backend."""
-        if self._supported_methods is None:
-            self._supported_methods = await self._get_supported_methods()
+        async with self._session_lock:
+            if self._supported_methods is None:
+                self._supported_methods = await self._get_supported_methods()
         if unsupport_methods := tuple(
             method for method in _JsonRpcMethod if method not in self._supported_methods
         ):
@@ -1017,12 +1178,24 @@ class JsonRpcAioHttpClient:
     async def get_system_information(self) -> SystemInformation:
         """Get system information of the backend."""
 
-        if (auth_enabled := await self._get_auth_enabled()) is not None and (
+        # the requests are independent, and are sent together
+        (
+            auth_enabled,
+            available_interfaces,
+            https_redirect_enabled,
+            serial,
+        ) = await self.run_concurrently(
+            self._get_auth_enabled,
+            self._list_interfaces,
+            self._get_https_redirect_enabled,
+            self._get_serial,
+        )
+        if auth_enabled is not None and (
             system_information := SystemInformation(
                 auth_enabled=auth_enabled,
-                available_interfaces=await self._list_interfaces(),
-                https_redirect_enabled=await self._get_https_redirect_enabled(),
-                serial=await self._get_serial(),
+                available_interfaces=available_interfaces,
+                https_redirect_enabled=https_redirect_enabled,
+                serial=serial,
             )
         ):
             return system_information
@@ -1109,3 +1282,127 @@ def _get_params(
         params.update(extra_params)
 
     return {str(key): str(value) for key, value in params.items()}
+
+
+def _get_params_key(extra_params: dict[_JsonKey, Any] | None) -> tuple[tuple[str, str], ...]:
+    """Return a hashable key of the params of a request."""
+    if not extra_params:
+        return ()
+    return tuple(sorted((str(key), str(value)) for key, value in extra_params.items()))
+
+
+def _parse_system_variables(
+    json_result: list[dict[str, Any]], descriptions: dict[str, str], include_internal: bool
+) -> tuple[SystemVariableData, ...]:
+    """Return the system variables of a SysVar.getAll result."""
+    variables: list[SystemVariableData] = []
+    for var in json_result:
+        is_internal = var[_JsonKey.IS_INTERNAL]
+        if include_internal is False and is_internal is True:
+            continue
+        extended_sysvar = False
+        var_id = var[_JsonKey.ID]
+        name = var[_JsonKey.NAME]
+        org_data_type = var[_JsonKey.TYPE]
+        raw_value = var[_JsonKey.VALUE]
+        if org_data_type == SysvarType.NUMBER:
+            data_type = SysvarType.FLOAT if "." in raw_value else SysvarType.INTEGER
+        else:
+            data_type = org_data_type
+        if (description := descriptions.get(var_id)) and (
+            extended_sysvar := EXTENDED_SYSVAR_MARKER in description
+        ):
+            description = description.replace(EXTENDED_SYSVAR_MARKER, "").strip()
+        unit = var[_JsonKey.UNIT]
+        values: tuple[str, ...] | None = None
+        if val_list := var.get(_JsonKey.VALUE_LIST):
+            values = tuple(val_list.split(";"))
+        try:
+            value = parse_sys_var(data_type=data_type, raw_value=raw_value)
+            max_value = None
+            if raw_max_value := var.get(_JsonKey.MAX_VALUE):
+                max_value = parse_sys_var(data_type=data_type, raw_value=raw_max_value)
+            min_value = None
+            if raw_min_value := var.get(_JsonKey.MIN_VALUE):
+                min_value = parse_sys_var(data_type=data_type, raw_value=raw_min_value)
+            variables.append(
+                SystemVariableData(
+                    vid=var_id,
+                    name=name,
+                    data_type=data_type,
+                    description=description,
+                    unit=unit,
+                    value=value,
+                    values=values,
+                    max_value=max_value,
+                    min_value=min_value,
+                    extended_sysvar=extended_sysvar,
+                )
+            )
+        except (ValueError, TypeError) as vterr:
+            _LOGGER.warning(
+                "GET_ALL_SYSTEM_VARIABLES failed: %s [%s] Failed to parse SysVar %s ",
+                vterr.__class__.__name__,
+                reduce_args(args=vterr.args),
+                name,
+            )
+    return tuple(variables)
+
+
+def _parse_programs(
+    json_result: list[dict[str, Any]], descriptions: dict[str, str], include_internal: bool
+) -> tuple[ProgramData, ...]:
+    """Return the programs of a Program.getAll result."""
+    all_programs: list[ProgramData] = []
+    for prog in json_result:
+        is_internal = prog[_JsonKey.IS_INTERNAL]
+        if include_internal is False and is_internal is True:
+            continue
+        pid = prog[_JsonKey.ID]
+        description = descriptions.get(pid)
+        name = prog[_JsonKey.NAME]
+        is_active = prog[_JsonKey.IS_ACTIVE]
+        last_execute_time = prog[_JsonKey.LAST_EXECUTE_TIME]
+
+        all_programs.append(
+            ProgramData(
+                pid=pid,
+                name=name,
+                description=description,
+                is_active=is_active,
+                is_internal=is_internal,
+                last_execute_time=last_execute_time,
+            )
+        )
+    return tuple(all_programs)
+
+
+def _get_names_by_channel_id(json_result: list[dict[str, Any]] | None) -> dict[str, set[str]]:
+    """Return the names of the rooms / functions by the ids of their channels."""
+    names_by_channel_id: dict[str, set[str]] = {}
+    for item in json_result or ():
+        item_id = item[_JsonKey.ID]
+        item_name = item[_JsonKey.NAME]
+        if item_id not in names_by_channel_id:
+            names_by_channel_id[item_id] = set()
+        names_by_channel_id[item_id].add(item_name)
+        for channel_id in item[_JsonKey.CHANNEL_IDS]:
+            if channel_id not in names_by_channel_id:
+                names_by_channel_id[channel_id] = set()
+            names_by_channel_id[channel_id].add(item_name)
+    return names_by_channel_id
+
+
+def _unquote_texts(data: Any) -> Any:
+    """Return the data with the url encoded texts of a rega script decoded."""
+    if isinstance(data, str):
+        try:
+            return unquote(data, errors="strict")
+        except UnicodeDecodeError:
+            # older backends encode the texts with ISO-8859-1
+            return unquote(data, encoding=_ENCODING_ISO_8859_1)
+    if isinstance(data, list):
+        return [_unquote_texts(item) for item in data]
+    if isinstance(data, dict):
+        return {key: _unquote_texts(value) for key, value in data.items()}
+    return data
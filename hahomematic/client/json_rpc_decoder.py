@@ -0,0 +1,262 @@
+"""
+Incremental decoders for the JSON-RPC responses of the backend.
+
+The result of a Rega script is returned by the backend as one JSON string, that
+contains the JSON output of the script. The response decoder unescapes the result
+string while the response is read, and feeds it to a result decoder. So neither the
+response body nor the result string have to be kept in memory as a whole.
+"""
+
+from __future__ import annotations
+
+import codecs
+from json import JSONDecodeError
+import re
+import sys
+from typing import Any, Final, Protocol
+
+import orjson
+
+from hahomematic.const import UTF8
+
+_KEY_RESULT: Final = "result"
+# characters and complete escape sequences of a json string, the surrogate pairs are not split
+_RESULT_PART: Final = re.compile(
+    r"(?:[^\"\\]+|\\[\"\\/bfnrt]|\\u[dD][89abAB][0-9a-fA-F]{2}\\u[dD][c-fC-F][0-9a-fA-F]{2}"
+    r"|\\u(?![dD][89abAB])[0-9a-fA-F]{4})*"
+)
+_WHITESPACE: Final = " \t\r\n"
+# "<interface>.<address>%3A<channel_no>.<parameter>":<value> followed by , or }
+_DEVICE_DATA_ENTRY: Final = re.compile(
+    r'\s*"([^"]*)"\s*:\s*("(?:[^"\\]|\\.)*"|[^\s,}"]+)\s*([,}])', re.DOTALL
+)
+
+
+class JsonRpcResultDecoder(Protocol):
+    """Protocol for a decoder of the result string of a response."""
+
+    def feed(self, data: str) -> None:
+        """Feed a part of the result string to the decoder."""
+
+    def close(self) -> Any:
+        """Return the decoded result."""
+
+
+class JsonRpcResponseDecoder:
+    """
+    Incremental decoder of a JSON-RPC response.
+
+    The string value of the result member is fed to the result decoder.
+    All other members are small, and are decoded when they are complete.
+    """
+
+    def __init__(self, result_decoder: JsonRpcResultDecoder) -> None:
+        """Init the response decoder."""
+        self._result_decoder: Final = result_decoder
+        self._text_decoder: Final = codecs.getincrementaldecoder(UTF8)()
+        self._response: Final[dict[str, Any]] = {}
+        self._buffer = ""
+        self._state = self._expect_object
+        self._key = ""
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._value_end = 0
+
+    def feed(self, data: bytes) -> None:
+        """Feed a chunk of the response body to the decoder."""
+        self._decode(text=self._text_decoder.decode(data))
+
+    def close(self) -> dict[str, Any]:
+        """Return the response, with the decoded result as result member."""
+        self._decode(text=self._text_decoder.decode(b"", final=True))
+        if self._state != self._done or self._buffer.strip(_WHITESPACE):
+            raise JSONDecodeError("Incomplete JSON-RPC response", self._buffer, 0)
+        return self._response
+
+    def _decode(self, text: str) -> None:
+        """Decode the buffered text as far as possible."""
+        self._buffer += text
+        pos = 0
+        while pos < len(self._buffer) and (new_pos := self._state(pos)) is not None:
+            pos = new_pos
+        self._buffer = self._buffer[pos:]
+
+    def _skip_whitespace(self, pos: int) -> int:
+        """Return the position of the next character, that is no whitespace."""
+        while pos < len(self._buffer) and self._buffer[pos] in _WHITESPACE:
+            pos += 1
+        return pos
+
+    def _error(self, pos: int) -> JSONDecodeError:
+        """Return the error for an unexpected character."""
+        return JSONDecodeError("Unexpected character in JSON-RPC response", self._buffer, pos)
+
+    def _expect_object(self, pos: int) -> int | None:
+        """Consume the start of the response object."""
+        if (pos := self._skip_whitespace(pos)) == len(self._buffer):
+            return None
+        if self._buffer[pos] != "{":
+            raise self._error(pos)
+        self._state = self._expect_key
+        return pos + 1
+
+    def _expect_key(self, pos: int) -> int | None:
+        """Consume a member key, or the end of the response object."""
+        if (pos := self._skip_whitespace(pos)) == len(self._buffer):
+            return None
+        if self._buffer[pos] == "}":
+            self._state = self._done
+            return pos + 1
+        if self._buffer[pos] != '"':
+            raise self._error(pos)
+        if (end := self._buffer.find('"', pos + 1)) == -1:
+            return None
+        self._key = self._buffer[pos + 1 : end]
+        self._state = self._expect_colon
+        return end + 1
+
+    def _expect_colon(self, pos: int) -> int | None:
+        """Consume the colon between key and value."""
+        if (pos := self._skip_whitespace(pos)) == len(self._buffer):
+            return None
+        if self._buffer[pos] != ":":
+            raise self._error(pos)
+        self._state = self._expect_value
+        return pos + 1
+
+    def _expect_value(self, pos: int) -> int | None:
+        """Consume the start of a member value."""
+        if (pos := self._skip_whitespace(pos)) == len(self._buffer):
+            return None
+        if self._key == _KEY_RESULT and self._buffer[pos] == '"':
+            self._state = self._in_result
+            return pos + 1
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._value_end = pos
+        self._state = self._in_value
+        return pos
+
+    def _in_value(self, pos: int) -> int | None:
+        """Consume a complete member value, that is not the result string."""
+        end = self._value_end
+        while end < len(self._buffer):
+            char = self._buffer[end]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]" and self._depth > 0:
+                self._depth -= 1
+            elif char in ",}":
+                self._response[self._key] = orjson.loads(self._buffer[pos:end])
+                self._state = self._expect_separator
+                return end
+            end += 1
+        # keep the incomplete value in the buffer
+        self._value_end = end - pos
+        return None
+
+    def _in_result(self, pos: int) -> int | None:
+        """Feed the unescaped complete part of the result string to the result decoder."""
+        if (end := _get_result_part_end(buffer=self._buffer, pos=pos)) > pos:
+            self._result_decoder.feed(orjson.loads(f'"{self._buffer[pos:end]}"'))
+        if end < len(self._buffer) and self._buffer[end] == '"':
+            self._response[self._key] = self._result_decoder.close()
+            self._state = self._expect_separator
+            return end + 1
+        # keep the incomplete escape sequence in the buffer
+        if end == len(self._buffer) or len(self._buffer) - end < 12:
+            return end if end > pos else None
+        raise self._error(end)
+
+    def _expect_separator(self, pos: int) -> int | None:
+        """Consume the separator after a member value."""
+        if (pos := self._skip_whitespace(pos)) == len(self._buffer):
+            return None
+        if self._buffer[pos] == ",":
+            self._state = self._expect_key
+            return pos + 1
+        if self._buffer[pos] == "}":
+            self._state = self._done
+            return pos + 1
+        raise self._error(pos)
+
+    def _done(self, pos: int) -> int | None:
+        """Ignore the trailing whitespace."""
+        if (pos := self._skip_whitespace(pos)) == len(self._buffer):
+            return pos
+        raise self._error(pos)
+
+
+def _get_result_part_end(buffer: str, pos: int) -> int:
+    """Return the end of the complete characters and escape sequences of the result string."""
+    return match.end() if (match := _RESULT_PART.match(buffer, pos)) else pos
+
+
+class DeviceDataDecoder:
+    """
+    Incremental decoder of the output of the fetch_all_device_data script.
+
+    The values are stored by channel address and parameter. The interface prefix
+    and the url encoding of the keys are not kept, and the parameter names are
+    interned, because they repeat in every channel.
+    """
+
+    def __init__(self) -> None:
+        """Init the device data decoder."""
+        self._device_data: Final[dict[str, dict[str, Any]]] = {}
+        self._buffer = ""
+        self._started = False
+        self._done = False
+
+    def feed(self, data: str) -> None:
+        """Feed a part of the script output to the decoder."""
+        buffer = self._buffer + data
+        pos = 0
+        if not self._started:
+            if not (stripped := buffer.lstrip()):
+                self._buffer = ""
+                return
+            if stripped[0] != "{":
+                raise JSONDecodeError("Unexpected start of device data", buffer, 0)
+            pos = len(buffer) - len(stripped) + 1
+            self._started = True
+        # empty object
+        if not self._device_data and buffer[pos:].lstrip().startswith("}"):
+            self._done = True
+        while not self._done and (match := _DEVICE_DATA_ENTRY.match(buffer, pos)):
+            self._add_entry(key=match.group(1), raw_value=match.group(2))
+            self._done = match.group(3) == "}"
+            pos = match.end()
+        self._buffer = buffer[pos:] if not self._done else ""
+
+    def close(self) -> dict[str, dict[str, Any]]:
+        """Return the device data by channel address and parameter."""
+        if self._buffer.strip() or (self._started and not self._done):
+            raise JSONDecodeError("Incomplete device data", self._buffer, 0)
+        return self._device_data
+
+    def _add_entry(self, key: str, raw_value: str) -> None:
+        """Add a value to the device data."""
+        add_device_data_value(
+            device_data=self._device_data, key=key, value=orjson.loads(raw_value)
+        )
+
+
+def add_device_data_value(device_data: dict[str, dict[str, Any]], key: str, value: Any) -> None:
+    """Add a value with a key of the fetch_all_device_data script to the device data."""
+    address_key, _, parameter = key.rpartition(".")
+    channel_address = address_key.partition(".")[2].replace("%3A", ":")
+    if (channel_values := device_data.get(channel_address)) is None:
+        channel_values = device_data[channel_address] = {}
+    channel_values[sys.intern(parameter)] = value
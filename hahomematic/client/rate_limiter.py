@@ -0,0 +1,137 @@
+"""
+Rate limiter for the commands sent to the backend.
+
+BidCos-RF and HmIP-RF may only use 1% of the airtime per hour (duty cycle).
+The rate limiter paces the commands of an interface with a token bucket,
+and reduces the rate and the burst size, when the duty cycle level
+reported by the backend rises.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Final
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+# duty cycle levels in percent
+_THROTTLE_START_LEVEL: Final = 60.0
+_THROTTLE_FULL_LEVEL: Final = 95.0
+_MIN_RATE_FACTOR: Final = 0.05
+
+
+class CommandRateLimiter:
+    """Token bucket for the commands of an interface, that adapts to the duty cycle."""
+
+    def __init__(self, interface_id: str, rate: float, burst_size: int) -> None:
+        """Init the rate limiter."""
+        self._interface_id: Final = interface_id
+        self._rate: Final = rate
+        self._burst_size: Final = burst_size
+        self._lock: Final = asyncio.Lock()
+        self._tokens: float = burst_size
+        self._updated_at: float = time.monotonic()
+        self._duty_cycle_level: float | None = None
+        self._waiting: int = 0
+        self._sent_count: int = 0
+        self._delayed_count: int = 0
+        self._total_delay: float = 0.0
+        self._max_delay: float = 0.0
+
+    @property
+    def current_burst_size(self) -> float:
+        """Return the number of commands, that can be sent without delay at the current duty cycle."""
+        return max(1.0, self._burst_size * self._rate_factor)
+
+    @property
+    def current_rate(self) -> float:
+        """Return the commands per second at the current duty cycle."""
+        return self._rate * self._rate_factor
+
+    @property
+    def delayed_count(self) -> int:
+        """Return the number of commands, that have been delayed."""
+        return self._delayed_count
+
+    @property
+    def duty_cycle_level(self) -> float | None:
+        """Return the last duty cycle level in percent reported by the backend."""
+        return self._duty_cycle_level
+
+    @property
+    def max_delay(self) -> float:
+        """Return the max delay of a command in seconds."""
+        return self._max_delay
+
+    @property
+    def sent_count(self) -> int:
+        """Return the number of commands, that passed the rate limiter."""
+        return self._sent_count
+
+    @property
+    def total_delay(self) -> float:
+        """Return the sum of the delays of all commands in seconds."""
+        return self._total_delay
+
+    @property
+    def waiting(self) -> int:
+        """Return the number of commands, that are waiting to be sent."""
+        return self._waiting
+
+    @property
+    def _rate_factor(self) -> float:
+        """Return the factor for the rate at the current duty cycle."""
+        if self._duty_cycle_level is None or self._duty_cycle_level <= _THROTTLE_START_LEVEL:
+            return 1.0
+        if self._duty_cycle_level >= _THROTTLE_FULL_LEVEL:
+            return _MIN_RATE_FACTOR
+        return 1.0 - (1.0 - _MIN_RATE_FACTOR) * (
+            (self._duty_cycle_level - _THROTTLE_START_LEVEL)
+            / (_THROTTLE_FULL_LEVEL - _THROTTLE_START_LEVEL)
+        )
+
+    def update_duty_cycle(self, value: Any) -> None:
+        """Update the duty cycle level in percent. Boolean duty cycle states of devices are ignored."""
+        if isinstance(value, bool) or not isinstance(value, int | float):
+            return
+        self._refill()
+        self._duty_cycle_level = float(value)
+        self._tokens = min(self._tokens, self.current_burst_size)
+        _LOGGER.debug(
+            "UPDATE_DUTY_CYCLE: Duty cycle of %s is %.1f%%. Rate is %.2f commands/s",
+            self._interface_id,
+            self._duty_cycle_level,
+            self.current_rate,
+        )
+
+    async def acquire(self) -> None:
+        """Wait until a command may be sent. Commands pass in the order of their arrival."""
+        self._waiting += 1
+        try:
+            async with self._lock:
+                self._refill()
+                if self._tokens < 1:
+                    delay = (1 - self._tokens) / self.current_rate
+                    self._delayed_count += 1
+                    self._total_delay += delay
+                    self._max_delay = max(self._max_delay, delay)
+                    _LOGGER.debug(
+                        "ACQUIRE: Delaying command for %s by %.2fs", self._interface_id, delay
+                    )
+                    await asyncio.sleep(delay)
+                    self._refill()
+                self._tokens -= 1
+                self._sent_count += 1
+        finally:
+            self._waiting -= 1
+
+    def _refill(self) -> None:
+        """Add the tokens for the time since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(
+            self.current_burst_size,
+            self._tokens + (now - self._updated_at) * self.current_rate,
+        )
+        self._updated_at = now
@@ -0,0 +1,136 @@
+"""
+Scheduler for the requests of a client to the backend.
+
+The requests are sent in priority lanes. Writes are always served first,
+interactive reads before background reads (periodic refreshes, firmware
+refreshes, exports), and queued background reads are held back, while
+writes are waiting or in flight. Each lane has its own concurrency limit,
+reads and background reads share the workers of the read proxy.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import logging
+import time
+from typing import Final
+
+from hahomematic.const import RequestLane
+from hahomematic.context import REQUEST_LANE_VAR
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+
+class RequestScheduler:
+    """Admission of the requests of an interface by priority lanes."""
+
+    def __init__(
+        self, interface_id: str, max_writes: int, max_reads: int, max_background_reads: int
+    ) -> None:
+        """Init the request scheduler."""
+        self._interface_id: Final = interface_id
+        self._max_reads: Final = max(1, max_reads)
+        self._limits: Final[dict[RequestLane, int]] = {
+            RequestLane.WRITE: max(1, max_writes),
+            RequestLane.READ: self._max_reads,
+            RequestLane.BACKGROUND: max(1, min(max_background_reads, self._max_reads)),
+        }
+        self._active: Final[dict[RequestLane, int]] = dict.fromkeys(RequestLane, 0)
+        self._waiters: Final[dict[RequestLane, deque[asyncio.Future[None]]]] = {
+            lane: deque() for lane in RequestLane
+        }
+        self._request_counts: Final[dict[RequestLane, int]] = dict.fromkeys(RequestLane, 0)
+        self._max_wait_times: Final[dict[RequestLane, float]] = dict.fromkeys(RequestLane, 0.0)
+
+    def get_active(self, lane: RequestLane) -> int:
+        """Return the number of requests in flight in a lane."""
+        return self._active[lane]
+
+    def get_limit(self, lane: RequestLane) -> int:
+        """Return the concurrency limit of a lane."""
+        return self._limits[lane]
+
+    def get_max_wait_time(self, lane: RequestLane) -> float:
+        """Return the max time in seconds, a request of a lane waited for admission."""
+        return self._max_wait_times[lane]
+
+    def get_request_count(self, lane: RequestLane) -> int:
+        """Return the number of requests, that have been admitted in a lane."""
+        return self._request_counts[lane]
+
+    def get_waiting(self, lane: RequestLane) -> int:
+        """Return the number of requests waiting in a lane."""
+        return sum(1 for future in self._waiters[lane] if not future.done())
+
+    @asynccontextmanager
+    async def lane(self, lane: RequestLane | None = None) -> AsyncIterator[None]:
+        """Run a request in a lane. Without a lane, the lane of the context is used."""
+        request_lane = REQUEST_LANE_VAR.get() if lane is None else lane
+        await self._acquire(lane=request_lane)
+        try:
+            yield
+        finally:
+            self._release(lane=request_lane)
+
+    async def _acquire(self, lane: RequestLane) -> None:
+        """Wait until a request may be sent in a lane."""
+        if not self._waiters[lane] and self._can_start(lane=lane):
+            self._start(lane=lane)
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters[lane].append(future)
+        start = time.monotonic()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # admitted, but cancelled before the request was sent
+                self._release(lane=lane)
+            else:
+                self._waiters[lane].remove(future)
+            raise
+        wait_time = time.monotonic() - start
+        self._max_wait_times[lane] = max(self._max_wait_times[lane], wait_time)
+        _LOGGER.debug(
+            "ACQUIRE: %s request for %s waited %.3fs", lane.name, self._interface_id, wait_time
+        )
+
+    def _can_start(self, lane: RequestLane) -> bool:
+        """Return if a request of a lane may be sent now."""
+        if self._active[lane] >= self._limits[lane]:
+            return False
+        if lane == RequestLane.WRITE:
+            return True
+        if (
+            self._active[RequestLane.READ] + self._active[RequestLane.BACKGROUND]
+            >= self._max_reads
+        ):
+            return False
+        if lane == RequestLane.BACKGROUND:
+            return not (
+                self._active[RequestLane.WRITE]
+                or self._waiters[RequestLane.WRITE]
+                or self._waiters[RequestLane.READ]
+            )
+        return True
+
+    def _release(self, lane: RequestLane) -> None:
+        """Release the slot of a request and admit the waiting requests by priority."""
+        self._active[lane] -= 1
+        for next_lane in RequestLane:
+            waiters = self._waiters[next_lane]
+            while waiters and self._can_start(lane=next_lane):
+                future = waiters.popleft()
+                if future.done():
+                    continue
+                self._start(lane=next_lane)
+                future.set_result(None)
+
+    def _start(self, lane: RequestLane) -> None:
+        """Occupy a slot of a lane."""
+        self._active[lane] += 1
+        self._request_counts[lane] += 1
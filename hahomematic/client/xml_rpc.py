@@ -1,18 +1,36 @@
-"""Implementation of a locking ServerProxy for XML-RPC communication."""
+"""Implementation of the proxies for XML-RPC communication."""
 
 from __future__ import annotations
 
+from abc import ABC, abstractmethod
 from collections.abc import Mapping
 from concurrent.futures import ThreadPoolExecutor
 from enum import Enum, IntEnum, StrEnum
 import errno
 import logging
-from ssl import SSLError
+from ssl import SSLContext, SSLError
 from typing import Any, Final
+import urllib.parse
 import xmlrpc.client
 
-from hahomematic import central as hmcu
+from aiohttp import (
+    ClientConnectorCertificateError,
+    ClientConnectorError,
+    ClientSession,
+    ClientTimeout,
+    ServerDisconnectedError,
+    TCPConnector,
+)
+
+from hahomematic import central as hmcu, config
 from hahomematic.async_support import Looper
+from hahomematic.client.xml_rpc_decoder import (
+    XmlRpcParser,
+    XmlRpcUnmarshaller,
+    decode_response,
+    get_parser,
+)
+from hahomematic.const import DEFAULT_MAX_XML_RPC_CONNECTIONS, XmlRpcDecoderType
 from hahomematic.exceptions import (
     AuthFailure,
     BaseHomematicException,
@@ -25,8 +43,12 @@ from hahomematic.support import get_tls_context, reduce_args
 _LOGGER: Final = logging.getLogger(__name__)
 
 _CONTEXT: Final = "context"
+_DECODER_TYPE: Final = "decoder_type"
 _ENCODING_ISO_8859_1: Final = "ISO-8859-1"
+_HEADERS: Final = "headers"
 _TLS: Final = "tls"
+_TRANSPORT: Final = "transport"
+_URI: Final = "uri"
 _VERIFY_TLS: Final = "verify_tls"
 
 
@@ -60,38 +82,18 @@ _OS_ERROR_CODES: Final[dict[int, str]] = {
 }
 
 
-# noinspection PyProtectedMember,PyUnresolvedReferences
-class XmlRpcProxy(xmlrpc.client.ServerProxy):
-    """ServerProxy implementation with ThreadPoolExecutor when request is executing."""
+class BaseXmlRpcProxy(ABC):
+    """Base class for the XML-RPC proxies with the common error handling."""
 
     def __init__(
         self,
-        max_workers: int,
         interface_id: str,
         connection_state: hmcu.CentralConnectionState,
-        *args: Any,
-        **kwargs: Any,
     ) -> None:
-        """Initialize new proxy for server and get local ip."""
+        """Initialize the proxy."""
         self.interface_id: Final = interface_id
         self._connection_state: Final = connection_state
-        self._looper: Final = Looper()
-        self._proxy_executor: Final = (
-            ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=interface_id)
-            if max_workers > 0
-            else None
-        )
-        self._tls: Final[bool] = kwargs.pop(_TLS, False)
-        self._verify_tls: Final[bool] = kwargs.pop(_VERIFY_TLS, True)
         self._supported_methods: tuple[str, ...] = ()
-        if self._tls:
-            kwargs[_CONTEXT] = get_tls_context(self._verify_tls)
-        xmlrpc.client.ServerProxy.__init__(  # type: ignore[misc]
-            self,
-            encoding=_ENCODING_ISO_8859_1,
-            *args,  # noqa: B026
-            **kwargs,
-        )
 
     async def do_init(self) -> None:
         """Init the xml rpc proxy."""
@@ -105,9 +107,8 @@ class XmlRpcProxy(xmlrpc.client.ServerProxy):
         """Return the supported methods."""
         return self._supported_methods
 
-    async def __async_request(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+    async def _async_request(self, *args, **kwargs):  # type: ignore[no-untyped-def]
         """Call method on server side."""
-        parent = xmlrpc.client.ServerProxy
         try:
             method = args[0]
             if self._supported_methods and method not in self._supported_methods:
@@ -121,14 +122,7 @@ class XmlRpcProxy(xmlrpc.client.ServerProxy):
             ):
                 args = _cleanup_args(*args)
                 _LOGGER.debug("__ASYNC_REQUEST: %s", args)
-                result = await self._looper.async_add_executor_job(
-                    # pylint: disable=protected-access
-                    parent._ServerProxy__request,  # type: ignore[attr-defined]
-                    self,
-                    *args,
-                    name="xmp_rpc_proxy",
-                    executor=self._proxy_executor,
-                )
+                result = await self._do_request(*args)
                 self._connection_state.remove_issue(issuer=self, iid=self.interface_id)
                 return result
             raise NoConnectionException(f"No connection to {self.interface_id}")
@@ -143,7 +137,7 @@ class XmlRpcProxy(xmlrpc.client.ServerProxy):
             raise NoConnectionException(message) from sslerr
         except OSError as ose:
             message = f"OSError on {self.interface_id}: {reduce_args(args=ose.args)}"
-            if ose.args[0] in _OS_ERROR_CODES:
+            if ose.args and ose.args[0] in _OS_ERROR_CODES:
                 if self._connection_state.add_issue(issuer=self, iid=self.interface_id):
                     _LOGGER.error(message)
                 else:
@@ -165,9 +159,71 @@ class XmlRpcProxy(xmlrpc.client.ServerProxy):
         except Exception as ex:
             raise ClientException(ex) from ex
 
+    @abstractmethod
+    async def _do_request(self, methodname: str, params: tuple[Any, ...]) -> Any:
+        """Send the request to the backend and return the result."""
+
     def __getattr__(self, *args, **kwargs):  # type: ignore[no-untyped-def]
         """Magic method dispatcher."""
-        return xmlrpc.client._Method(self.__async_request, *args, **kwargs)
+        return xmlrpc.client._Method(self._async_request, *args, **kwargs)
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """Stop depending services."""
+
+
+# noinspection PyProtectedMember,PyUnresolvedReferences
+class XmlRpcProxy(BaseXmlRpcProxy, xmlrpc.client.ServerProxy):
+    """ServerProxy implementation with ThreadPoolExecutor when request is executing."""
+
+    def __init__(
+        self,
+        max_workers: int,
+        interface_id: str,
+        connection_state: hmcu.CentralConnectionState,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize new proxy for server and get local ip."""
+        BaseXmlRpcProxy.__init__(
+            self, interface_id=interface_id, connection_state=connection_state
+        )
+        self._looper: Final = Looper()
+        self._proxy_executor: Final = (
+            ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=interface_id)
+            if max_workers > 0
+            else None
+        )
+        self._tls: Final[bool] = kwargs.pop(_TLS, False)
+        self._verify_tls: Final[bool] = kwargs.pop(_VERIFY_TLS, True)
+        decoder_type: XmlRpcDecoderType = kwargs.pop(_DECODER_TYPE, XmlRpcDecoderType.STANDARD)
+        if self._tls:
+            kwargs[_CONTEXT] = get_tls_context(self._verify_tls)
+        if decoder_type != XmlRpcDecoderType.STANDARD:
+            kwargs[_TRANSPORT] = _get_transport(
+                uri=kwargs[_URI] if _URI in kwargs else args[0],
+                decoder_type=decoder_type,
+                headers=kwargs.pop(_HEADERS, ()),
+                context=kwargs.pop(_CONTEXT, None),
+            )
+        xmlrpc.client.ServerProxy.__init__(  # type: ignore[misc]
+            self,
+            encoding=_ENCODING_ISO_8859_1,
+            *args,  # noqa: B026
+            **kwargs,
+        )
+
+    async def _do_request(self, methodname: str, params: tuple[Any, ...]) -> Any:
+        """Send the request to the backend within the executor."""
+        return await self._looper.async_add_executor_job(
+            # pylint: disable=protected-access
+            xmlrpc.client.ServerProxy._ServerProxy__request,  # type: ignore[attr-defined]
+            self,
+            methodname,
+            params,
+            name="xmp_rpc_proxy",
+            executor=self._proxy_executor,
+        )
 
     async def stop(self) -> None:
         """Stop depending services."""
@@ -176,6 +232,118 @@ class XmlRpcProxy(xmlrpc.client.ServerProxy):
             self._proxy_executor.shutdown()
 
 
+class AioHttpXmlRpcProxy(BaseXmlRpcProxy):
+    """
+    XML-RPC proxy based on aiohttp.
+
+    Requests are sent without an executor, so multiple requests can be in flight
+    at the same time. The connections are kept alive and reused for the next requests.
+    """
+
+    def __init__(
+        self,
+        interface_id: str,
+        connection_state: hmcu.CentralConnectionState,
+        uri: str,
+        headers: list[tuple[str, str]],
+        client_session: ClientSession | None = None,
+        max_connections: int = DEFAULT_MAX_XML_RPC_CONNECTIONS,
+        tls: bool = False,
+        verify_tls: bool = True,
+        decoder_type: XmlRpcDecoderType = XmlRpcDecoderType.STANDARD,
+    ) -> None:
+        """Initialize the proxy."""
+        super().__init__(interface_id=interface_id, connection_state=connection_state)
+        self._uri: Final = uri
+        self._decoder_type: Final = decoder_type
+        self._headers: Final = {**dict(headers), "Content-Type": "text/xml"}
+        self._tls_context: Final[SSLContext | bool] = get_tls_context(verify_tls) if tls else False
+        # Use a session with an own connection pool for the interface, if none is provided.
+        self._own_session: Final = client_session is None
+        self._client_session: Final = client_session or ClientSession(
+            connector=TCPConnector(limit=max_connections)
+        )
+
+    async def _do_request(self, methodname: str, params: tuple[Any, ...]) -> Any:
+        """Send the request to the backend."""
+        data = xmlrpc.client.dumps(
+            params, methodname=methodname, encoding=_ENCODING_ISO_8859_1
+        ).encode(_ENCODING_ISO_8859_1, "xmlcharrefreplace")
+        # retry once, if the backend closed a kept alive connection (like xmlrpc.client)
+        for attempt in (0, 1):
+            try:
+                async with self._client_session.post(
+                    self._uri,
+                    data=data,
+                    headers=self._headers,
+                    timeout=ClientTimeout(total=config.TIMEOUT),
+                    ssl=self._tls_context,
+                ) as response:
+                    if response.status != 200:
+                        raise xmlrpc.client.ProtocolError(
+                            self._uri,
+                            response.status,
+                            response.reason or "",
+                            dict(response.headers),
+                        )
+                    body = await response.read()
+                break
+            except ServerDisconnectedError as sde:
+                if attempt:
+                    raise ConnectionResetError(
+                        errno.ECONNRESET, f"Server disconnected: {sde}"
+                    ) from sde
+            except ClientConnectorCertificateError as ccce:
+                raise ccce.certificate_error from ccce
+            except ClientConnectorError as cce:
+                # raise the underlying error for the same handling as with xmlrpc.client
+                raise cce.os_error from cce
+        result = decode_response(data=body, decoder_type=self._decoder_type)
+        return result[0] if len(result) == 1 else result
+
+    async def stop(self) -> None:
+        """Stop depending services."""
+        if self._own_session and not self._client_session.closed:
+            await self._client_session.close()
+
+
+class _Transport(xmlrpc.client.Transport):
+    """Transport with a configurable decoder for the responses."""
+
+    def __init__(self, decoder_type: XmlRpcDecoderType, headers: Any) -> None:
+        """Init the transport."""
+        super().__init__(headers=headers)
+        self._decoder_type: Final = decoder_type
+
+    def getparser(self) -> tuple[XmlRpcParser, XmlRpcUnmarshaller]:  # type: ignore[override]
+        """Return the parser and the unmarshaller of the decoder."""
+        return get_parser(decoder_type=self._decoder_type)
+
+
+class _SafeTransport(xmlrpc.client.SafeTransport):
+    """Safe transport with a configurable decoder for the responses."""
+
+    def __init__(
+        self, decoder_type: XmlRpcDecoderType, headers: Any, context: SSLContext | None
+    ) -> None:
+        """Init the transport."""
+        super().__init__(headers=headers, context=context)
+        self._decoder_type: Final = decoder_type
+
+    def getparser(self) -> tuple[XmlRpcParser, XmlRpcUnmarshaller]:  # type: ignore[override]
+        """Return the parser and the unmarshaller of the decoder."""
+        return get_parser(decoder_type=self._decoder_type)
+
+
+def _get_transport(
+    uri: str, decoder_type: XmlRpcDecoderType, headers: Any, context: SSLContext | None
+) -> xmlrpc.client.Transport:
+    """Return the transport for an uri like ServerProxy, but with the decoder."""
+    if urllib.parse.urlsplit(uri).scheme == "https":
+        return _SafeTransport(decoder_type=decoder_type, headers=headers, context=context)
+    return _Transport(decoder_type=decoder_type, headers=headers)
+
+
 def _cleanup_args(*args: Any) -> Any:
     """Cleanup the type of args."""
     if len(args[1]) == 0:
@@ -194,6 +362,11 @@ def _cleanup_args(*args: Any) -> Any:
 
 def _cleanup_parameter(value: Any) -> Any:
     """Cleanup a single parameter."""
+    if isinstance(value, list):
+        # e.g. the calls of a system.multicall
+        return [_cleanup_parameter(value=data) for data in value]
+    if isinstance(value, dict):
+        return _cleanup_paramset(paramset=value)
     if isinstance(value, StrEnum):
         return str(value)
     if isinstance(value, IntEnum):
@@ -0,0 +1,203 @@
+"""
+Decoders for the XML-RPC responses of the backend.
+
+The standard decoder is the Unmarshaller of xmlrpc.client. The fast decoder
+builds the arrays and structs directly from the expat callbacks. It avoids
+the marks and the intermediate value stack of the Unmarshaller, and interns
+the member names, that repeat in every device and paramset description.
+Both decoders return the same Python structures.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from decimal import Decimal
+import sys
+from typing import Any, Final, Protocol
+from xml.parsers import expat
+import xmlrpc.client
+
+from hahomematic.const import XmlRpcDecoderType
+
+_ARRAY: Final = "array"
+_FAULT: Final = "fault"
+_NAME: Final = "name"
+_NIL: Final = "nil"
+_PARAMS: Final = "params"
+_STRUCT: Final = "struct"
+_VALUE: Final = "value"
+
+
+class XmlRpcParser(Protocol):
+    """Protocol for the parser part of a decoder."""
+
+    def feed(self, data: bytes | str) -> None:
+        """Feed data to the parser."""
+
+    def close(self) -> None:
+        """Finish the parsing."""
+
+
+class XmlRpcUnmarshaller(Protocol):
+    """Protocol for the unmarshaller part of a decoder."""
+
+    def close(self) -> tuple[Any, ...]:
+        """Return the decoded params, or raise the fault of the response."""
+
+
+def _to_bool(data: str) -> bool:
+    """Return the value of a boolean."""
+    if data == "0":
+        return False
+    if data == "1":
+        return True
+    raise TypeError("bad boolean value")
+
+
+def _to_binary(data: str) -> xmlrpc.client.Binary:
+    """Return the value of a base64."""
+    value = xmlrpc.client.Binary()
+    value.decode(data.encode("ascii"))
+    return value
+
+
+def _to_datetime(data: str) -> xmlrpc.client.DateTime:
+    """Return the value of a dateTime.iso8601."""
+    value = xmlrpc.client.DateTime()
+    value.decode(data)
+    return value
+
+
+_CONVERTERS: Final[dict[str, Callable[[str], Any]]] = {
+    "base64": _to_binary,
+    "bigdecimal": Decimal,
+    "biginteger": int,
+    "boolean": _to_bool,
+    "dateTime.iso8601": _to_datetime,
+    "double": float,
+    "float": float,
+    "i1": int,
+    "i2": int,
+    "i4": int,
+    "i8": int,
+    "int": int,
+    "string": str,
+}
+
+
+class FastUnmarshaller:
+    """Decoder, that builds the response directly from the expat callbacks."""
+
+    __slots__ = ("_containers", "_data", "_names", "_parser", "_response_type", "_value")
+
+    def __init__(self) -> None:
+        """Init the decoder."""
+        parser = expat.ParserCreate(None, None)
+        parser.buffer_text = True
+        parser.StartElementHandler = self._start
+        parser.EndElementHandler = self._end
+        parser.CharacterDataHandler = self._char_data
+        self._parser: expat.XMLParserType | None = parser
+        # the params of the response are collected in the root container
+        self._containers: list[list[Any] | dict[str, Any]] = [[]]
+        self._names: list[str] = []
+        self._data: list[str] = []
+        self._value: bool = False
+        self._response_type: str | None = None
+
+    def feed(self, data: bytes | str) -> None:
+        """Feed data to the parser."""
+        if self._parser is None:
+            raise xmlrpc.client.ResponseError
+        self._parser.Parse(data, False)
+
+    def close(self) -> tuple[Any, ...]:
+        """Finish the parsing, and return the decoded params."""
+        if (parser := self._parser) is not None:
+            # release the parser and its handlers, they reference the unmarshaller
+            self._parser = None
+            parser.Parse(b"", True)
+        if self._response_type is None or len(self._containers) != 1:
+            raise xmlrpc.client.ResponseError
+        params = self._containers[0]
+        if self._response_type == _FAULT:
+            raise xmlrpc.client.Fault(**params[0])  # type: ignore[index]
+        return tuple(params)
+
+    def _add(self, value: Any) -> None:
+        """Add a value to the current array or struct."""
+        self._value = False
+        container = self._containers[-1]
+        if type(container) is dict:
+            container[self._names.pop()] = value
+        else:
+            container.append(value)  # type: ignore[union-attr]
+
+    def _char_data(self, data: str) -> None:
+        """Collect the text of an element."""
+        self._data.append(data)
+
+    def _end(self, tag: str) -> None:
+        """Decode the end of an element."""
+        if ":" in tag:
+            tag = tag.split(":")[-1]
+        if (converter := _CONVERTERS.get(tag)) is not None:
+            self._add(converter("".join(self._data)))
+        elif tag == _VALUE:
+            # a value without a type is a string
+            if self._value:
+                self._add("".join(self._data))
+        elif tag == _NAME:
+            self._names.append(sys.intern("".join(self._data)))
+        elif tag in (_ARRAY, _STRUCT):
+            self._add(self._containers.pop())
+        elif tag == _NIL:
+            self._add(None)
+        elif tag in (_PARAMS, _FAULT):
+            self._response_type = tag
+
+    def _start(self, tag: str, attrs: dict[str, str]) -> None:
+        """Decode the start of an element."""
+        if ":" in tag:
+            tag = tag.split(":")[-1]
+        self._data = []
+        self._value = tag == _VALUE
+        if tag == _ARRAY:
+            self._containers.append([])
+        elif tag == _STRUCT:
+            self._containers.append({})
+
+
+class _FastParser:
+    """Parser part of the fast decoder."""
+
+    __slots__ = ("_unmarshaller",)
+
+    def __init__(self, unmarshaller: FastUnmarshaller) -> None:
+        """Init the parser."""
+        self._unmarshaller: Final = unmarshaller
+
+    def feed(self, data: bytes | str) -> None:
+        """Feed data to the parser."""
+        self._unmarshaller.feed(data)
+
+    def close(self) -> None:
+        """Finish the parsing within the close of the unmarshaller."""
+
+
+def get_parser(
+    decoder_type: XmlRpcDecoderType = XmlRpcDecoderType.STANDARD,
+) -> tuple[XmlRpcParser, XmlRpcUnmarshaller]:
+    """Return the parser and the unmarshaller of a decoder."""
+    if decoder_type == XmlRpcDecoderType.FAST:
+        unmarshaller = FastUnmarshaller()
+        return _FastParser(unmarshaller=unmarshaller), unmarshaller
+    return xmlrpc.client.getparser()
+
+
+def decode_response(data: bytes, decoder_type: XmlRpcDecoderType) -> tuple[Any, ...]:
+    """Decode the body of a response."""
+    parser, unmarshaller = get_parser(decoder_type=decoder_type)
+    parser.feed(data)
+    parser.close()
+    return unmarshaller.close()
@@ -3,22 +3,28 @@
 from __future__ import annotations
 
 from hahomematic.const import (
+    DEFAULT_CACHE_SAVE_DELAY,
+    DEFAULT_CACHE_SAVE_MAX_DELAY,
     DEFAULT_CONNECTION_CHECKER_INTERVAL,
     DEFAULT_JSON_SESSION_AGE,
     DEFAULT_LAST_COMMAND_SEND_STORE_TIMEOUT,
     DEFAULT_PING_PONG_MISMATCH_COUNT,
     DEFAULT_PING_PONG_MISMATCH_COUNT_TTL,
+    DEFAULT_RECONNECT_BACKOFF_MAX,
     DEFAULT_RECONNECT_WAIT,
     DEFAULT_TIMEOUT,
     DEFAULT_WAIT_FOR_CALLBACK,
 )
 
+CACHE_SAVE_DELAY = DEFAULT_CACHE_SAVE_DELAY
+CACHE_SAVE_MAX_DELAY = DEFAULT_CACHE_SAVE_MAX_DELAY
 CALLBACK_WARN_INTERVAL = DEFAULT_CONNECTION_CHECKER_INTERVAL * 40
 CONNECTION_CHECKER_INTERVAL = DEFAULT_CONNECTION_CHECKER_INTERVAL
 JSON_SESSION_AGE = DEFAULT_JSON_SESSION_AGE
 LAST_COMMAND_SEND_STORE_TIMEOUT = DEFAULT_LAST_COMMAND_SEND_STORE_TIMEOUT
 PING_PONG_MISMATCH_COUNT = DEFAULT_PING_PONG_MISMATCH_COUNT
 PING_PONG_MISMATCH_COUNT_TTL = DEFAULT_PING_PONG_MISMATCH_COUNT_TTL
+RECONNECT_BACKOFF_MAX = DEFAULT_RECONNECT_BACKOFF_MAX
 RECONNECT_WAIT = DEFAULT_RECONNECT_WAIT
 TIMEOUT = DEFAULT_TIMEOUT
 WAIT_FOR_CALLBACK = DEFAULT_WAIT_FOR_CALLBACK
@@ -9,20 +9,34 @@ from enum import Enum, IntEnum, StrEnum
 import re
 from typing import Any, Final, Required, TypedDict
 
-VERSION: Final = "2024.12.3"
-
+VERSION: Final = "2024.12.4"
+
+DEFAULT_BOOTSTRAP_ENABLED: Final = False
+DEFAULT_CACHE_SAVE_DELAY: Final = 5  # changes within the delay are saved together
+DEFAULT_CACHE_SAVE_MAX_DELAY: Final = 60  # changes are saved at the latest after the max delay
+DEFAULT_COMMAND_BURST_SIZE: Final = 20
+DEFAULT_COMMAND_RATE_LIMIT: Final = (
+    10.0  # commands per second per rf interface, 0 disables the limit
+)
 DEFAULT_CONNECTION_CHECKER_INTERVAL: Final = 15  # check if connection is available via rpc ping
 DEFAULT_CUSTOM_ID: Final = "custom_id"
+DEFAULT_EVENT_COALESCING: Final = False
+DEFAULT_EVENT_QUEUE_SIZE: Final = 10000
 DEFAULT_INCLUDE_INTERNAL_PROGRAMS: Final = False
 DEFAULT_INCLUDE_INTERNAL_SYSVARS: Final = True
 DEFAULT_JSON_SESSION_AGE: Final = 90
 DEFAULT_LAST_COMMAND_SEND_STORE_TIMEOUT: Final = 60
+DEFAULT_MAX_BACKGROUND_READS: Final = 1  # concurrent background reads per interface
+DEFAULT_MAX_JSON_RPC_CONCURRENCY: Final = 4  # concurrent requests of the json rpc client
 DEFAULT_MAX_READ_WORKERS: Final = 1
 DEFAULT_MAX_WORKERS: Final = 1
+DEFAULT_MAX_XML_RPC_CONNECTIONS: Final = 10
+DEFAULT_MULTICALL_BATCH_SIZE: Final = 50  # max calls per system.multicall, 0 disables batching
 DEFAULT_PERIODIC_REFRESH_INTERVAL: Final = 15
 DEFAULT_PING_PONG_MISMATCH_COUNT: Final = 15
 DEFAULT_PING_PONG_MISMATCH_COUNT_TTL: Final = 300
 DEFAULT_PROGRAM_SCAN_ENABLED: Final = True
+DEFAULT_RECONNECT_BACKOFF_MAX: Final = 600  # max wait between reconnect attempts of an interface
 DEFAULT_RECONNECT_WAIT: Final = 120  # wait with reconnect after a first ping was successful
 DEFAULT_SYSVAR_SCAN_ENABLED: Final = True
 DEFAULT_SYS_SCAN_INTERVAL: Final = 30
@@ -36,6 +50,7 @@ UTF8: Final = "utf-8"
 
 MAX_WAIT_FOR_CALLBACK: Final = 60
 MAX_CACHE_AGE: Final = 10
+MAX_DEVICE_DATA_DELTA_AGE: Final = 3600  # max age of the device data, that is updated by deltas
 
 REGA_SCRIPT_PATH: Final = "../rega_scripts"
 
@@ -133,6 +148,14 @@ class CallSource(StrEnum):
     MANUAL_OR_SCHEDULED = "manual_or_scheduled"
 
 
+class CircuitBreakerState(StrEnum):
+    """Enum with the states of the circuit breaker for the reconnects of an interface."""
+
+    CLOSED = "closed"
+    HALF_OPEN = "half_open"
+    OPEN = "open"
+
+
 class DataOperationResult(Enum):
     """Enum with data operation results."""
 
@@ -210,11 +233,28 @@ class EventKey(StrEnum):
     MODEL = "model"
     PARAMETER = "parameter"
     PONG_MISMATCH_COUNT = "pong_mismatch_count"
+    RETRY_IN = "retry_in"
     SECONDS_SINCE_LAST_EVENT = "seconds_since_last_event"
+    STATE = "state"
     TYPE = "type"
     VALUE = "value"
 
 
+class EventPriority(IntEnum):
+    """Enum with the priorities of events in the event queue. Lower values are processed first."""
+
+    CONNECTIVITY = 0
+    USER_VISIBLE = 1
+    BULK = 2
+
+
+class EventQueueOverflowPolicy(StrEnum):
+    """Enum with the policies, if the event queue is full."""
+
+    DROP_LOWEST_PRIORITY = "drop_lowest_priority"
+    DROP_NEWEST = "drop_newest"
+
+
 class EventType(StrEnum):
     """Enum with hahomematic event types."""
 
@@ -291,6 +331,7 @@ class Parameter(StrEnum):
     DURATION_VALUE = "DURATION_VALUE"
     DUTYCYCLE = "DUTYCYCLE"
     DUTY_CYCLE = "DUTY_CYCLE"
+    DUTY_CYCLE_LEVEL = "DUTY_CYCLE_LEVEL"
     EFFECT = "EFFECT"
     ENERGY_COUNTER = "ENERGY_COUNTER"
     ERROR = "ERROR"
@@ -392,16 +433,63 @@ class ProductGroup(StrEnum):
     VIRTUAL = "VirtualDevices"
 
 
+class RecordType(IntEnum):
+    """Enum with the types of calls, that are recorded by the event recorder."""
+
+    EVENT = 1
+    NEW_DEVICES = 2
+    DELETE_DEVICES = 3
+    SESSION = 4
+
+
 class RegaScript(StrEnum):
     """Enum with homematic rega scripts."""
 
     FETCH_ALL_DEVICE_DATA: Final = "fetch_all_device_data.fn"
+    FETCH_ALL_DEVICE_DATA_DELTA: Final = "fetch_all_device_data_delta.fn"
+    GET_BOOTSTRAP_DATA: Final = "get_bootstrap_data.fn"
     GET_PROGRAM_DESCRIPTIONS: Final = "get_program_descriptions.fn"
     GET_SERIAL: Final = "get_serial.fn"
     GET_SYSTEM_VARIABLE_DESCRIPTIONS: Final = "get_system_variable_descriptions.fn"
     SET_SYSTEM_VARIABLE: Final = "set_system_variable.fn"
 
 
+class RequestLane(IntEnum):
+    """Enum with the priority lanes of the requests to the backend. Lower values are served first."""
+
+    WRITE = 0
+    READ = 1
+    BACKGROUND = 2
+
+
+class RpcProtocol(StrEnum):
+    """Enum with the protocols for the rpc communication with the backend."""
+
+    BIN_RPC = "bin_rpc"
+    XML_RPC = "xml_rpc"
+
+
+class RpcServerType(StrEnum):
+    """Enum with the rpc server types for the callbacks from the backend."""
+
+    ASYNC = "async"
+    THREADED = "threaded"
+
+
+class XmlRpcDecoderType(StrEnum):
+    """Enum with the decoders for the xml rpc responses of the backend."""
+
+    FAST = "fast"
+    STANDARD = "standard"
+
+
+class XmlRpcProxyType(StrEnum):
+    """Enum with the proxy types for the xml rpc requests to the backend."""
+
+    ASYNC = "async"
+    THREADED = "threaded"
+
+
 class Interface(StrEnum):
     """Enum with homematic interfaces."""
 
@@ -417,6 +505,7 @@ class InterfaceEventType(StrEnum):
     """Enum with hahomematic interface event types."""
 
     CALLBACK = "callback"
+    CIRCUIT_BREAKER = "circuit_breaker"
     FETCH_DATA = "fetch_data"
     PENDING_PONG = "pending_pong"
     PROXY = "proxy"
@@ -475,6 +564,27 @@ class ParameterType(StrEnum):
     EMPTY = ""
 
 
+# Telemetry, that is processed with a low priority
+BULK_EVENT_PARAMETERS: Final[tuple[Parameter, ...]] = (
+    Parameter.ACTUAL_HUMIDITY,
+    Parameter.ACTUAL_TEMPERATURE,
+    Parameter.BATTERY_STATE,
+    Parameter.CURRENT,
+    Parameter.DUTYCYCLE,
+    Parameter.DUTY_CYCLE,
+    Parameter.DUTY_CYCLE_LEVEL,
+    Parameter.ENERGY_COUNTER,
+    Parameter.FREQUENCY,
+    Parameter.HUMIDITY,
+    Parameter.ILLUMINATION,
+    Parameter.OPERATING_VOLTAGE,
+    Parameter.POWER,
+    Parameter.RSSI_DEVICE,
+    Parameter.RSSI_PEER,
+    Parameter.TEMPERATURE,
+    Parameter.VOLTAGE,
+)
+
 CLICK_EVENTS: Final[tuple[Parameter, ...]] = (
     Parameter.PRESS,
     Parameter.PRESS_CONT,
@@ -486,6 +596,12 @@ CLICK_EVENTS: Final[tuple[Parameter, ...]] = (
     Parameter.PRESS_UNLOCK,
 )
 
+CONNECTIVITY_EVENT_PARAMETERS: Final[tuple[Parameter, ...]] = (
+    Parameter.PONG,
+    Parameter.STICKY_UN_REACH,
+    Parameter.UN_REACH,
+)
+
 DEVICE_ERROR_EVENTS: Final[tuple[Parameter, ...]] = (Parameter.ERROR, Parameter.SENSOR_ERROR)
 
 DATA_POINT_EVENTS: Final[tuple[EventType, ...]] = (
@@ -558,6 +674,11 @@ RELEVANT_INIT_PARAMETERS: Final[tuple[Parameter, ...]] = (
     Parameter.UN_REACH,
 )
 
+INTERFACES_SUPPORTING_DUTY_CYCLE: Final[tuple[Interface, ...]] = (
+    Interface.BIDCOS_RF,
+    Interface.HMIP_RF,
+)
+
 INTERFACES_SUPPORTING_FIRMWARE_UPDATES: Final[tuple[Interface, ...]] = (
     Interface.BIDCOS_RF,
     Interface.BIDCOS_WIRED,
@@ -578,6 +699,16 @@ INTERFACES_REQUIRING_PERIODIC_REFRESH: Final[tuple[Interface, ...]] = (
 
 DEFAULT_USE_PERIODIC_SCAN_FOR_INTERFACES: Final = True
 
+DEFAULT_RPC_PROTOCOL: Final = RpcProtocol.XML_RPC
+
+DEFAULT_RPC_SERVER_TYPE: Final = RpcServerType.THREADED
+
+DEFAULT_XML_RPC_DECODER_TYPE: Final = XmlRpcDecoderType.STANDARD
+
+DEFAULT_XML_RPC_PROXY_TYPE: Final = XmlRpcProxyType.THREADED
+
+DEFAULT_EVENT_QUEUE_OVERFLOW_POLICY: Final = EventQueueOverflowPolicy.DROP_LOWEST_PRIORITY
+
 IGNORE_FOR_UN_IGNORE_PARAMETERS: Final[tuple[Parameter, ...]] = (
     Parameter.CONFIG_PENDING,
     Parameter.STICKY_UN_REACH,
@@ -631,6 +762,18 @@ class SystemVariableData(HubData):
     values: tuple[str, ...] | None = None
 
 
+@dataclass(frozen=True, kw_only=True, slots=True)
+class BootstrapData:
+    """Data, that is fetched in one request on the start of a central."""
+
+    all_device_data: Mapping[Interface, dict[str, dict[str, Any]]]
+    channel_ids_function: Mapping[str, set[str]]
+    channel_ids_room: Mapping[str, set[str]]
+    device_details: tuple[dict[str, Any], ...]
+    programs: tuple[ProgramData, ...]
+    system_variables: tuple[SystemVariableData, ...]
+
+
 @dataclass(frozen=True, kw_only=True, slots=True)
 class SystemInformation:
     """System information of the backend."""
@@ -2,7 +2,26 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from contextvars import ContextVar
 
+from hahomematic.const import RequestLane
+
 # context var for storing if call is running within a service
 IN_SERVICE_VAR: ContextVar[bool] = ContextVar("in_service_var", default=False)
+
+# context var for storing the lane of the read requests to the backend
+REQUEST_LANE_VAR: ContextVar[RequestLane] = ContextVar(
+    "request_lane_var", default=RequestLane.READ
+)
+
+
+@contextmanager
+def background_requests() -> Iterator[None]:
+    """Send the read requests within the context in the background lane."""
+    token = REQUEST_LANE_VAR.set(RequestLane.BACKGROUND)
+    try:
+        yield
+    finally:
+        REQUEST_LANE_VAR.reset(token)
@@ -45,6 +45,7 @@ from hahomematic.const import (
     ProductGroup,
     RxMode,
 )
+from hahomematic.context import background_requests
 from hahomematic.decorators import service
 from hahomematic.exceptions import BaseHomematicException, HaHomematicException
 from hahomematic.model.custom import data_point as hmce, definition as hmed
@@ -509,7 +510,8 @@ class Device(PayloadMixin):
         """Export the device definition for current device."""
         try:
             device_exporter = _DefinitionExporter(device=self)
-            await device_exporter.export_data()
+            with background_requests():
+                await device_exporter.export_data()
         except Exception as ex:
             raise HaHomematicException(
                 f"EXPORT_DEVICE_DEFINITION failed: {reduce_args(args=ex.args)}"
@@ -565,18 +567,19 @@ class Device(PayloadMixin):
     @service()
     async def reload_paramset_descriptions(self) -> None:
         """Reload paramset for device."""
-        for (
-            paramset_key,
-            channel_addresses,
-        ) in self._central.paramset_descriptions.get_channel_addresses_by_paramset_key(
-            interface_id=self._interface_id,
-            device_address=self._address,
-        ).items():
-            for channel_address in channel_addresses:
-                await self._client.fetch_paramset_description(
-                    channel_address=channel_address,
-                    paramset_key=paramset_key,
-                )
+        await self._client.fetch_paramset_description_batch(
+            channel_paramset_keys=tuple(
+                (channel_address, paramset_key)
+                for (
+                    paramset_key,
+                    channel_addresses,
+                ) in self._central.paramset_descriptions.get_channel_addresses_by_paramset_key(
+                    interface_id=self._interface_id,
+                    device_address=self._address,
+                ).items()
+                for channel_address in channel_addresses
+            )
+        )
         await self._central.save_caches(save_paramset_descriptions=True)
         for data_point in self.generic_data_points:
             data_point.update_parameter_data()
@@ -964,7 +967,9 @@ class _ValueCache:
     async def init_base_data_points(self) -> None:
         """Load data by get_value."""
         try:
-            for data_point in self._get_base_data_points():
+            base_data_points = self._get_base_data_points()
+            await self._load_values_for_cache(data_points=base_data_points)
+            for data_point in base_data_points:
                 value = await self.get_value(
                     channel_address=data_point.channel.address,
                     paramset_key=data_point.paramset_key,
@@ -996,7 +1001,9 @@ class _ValueCache:
     async def init_readable_events(self) -> None:
         """Load data by get_value."""
         try:
-            for event in self._get_readable_events():
+            readable_events = self._get_readable_events()
+            await self._load_values_for_cache(data_points=readable_events)
+            for event in readable_events:
                 value = await self.get_value(
                     channel_address=event.channel.address,
                     paramset_key=event.paramset_key,
@@ -1087,6 +1094,64 @@ class _ValueCache:
             address=channel_address, paramset_key=paramset_key, call_source=CallSource.HM_INIT
         )
 
+    async def _load_values_for_cache(
+        self, data_points: set[GenericDataPoint] | set[GenericEvent]
+    ) -> None:
+        """Load the uncached values of the data points in batches, if supported by the client."""
+        client = self._device.client
+        if not client.supports_multicall:
+            return
+        uncached = tuple(
+            data_point
+            for data_point in data_points
+            if self._get_value_from_cache(
+                channel_address=data_point.channel.address,
+                paramset_key=data_point.paramset_key,
+                parameter=data_point.parameter,
+            )
+            == NO_CACHE_ENTRY
+        )
+        if not uncached:
+            return
+        values = await client.get_value_batch(
+            channel_parameters=tuple(
+                {
+                    (dp.channel.address, dp.parameter)
+                    for dp in uncached
+                    if dp.paramset_key == ParamsetKey.VALUES
+                }
+            ),
+            call_source=CallSource.HM_INIT,
+        )
+        master_paramsets = await client.get_paramset_batch(
+            addresses=tuple(
+                {dp.channel.address for dp in uncached if dp.paramset_key == ParamsetKey.MASTER}
+            ),
+            paramset_key=ParamsetKey.MASTER,
+            call_source=CallSource.HM_INIT,
+        )
+        for channel_address, paramset in master_paramsets.items():
+            for parameter, value in paramset.items():
+                self._add_entry_to_device_cache(
+                    channel_address=channel_address,
+                    paramset_key=ParamsetKey.MASTER,
+                    parameter=parameter,
+                    value=value,
+                )
+        for dp in uncached:
+            if dp.paramset_key == ParamsetKey.VALUES:
+                value = values.get((dp.channel.address, dp.parameter), self._NO_VALUE_CACHE_ENTRY)
+            else:
+                value = master_paramsets.get(dp.channel.address, {}).get(
+                    dp.parameter, self._NO_VALUE_CACHE_ENTRY
+                )
+            self._add_entry_to_device_cache(
+                channel_address=dp.channel.address,
+                paramset_key=dp.paramset_key,
+                parameter=dp.parameter,
+                value=value,
+            )
+
     def _add_entry_to_device_cache(
         self, channel_address: str, paramset_key: ParamsetKey, parameter: str, value: Any
     ) -> None:
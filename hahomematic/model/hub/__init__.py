@@ -59,8 +59,10 @@ class Hub:
         self._config: Final = central.config
 
     @service(re_raise=False)
-    async def fetch_sysvar_data(self, scheduled: bool) -> None:
-        """Fetch sysvar data for the hub."""
+    async def fetch_sysvar_data(
+        self, scheduled: bool, variables: tuple[SystemVariableData, ...] | None = None
+    ) -> None:
+        """Fetch sysvar data for the hub, or use the already fetched variables."""
         if self._config.sysvar_scan_enabled:
             _LOGGER.debug(
                 "FETCH_SYSVAR_DATA: %s fetching of system variables for %s",
@@ -69,11 +71,13 @@ class Hub:
             )
             async with self._sema_fetch_sysvars:
                 if self._central.available:
-                    await self._update_sysvar_data_points()
+                    await self._update_sysvar_data_points(variables=variables)
 
     @service(re_raise=False)
-    async def fetch_program_data(self, scheduled: bool) -> None:
-        """Fetch program data for the hub."""
+    async def fetch_program_data(
+        self, scheduled: bool, programs: tuple[ProgramData, ...] | None = None
+    ) -> None:
+        """Fetch program data for the hub, or use the already fetched programs."""
         if self._config.program_scan_enabled:
             _LOGGER.debug(
                 "FETCH_PROGRAM_DATA: %s fetching of programs for %s",
@@ -82,15 +86,18 @@ class Hub:
             )
             async with self._sema_fetch_programs:
                 if self._central.available:
-                    await self._update_program_data_points()
+                    await self._update_program_data_points(programs=programs)
 
-    async def _update_program_data_points(self) -> None:
+    async def _update_program_data_points(
+        self, programs: tuple[ProgramData, ...] | None = None
+    ) -> None:
         """Retrieve all program data and update program values."""
-        programs: tuple[ProgramData, ...] = ()
-        if client := self._central.primary_client:
-            programs = await client.get_all_programs(
-                include_internal=self._config.include_internal_programs
-            )
+        if programs is None:
+            programs = ()
+            if client := self._central.primary_client:
+                programs = await client.get_all_programs(
+                    include_internal=self._config.include_internal_programs
+                )
         if not programs:
             _LOGGER.debug(
                 "UPDATE_PROGRAM_DATA_POINTS: No programs received for %s",
@@ -120,13 +127,16 @@ class Hub:
                 new_hub_data_points=_get_new_hub_data_points(data_points=new_programs),
             )
 
-    async def _update_sysvar_data_points(self) -> None:
+    async def _update_sysvar_data_points(
+        self, variables: tuple[SystemVariableData, ...] | None = None
+    ) -> None:
         """Retrieve all variable data and update hmvariable values."""
-        variables: tuple[SystemVariableData, ...] = ()
-        if client := self._central.primary_client:
-            variables = await client.get_all_system_variables(
-                include_internal=self._config.include_internal_sysvars
-            )
+        if variables is None:
+            variables = ()
+            if client := self._central.primary_client:
+                variables = await client.get_all_system_variables(
+                    include_internal=self._config.include_internal_sysvars
+                )
         if not variables:
             _LOGGER.debug(
                 "UPDATE_SYSVAR_DATA_POINTS: No sysvars received for %s",
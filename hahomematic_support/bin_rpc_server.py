@@ -0,0 +1,386 @@
+"""
+Local BIN-RPC stand-in for a backend.
+
+The server serves recorded devices via BIN-RPC like Homegear, and sends the
+newDevices and event callbacks to the xmlrpc_bin:// urls of the init calls.
+It supports the methods, that are used by the client of hahomematic.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import importlib.resources
+import logging
+import os
+from typing import Any, Final
+import xmlrpc.client
+
+import orjson
+
+from hahomematic.central import CentralConnectionState
+from hahomematic.client.bin_rpc import (
+    MESSAGE_REQUEST,
+    BinRpcProxy,
+    decode_request,
+    encode_fault,
+    encode_response,
+    read_message,
+)
+from hahomematic.const import LOCAL_HOST, PORT_ANY
+from hahomematic.exceptions import BaseHomematicException
+from hahomematic.support import find_free_port
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+LOCAL_BIN_RPC_VERSION: Final = "Homegear 0.8.0 (local BIN-RPC stand-in)"
+
+_ADDRESS: Final = "ADDRESS"
+_CHILDREN: Final = "CHILDREN"
+_DEFAULT: Final = "DEFAULT"
+_NAME: Final = "NAME"
+_PARENT_TYPE: Final = "PARENT_TYPE"
+_TYPE: Final = "TYPE"
+_VALUE_LIST: Final = "VALUE_LIST"
+_VALUES: Final = "VALUES"
+
+
+class LocalBinRpcServer:
+    """Local BIN-RPC server, that stands in for a backend."""
+
+    def __init__(
+        self,
+        ip_addr: str = LOCAL_HOST,
+        port: int = PORT_ANY,
+        version: str = LOCAL_BIN_RPC_VERSION,
+    ) -> None:
+        """Init the local BIN-RPC server."""
+        self._ip_addr: Final = ip_addr
+        self._port: Final = find_free_port() if port == PORT_ANY else port
+        self._version: Final = version
+        self._device_descriptions: Final[dict[str, dict[str, Any]]] = {}
+        self._paramset_descriptions: Final[dict[str, dict[str, dict[str, Any]]]] = {}
+        self._paramsets: Final[dict[str, dict[str, dict[str, Any]]]] = {}
+        self._system_variables: Final[dict[str, Any]] = {}
+        # {interface_id, callback proxy}
+        self._callbacks: Final[dict[str, BinRpcProxy]] = {}
+        # {interface_id, callback url}
+        self._callback_urls: Final[dict[str, str]] = {}
+        self._connection_state: Final = CentralConnectionState()
+        self._server: asyncio.Server | None = None
+        self._tasks: Final[set[asyncio.Task[None]]] = set()
+        self._writers: Final[set[asyncio.StreamWriter]] = set()
+        self._methods: Final[dict[str, Callable[..., Any]]] = {
+            "clientServerInitialized": self.clientServerInitialized,
+            "deleteSystemVariable": self.deleteSystemVariable,
+            "getAllSystemVariables": self.getAllSystemVariables,
+            "getDeviceDescription": self.getDeviceDescription,
+            "getMetadata": self.getMetadata,
+            "getParamset": self.getParamset,
+            "getParamsetDescription": self.getParamsetDescription,
+            "getSystemVariable": self.getSystemVariable,
+            "getValue": self.getValue,
+            "getVersion": self.getVersion,
+            "init": self.init,
+            "listDevices": self.listDevices,
+            "ping": self.ping,
+            "putParamset": self.putParamset,
+            "setSystemVariable": self.setSystemVariable,
+            "setValue": self.setValue,
+            "system.listMethods": self.system_listMethods,
+            "system.multicall": self.system_multicall,
+        }
+        self.calls: Final[list[tuple[str, tuple[Any, ...]]]] = []
+
+    @property
+    def port(self) -> int:
+        """Return the port of the server."""
+        return self._port
+
+    @property
+    def callback_interface_ids(self) -> tuple[str, ...]:
+        """Return the interface_ids with a registered callback."""
+        return tuple(self._callbacks)
+
+    def add_devices(
+        self,
+        device_descriptions: list[dict[str, Any]],
+        paramset_descriptions: dict[str, dict[str, dict[str, Any]]],
+    ) -> None:
+        """Add devices with their paramset descriptions."""
+        for device_description in device_descriptions:
+            self._device_descriptions[device_description[_ADDRESS]] = device_description
+        for address, paramsets in paramset_descriptions.items():
+            # some recordings contain markers instead of paramsets
+            if isinstance(paramsets, dict):
+                self._paramset_descriptions[address] = paramsets
+
+    def load_devices(
+        self,
+        filenames: tuple[str, ...],
+        anchor: str = "pydevccu",
+        device_description_dir: str = "device_descriptions",
+        paramset_description_dir: str = "paramset_descriptions",
+    ) -> None:
+        """Load recorded devices from the files of the anchor package."""
+        package_path = str(importlib.resources.files(anchor))
+        for filename in filenames:
+            with open(os.path.join(package_path, device_description_dir, filename), "rb") as fptr:
+                device_descriptions = orjson.loads(fptr.read())
+            with open(
+                os.path.join(package_path, paramset_description_dir, filename), "rb"
+            ) as fptr:
+                paramset_descriptions = orjson.loads(fptr.read())
+            self.add_devices(
+                device_descriptions=device_descriptions,
+                paramset_descriptions=paramset_descriptions,
+            )
+
+    async def start(self) -> None:
+        """Start the server."""
+        if self._server is not None:
+            return
+        self._server = await asyncio.start_server(
+            self._handle_connection, host=self._ip_addr, port=self._port, reuse_address=True
+        )
+        _LOGGER.debug("START: Local BIN-RPC server listening on %s:%i", self._ip_addr, self._port)
+
+    async def stop(self) -> None:
+        """Stop the server and close the callbacks."""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        for proxy in self._callbacks.values():
+            await proxy.stop()
+        self._callbacks.clear()
+        self._callback_urls.clear()
+        if (server := self._server) is not None:
+            self._server = None
+            server.close()
+            for writer in tuple(self._writers):
+                writer.close()
+            await server.wait_closed()
+
+    async def block_till_done(self) -> None:
+        """Wait until all callbacks are sent."""
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def send_event(self, address: str, parameter: str, value: Any) -> None:
+        """Send an event to all registered callbacks."""
+        for interface_id, proxy in tuple(self._callbacks.items()):
+            try:
+                await proxy.event(interface_id, address, parameter, value)
+            except BaseHomematicException as ex:
+                _LOGGER.debug("SEND_EVENT: Failed to send event to %s: %s", interface_id, ex)
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Handle the requests of a connection."""
+        self._writers.add(writer)
+        try:
+            while True:
+                try:
+                    message_type, _, data = await read_message(reader=reader)
+                except asyncio.IncompleteReadError:
+                    break
+                writer.write(self._handle_request(message_type=message_type, data=data))
+                await writer.drain()
+        except (OSError, xmlrpc.client.ResponseError) as err:
+            _LOGGER.debug("HANDLE_CONNECTION: Closing connection: %s", err)
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    def _handle_request(self, message_type: int, data: bytes) -> bytes:
+        """Handle a request, and return the encoded response."""
+        try:
+            if message_type != MESSAGE_REQUEST:
+                raise xmlrpc.client.Fault(-1, f"Unexpected message type {message_type:#x}")
+            method, params = decode_request(data=data)
+            return encode_response(value=self._dispatch(method=method, params=params))
+        except xmlrpc.client.Fault as fault:
+            return encode_fault(fault_code=fault.faultCode, fault_string=fault.faultString)
+        except Exception as ex:
+            return encode_fault(fault_code=-1, fault_string=f"{type(ex).__name__}:{ex}")
+
+    def _dispatch(self, method: str, params: tuple[Any, ...]) -> Any:
+        """Dispatch a call to its method."""
+        self.calls.append((method, params))
+        if (func := self._methods.get(method)) is None:
+            raise xmlrpc.client.Fault(-1, f"Unknown method: {method}")
+        return func(*params)
+
+    def _create_task(self, coro: Any) -> None:
+        """Create a task for a callback, and keep a reference until it is done."""
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _get_paramset_description(self, address: str, paramset_key: str) -> dict[str, Any]:
+        """Return a paramset description, or raise a fault."""
+        if (
+            paramset_description := self._paramset_descriptions.get(address, {}).get(paramset_key)
+        ) is None:
+            raise xmlrpc.client.Fault(-2, f"Unknown paramset: {address} {paramset_key}")
+        return paramset_description
+
+    async def _push_devices(self, interface_id: str) -> None:
+        """Send the devices, that are unknown to the client."""
+        if (proxy := self._callbacks.get(interface_id)) is None:
+            return
+        try:
+            known_addresses = {
+                device_description[_ADDRESS]
+                for device_description in await proxy.listDevices(interface_id)
+            }
+            if new_devices := [
+                device_description
+                for address, device_description in self._device_descriptions.items()
+                if address not in known_addresses
+            ]:
+                await proxy.newDevices(interface_id, new_devices)
+        except BaseHomematicException as ex:
+            _LOGGER.debug("PUSH_DEVICES: Failed to push devices to %s: %s", interface_id, ex)
+
+    # pylint: disable=invalid-name
+    def clientServerInitialized(self, interface_id: str) -> bool:
+        """Return if the callback of the interface_id is registered."""
+        return interface_id in self._callbacks
+
+    def deleteSystemVariable(self, name: str) -> None:
+        """Delete a system variable."""
+        self._system_variables.pop(name, None)
+
+    def getAllSystemVariables(self) -> dict[str, Any]:
+        """Return all system variables."""
+        return self._system_variables
+
+    def getDeviceDescription(self, address: str) -> dict[str, Any]:
+        """Return a device description."""
+        if (device_description := self._device_descriptions.get(address)) is None:
+            raise xmlrpc.client.Fault(-2, f"Unknown address: {address}")
+        return device_description
+
+    def getMetadata(self, address: str, data_id: str) -> Any:
+        """Return the metadata of a device or channel."""
+        device_description = self.getDeviceDescription(address=address)
+        if data_id == _NAME:
+            model = (
+                device_description.get(_TYPE)
+                if device_description.get(_CHILDREN)
+                else device_description.get(_PARENT_TYPE)
+            )
+            return f"{model} {address}"
+        return device_description.get(data_id)
+
+    def getParamset(self, address: str, paramset_key: str) -> dict[str, Any]:
+        """Return the values of a paramset. Not yet set values are returned as default."""
+        paramset = self._paramsets.get(address, {}).get(paramset_key, {})
+        values: dict[str, Any] = {}
+        for parameter, parameter_data in self._get_paramset_description(
+            address=address, paramset_key=paramset_key
+        ).items():
+            if parameter in paramset:
+                values[parameter] = paramset[parameter]
+                continue
+            value = parameter_data.get(_DEFAULT)
+            if isinstance(value, str) and value in (
+                value_list := parameter_data.get(_VALUE_LIST) or ()
+            ):
+                value = value_list.index(value)
+            values[parameter] = value
+        return values
+
+    def getParamsetDescription(self, address: str, paramset_key: str) -> dict[str, Any]:
+        """Return a paramset description."""
+        return self._get_paramset_description(address=address, paramset_key=paramset_key)
+
+    def getSystemVariable(self, name: str) -> Any:
+        """Return the value of a system variable."""
+        return self._system_variables.get(name)
+
+    def getValue(self, address: str, parameter: str) -> Any:
+        """Return the value of a parameter."""
+        return self.getParamset(address=address, paramset_key=_VALUES).get(parameter)
+
+    def getVersion(self) -> str:
+        """Return the version of the backend."""
+        return self._version
+
+    def init(self, url: str, interface_id: str | None = None) -> str:
+        """Register or unregister the callback url of an interface."""
+        if interface_id:
+            # urlsplit does not support the underscore of the xmlrpc_bin scheme
+            host, _, port = url.split("://")[-1].rstrip("/").rpartition(":")
+            self._callbacks[interface_id] = BinRpcProxy(
+                interface_id=interface_id,
+                connection_state=self._connection_state,
+                host=host.strip("[]") or LOCAL_HOST,
+                port=int(port),
+                headers=[],
+            )
+            self._callback_urls[interface_id] = url
+            self._create_task(self._push_devices(interface_id=interface_id))
+        else:
+            for callback_interface_id, callback_url in tuple(self._callback_urls.items()):
+                if callback_url == url:
+                    del self._callback_urls[callback_interface_id]
+                    self._create_task(self._callbacks.pop(callback_interface_id).stop())
+        return ""
+
+    def listDevices(self, interface_id: str | None = None) -> list[dict[str, Any]]:
+        """Return all device descriptions."""
+        return list(self._device_descriptions.values())
+
+    def ping(self, caller_id: str) -> bool:
+        """Send a pong event to the callbacks."""
+        self._create_task(self.send_event(address="CENTRAL", parameter="PONG", value=caller_id))
+        return True
+
+    def putParamset(
+        self,
+        address: str,
+        paramset_key: str,
+        values: dict[str, Any],
+        rx_mode: str | None = None,
+    ) -> None:
+        """Set the values of a paramset, and send the events of the changed values."""
+        paramset_description = self._get_paramset_description(
+            address=address, paramset_key=paramset_key
+        )
+        if unknown_parameters := set(values) - set(paramset_description):
+            raise xmlrpc.client.Fault(-5, f"Unknown parameters: {sorted(unknown_parameters)}")
+        self._paramsets.setdefault(address, {}).setdefault(paramset_key, {}).update(values)
+        if paramset_key == _VALUES:
+            for parameter, value in values.items():
+                self._create_task(
+                    self.send_event(address=address, parameter=parameter, value=value)
+                )
+
+    def setSystemVariable(self, name: str, value: Any) -> None:
+        """Set the value of a system variable."""
+        self._system_variables[name] = value
+
+    def setValue(
+        self, address: str, parameter: str, value: Any, rx_mode: str | None = None
+    ) -> str:
+        """Set the value of a parameter."""
+        self.putParamset(address=address, paramset_key=_VALUES, values={parameter: value})
+        return ""
+
+    def system_listMethods(self, interface_id: str | None = None) -> list[str]:
+        """Return the supported methods."""
+        return sorted(self._methods)
+
+    def system_multicall(self, calls: list[dict[str, Any]]) -> list[Any]:
+        """Execute multiple calls. Results are wrapped in a list, faults returned as struct."""
+        results: list[Any] = []
+        for call in calls:
+            try:
+                results.append(
+                    [self._dispatch(method=call["methodName"], params=tuple(call["params"]))]
+                )
+            except xmlrpc.client.Fault as fault:
+                results.append({"faultCode": fault.faultCode, "faultString": fault.faultString})
+        return results
@@ -82,6 +82,11 @@ class ClientLocal(Client):  # pragma: no cover
         """Return the client supports push update."""
         return True
 
+    @property
+    def supports_multicall(self) -> bool:
+        """Return if read requests can be batched by system.multicall."""
+        return False
+
     async def proxy_init(self) -> ProxyInitState:
         """Init the proxy has to tell the CCU / Homegear where to send the events."""
         return ProxyInitState.INIT_SUCCESS
@@ -93,8 +98,8 @@ class ClientLocal(Client):  # pragma: no cover
     async def stop(self) -> None:
         """Stop depending services."""
 
-    async def fetch_all_device_data(self) -> None:
-        """Fetch all device data from CCU."""
+    async def fetch_all_device_data(self, since: datetime | None = None) -> None:
+        """Fetch all device data from CCU, or only the data changed since the timestamp."""
 
     async def fetch_device_details(self) -> None:
         """Fetch names from backend."""
@@ -0,0 +1,158 @@
+"""Replay of recorded backend calls into a central, e.g. to benchmark the event processing."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import logging
+import math
+import time
+import tracemalloc
+from typing import Final
+
+from hahomematic.central import CentralUnit
+from hahomematic.central.event_recorder import Record, read_records
+from hahomematic.const import RecordType
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class ReplayResult:
+    """Dataclass with the result of a replay."""
+
+    record_count: int
+    event_count: int
+    recorded_duration: float
+    replay_duration: float
+    # time in seconds, the events have been waiting in the event queue
+    latencies: tuple[float, ...]
+    # peak of the memory allocated during the replay in bytes, if traced
+    peak_memory: int | None
+
+    @property
+    def events_per_second(self) -> float:
+        """Return the processed events per second."""
+        return self.event_count / self.replay_duration if self.replay_duration > 0 else 0.0
+
+    @property
+    def max_latency(self) -> float:
+        """Return the max latency of the events."""
+        return max(self.latencies, default=0.0)
+
+    @property
+    def mean_latency(self) -> float:
+        """Return the mean latency of the events."""
+        return sum(self.latencies) / len(self.latencies) if self.latencies else 0.0
+
+    def get_latency_percentile(self, percentile: float) -> float:
+        """Return the latency, that is not exceeded by the given percentage of the events."""
+        if not self.latencies:
+            return 0.0
+        latencies = sorted(self.latencies)
+        return latencies[max(0, math.ceil(len(latencies) * percentile / 100) - 1)]
+
+
+async def replay_recording(
+    central: CentralUnit,
+    file_path: str,
+    speed: float | None = 1.0,
+    interface_id: str | None = None,
+    trace_memory: bool = False,
+) -> ReplayResult:
+    """
+    Replay a recording into a central.
+
+    speed: 1.0 replays in real time, 10.0 ten times faster, None as fast as possible.
+    interface_id: replaces the recorded interface_id, e.g. for a central with a local client.
+    trace_memory: traces the peak memory with tracemalloc, that slows down the replay.
+    """
+    records: tuple[Record, ...] = await central.looper.async_add_executor_job(
+        lambda: tuple(read_records(file_path=file_path)), name="read-records"
+    )
+    if started_tracing := trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    if trace_memory:
+        tracemalloc.reset_peak()
+    central.event_queue.start_wait_time_recording()
+    start_time = time.monotonic()
+    try:
+        record_count, event_count, recorded_duration = await _replay_records(
+            central=central, records=records, speed=speed, interface_id=interface_id
+        )
+        await central.looper.block_till_done()
+        replay_duration = time.monotonic() - start_time
+        peak_memory = tracemalloc.get_traced_memory()[1] if trace_memory else None
+    finally:
+        latencies = central.event_queue.stop_wait_time_recording()
+        if started_tracing:
+            tracemalloc.stop()
+    result = ReplayResult(
+        record_count=record_count,
+        event_count=event_count,
+        recorded_duration=recorded_duration,
+        replay_duration=replay_duration,
+        latencies=latencies,
+        peak_memory=peak_memory,
+    )
+    _LOGGER.debug(
+        "REPLAY_RECORDING: Replayed %i records of %s in %.3fs, max latency %.3fs",
+        result.record_count,
+        file_path,
+        result.replay_duration,
+        result.max_latency,
+    )
+    return result
+
+
+async def _replay_records(
+    central: CentralUnit,
+    records: tuple[Record, ...],
+    speed: float | None,
+    interface_id: str | None,
+) -> tuple[int, int, float]:
+    """Replay the records, and return the number of calls and events and the recorded duration."""
+    record_count = 0
+    event_count = 0
+    start_time = time.monotonic()
+    # the recorded duration of the previous sessions
+    recorded_duration = 0.0
+    session_start: float | None = None
+    last_timestamp = 0.0
+    for record in records:
+        if record.record_type == RecordType.SESSION or session_start is None:
+            if session_start is not None:
+                recorded_duration += last_timestamp - session_start
+            session_start = record.timestamp
+        last_timestamp = record.timestamp
+        if record.record_type == RecordType.SESSION:
+            continue
+        record_count += 1
+        if speed:
+            delay = (recorded_duration + record.timestamp - session_start) / speed - (
+                time.monotonic() - start_time
+            )
+            if delay > 0:
+                await asyncio.sleep(delay)
+        iid = interface_id or str(record.args[0])
+        if record.record_type == RecordType.EVENT:
+            _, channel_address, parameter, value = record.args
+            event_count += 1
+            # don't overrun the event queue, when replaying as fast as possible
+            while central.event_queue.depth >= central.event_queue.max_size:  # noqa: ASYNC110
+                await asyncio.sleep(0)
+            if central.accept_event(
+                interface_id=iid, channel_address=channel_address, parameter=parameter
+            ):
+                central.schedule_data_point_events(
+                    interface_id=iid, events=((channel_address, parameter, value),)
+                )
+        elif record.record_type == RecordType.NEW_DEVICES:
+            await central.add_new_devices(
+                interface_id=iid, device_descriptions=tuple(record.args[1])
+            )
+        elif record.record_type == RecordType.DELETE_DEVICES:
+            await central.delete_devices(interface_id=iid, addresses=tuple(record.args[1]))
+    if session_start is not None:
+        recorded_duration += last_timestamp - session_start
+    return record_count, event_count, recorded_duration
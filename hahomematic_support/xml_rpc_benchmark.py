@@ -0,0 +1,137 @@
+"""Benchmark of the decoders for the xml rpc responses on recorded device data."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+import importlib.resources
+import logging
+import os
+import time
+import tracemalloc
+from typing import Any, Final
+import xmlrpc.client
+
+import orjson
+
+from hahomematic.client.xml_rpc_decoder import decode_response
+from hahomematic.const import XmlRpcDecoderType
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+_ENCODING_ISO_8859_1: Final = "ISO-8859-1"
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class DecoderBenchmarkResult:
+    """Dataclass with the result of a decoder benchmark."""
+
+    decoder_type: XmlRpcDecoderType
+    response_count: int
+    response_bytes: int
+    duration: float
+    peak_memory: int
+
+    @property
+    def megabytes_per_second(self) -> float:
+        """Return the decoded megabytes per second."""
+        return self.response_bytes / self.duration / 1_000_000 if self.duration > 0 else 0.0
+
+
+def _encode_response(data: Any) -> bytes:
+    """Return the body of a response, like it is sent by the backend."""
+    return xmlrpc.client.dumps(
+        (data,), methodresponse=True, encoding=_ENCODING_ISO_8859_1, allow_none=True
+    ).encode(_ENCODING_ISO_8859_1, "xmlcharrefreplace")
+
+
+def get_recorded_responses(
+    anchor: str = "pydevccu",
+    device_description_dir: str = "device_descriptions",
+    paramset_description_dir: str = "paramset_descriptions",
+    max_devices: int | None = None,
+) -> tuple[bytes, ...]:
+    """
+    Return responses built from the recorded device data of the anchor package.
+
+    The first response is the listDevices response with all device descriptions,
+    followed by a getParamsetDescription response per address and paramset_key.
+    """
+    package_path = str(importlib.resources.files(anchor))
+    filenames = sorted(os.listdir(os.path.join(package_path, device_description_dir)))[
+        :max_devices
+    ]
+    device_descriptions: list[Any] = []
+    responses: list[bytes] = []
+    for filename in filenames:
+        with open(os.path.join(package_path, device_description_dir, filename), "rb") as fptr:
+            device_descriptions.extend(orjson.loads(fptr.read()))
+        paramset_file = os.path.join(package_path, paramset_description_dir, filename)
+        if not os.path.exists(paramset_file):
+            continue
+        with open(paramset_file, "rb") as fptr:
+            for paramsets in orjson.loads(fptr.read()).values():
+                # some recordings contain markers instead of paramsets
+                if isinstance(paramsets, dict):
+                    responses.extend(
+                        _encode_response(paramset_description)
+                        for paramset_description in paramsets.values()
+                    )
+    return (_encode_response(device_descriptions), *responses)
+
+
+def _decode_all(responses: Iterable[bytes], decoder_type: XmlRpcDecoderType) -> list[Any]:
+    """Decode all responses."""
+    return [decode_response(data=data, decoder_type=decoder_type) for data in responses]
+
+
+def benchmark_decoders(
+    responses: tuple[bytes, ...],
+    rounds: int = 5,
+    decoder_types: tuple[XmlRpcDecoderType, ...] = (
+        XmlRpcDecoderType.STANDARD,
+        XmlRpcDecoderType.FAST,
+    ),
+) -> tuple[DecoderBenchmarkResult, ...]:
+    """Benchmark the decoders, and check that they return the same results as the first one."""
+    results: list[DecoderBenchmarkResult] = []
+    expected: list[Any] | None = None
+    for decoder_type in decoder_types:
+        decoded = _decode_all(responses=responses, decoder_type=decoder_type)
+        if expected is None:
+            expected = decoded
+        elif decoded != expected:
+            raise ValueError(f"BENCHMARK_DECODERS: {decoder_type} returns different results")
+        del decoded
+
+        # the best of the rounds is least affected by other load
+        duration = float("inf")
+        for _ in range(rounds):
+            start = time.perf_counter()
+            _decode_all(responses=responses, decoder_type=decoder_type)
+            duration = min(duration, time.perf_counter() - start)
+
+        tracemalloc.start()
+        try:
+            _decode_all(responses=responses, decoder_type=decoder_type)
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        result = DecoderBenchmarkResult(
+            decoder_type=decoder_type,
+            response_count=len(responses),
+            response_bytes=sum(len(data) for data in responses),
+            duration=duration,
+            peak_memory=peak_memory,
+        )
+        _LOGGER.debug(
+            "BENCHMARK_DECODERS: %s decoded %i responses in %.3fs (%.1f MB/s, peak %i KiB)",
+            decoder_type,
+            result.response_count,
+            result.duration,
+            result.megabytes_per_second,
+            result.peak_memory // 1024,
+        )
+        results.append(result)
+    return tuple(results)
@@ -0,0 +1,271 @@
+"""Tests for the BIN-RPC communication of hahomematic."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import Mock, patch
+import xmlrpc.client
+
+import pytest
+
+from hahomematic.central import CentralConfig, CentralConnectionState, CentralUnit
+from hahomematic.central.bin_rpc_server import create_bin_rpc_server
+from hahomematic.client import Client, InterfaceConfig
+from hahomematic.client.bin_rpc import (
+    BinRpcProxy,
+    decode_request,
+    decode_response,
+    encode_fault,
+    encode_request,
+    encode_response,
+    read_message,
+)
+from hahomematic.const import LOCAL_HOST, Interface, RpcProtocol, RpcServerType
+from hahomematic.exceptions import ClientException, NoConnectionException
+from hahomematic.support import find_free_port
+from hahomematic_support.bin_rpc_server import LocalBinRpcServer
+
+from tests import const, helper
+
+TEST_DEVICES: dict[str, str] = {
+    "VCU2128127": "HmIP-BSM.json",
+}
+
+# pylint: disable=protected-access
+
+
+async def _read(data: bytes) -> tuple[int, dict[str, str], bytes]:
+    """Return the message type, headers and data of an encoded message."""
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return await read_message(reader=reader)
+
+
+@pytest.mark.asyncio
+async def test_bin_rpc_codec() -> None:
+    """Test the encoding and decoding of BIN-RPC messages."""
+    params = (
+        "VCU2128127:4",
+        "",
+        True,
+        False,
+        42,
+        -(2**31),
+        2**40,
+        21.5,
+        -0.1,
+        0.0,
+        1234.5678,
+        xmlrpc.client.Binary(b"\x00\x01binary"),
+        ["a", 1, [2.5, {"NESTED": True}]],
+        {"LEVEL": 0.75, "STATE": None, "EMPTY": {}},
+    )
+    message_type, headers, data = await _read(
+        encode_request(
+            method="putParamset", params=params, headers=(("Authorization", "Basic dGVzdA=="),)
+        )
+    )
+    assert headers == {"Authorization": "Basic dGVzdA=="}
+    method, decoded = decode_request(data=data)
+    assert method == "putParamset"
+    # None is sent as empty string, like the CCU does
+    assert decoded[:-1] == params[:-1]
+    assert decoded[-1] == {"LEVEL": 0.75, "STATE": "", "EMPTY": {}}
+
+    message_type, _, data = await _read(encode_response(value={"VERSION": "2.1", "COUNT": 3}))
+    assert decode_response(message_type=message_type, data=data) == {
+        "VERSION": "2.1",
+        "COUNT": 3,
+    }
+
+    message_type, _, data = await _read(encode_fault(fault_code=-2, fault_string="Unknown"))
+    with pytest.raises(xmlrpc.client.Fault) as fault:
+        decode_response(message_type=message_type, data=data)
+    assert fault.value.faultCode == -2
+    assert fault.value.faultString == "Unknown"
+
+    with pytest.raises(xmlrpc.client.ResponseError):
+        await _read(b"Xml\x00\x00\x00\x00\x00")
+    with pytest.raises(xmlrpc.client.ResponseError):
+        decode_request(data=encode_request(method="event", params=("a", 1))[8:-2])
+    with pytest.raises(TypeError):
+        encode_response(value=object())
+
+
+@pytest.mark.asyncio
+async def test_bin_rpc_proxy() -> None:
+    """Test the BIN-RPC proxy against the local BIN-RPC server."""
+    server = LocalBinRpcServer()
+    server.load_devices(filenames=("HM-LC-Sw1-Pl-DN-R1.json",))
+    await server.start()
+    proxy = BinRpcProxy(
+        interface_id=const.INTERFACE_ID,
+        connection_state=CentralConnectionState(),
+        host=LOCAL_HOST,
+        port=server.port,
+        headers=[("Authorization", "Basic dGVzdA==")],
+        max_connections=2,
+    )
+    try:
+        await proxy.do_init()
+        assert "putParamset" in proxy.supported_methods
+        assert "Homegear" in await proxy.getVersion()
+        assert len(await proxy.listDevices(const.INTERFACE_ID)) == 3
+        assert await proxy.getValue("VCU0000299:1", "STATE") is False
+        await proxy.setValue("VCU0000299:1", "STATE", True)
+        await proxy.putParamset("VCU0000299:1", "MASTER", {"AES_ACTIVE": 1})
+        assert await proxy.getValue("VCU0000299:1", "STATE") is True
+        assert (await proxy.getParamset("VCU0000299:1", "MASTER"))["AES_ACTIVE"] == 1
+        assert await proxy.system.multicall(
+            [
+                {"methodName": "getValue", "params": ["VCU0000299:1", "STATE"]},
+                {"methodName": "getValue", "params": ["VCU0000299:1", "WORKING"]},
+            ]
+        ) == [[True], [False]]
+
+        # concurrent requests use the kept open connections
+        assert await asyncio.gather(*(proxy.getVersion() for _ in range(5)))
+        assert len(proxy._idle_connections) == 2
+
+        with pytest.raises(ClientException):
+            await proxy.getParamsetDescription("VCU0000000:1", "VALUES")
+        with pytest.raises(ClientException):
+            await proxy.setValue("VCU0000299:1", "UNKNOWN", 1)
+
+        # a connection closed by the backend is reopened
+        for _, writer in proxy._idle_connections:
+            writer.transport.abort()
+        await asyncio.sleep(0)
+        assert await proxy.getValue("VCU0000299:1", "STATE") is True
+    finally:
+        await proxy.stop()
+        await server.stop()
+
+    with pytest.raises(NoConnectionException):
+        await proxy.getVersion()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_bin_rpc_server(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test the BIN-RPC server routes the callbacks to the central."""
+    central, _, _ = central_client_factory
+    port = find_free_port()
+    server = await create_bin_rpc_server(ip_addr=LOCAL_HOST, port=port)
+    assert server.started is True
+    assert await create_bin_rpc_server(ip_addr=LOCAL_HOST, port=port) is server
+    server.add_central(central)
+    dp = central.get_generic_data_point("VCU2128127:4", "STATE")
+    assert dp.value is None
+
+    proxy = BinRpcProxy(
+        interface_id=const.INTERFACE_ID,
+        connection_state=CentralConnectionState(),
+        host=LOCAL_HOST,
+        port=port,
+        headers=[],
+    )
+    try:
+        await proxy.do_init()
+        assert "system.multicall" in proxy.supported_methods
+        assert await proxy.listDevices(const.INTERFACE_ID)
+        assert await proxy.event(const.INTERFACE_ID, "VCU2128127:4", "STATE", True) == ""
+        await central.looper.block_till_done()
+        assert dp.value is True
+
+        await proxy.system.multicall(
+            [
+                {
+                    "methodName": "event",
+                    "params": [const.INTERFACE_ID, "VCU2128127:4", "STATE", False],
+                },
+            ]
+        )
+        await central.looper.block_till_done()
+        assert dp.value is False
+
+        # errors of the handlers are returned as fault
+        with pytest.raises(ClientException):
+            await proxy.event(const.INTERFACE_ID)
+    finally:
+        await proxy.stop()
+        server.remove_central(central)
+        await server.stop()
+    assert server.started is False
+
+
+@pytest.mark.asyncio
+async def test_central_bin_rpc(tmp_path) -> None:
+    """Test a central, that communicates with the backend via BIN-RPC."""
+    server = LocalBinRpcServer()
+    server.load_devices(filenames=("HM-LC-Sw1-Pl-DN-R1.json",))
+    await server.start()
+    central = CentralConfig(
+        name=const.CENTRAL_NAME,
+        host=LOCAL_HOST,
+        username=const.CCU_USERNAME,
+        password=const.CCU_PASSWORD,
+        central_id="test1234",
+        storage_folder=str(tmp_path),
+        interface_configs={
+            InterfaceConfig(
+                central_name=const.CENTRAL_NAME,
+                interface=Interface.BIDCOS_RF,
+                port=server.port,
+                rpc_protocol=RpcProtocol.BIN_RPC,
+            )
+        },
+        default_callback_port=find_free_port(),
+        client_session=None,
+        listen_ip_addr=LOCAL_HOST,
+        periodic_refresh_interval=1,
+        program_scan_enabled=False,
+        rpc_server_type=RpcServerType.ASYNC,
+        sysvar_scan_enabled=False,
+    ).create_central()
+    # the scheduled tasks finish their interval on stop
+    with patch("hahomematic.config.CONNECTION_CHECKER_INTERVAL", 1):
+        try:
+            await central.start()
+            client = central.get_client(const.INTERFACE_ID)
+            assert isinstance(client._proxy, BinRpcProxy)
+            assert (
+                client._config.init_url
+                == f"xmlrpc_bin://{LOCAL_HOST}:{central.bin_rpc_listen_port}"
+            )
+            assert server.callback_interface_ids == (const.INTERFACE_ID,)
+
+            # the devices are pushed by the backend via the BIN-RPC callback
+            for _ in range(100):
+                if central.get_device("VCU0000299"):
+                    break
+                await asyncio.sleep(0.05)
+            assert central.get_device("VCU0000299")
+
+            dp = central.get_generic_data_point("VCU0000299:1", "STATE")
+            await dp.send_value(True)
+            await server.block_till_done()
+            for _ in range(100):
+                if dp.value is True:
+                    break
+                await asyncio.sleep(0.05)
+            assert dp.value is True
+            assert ("setValue", ("VCU0000299:1", "STATE", True)) in server.calls
+        finally:
+            await central.stop()
+            await server.stop()
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import asyncio
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from pathlib import Path
+import threading
 from typing import Any
-from unittest.mock import Mock, call, patch
+from unittest.mock import AsyncMock, Mock, PropertyMock, call, patch
 
+import orjson
 import pytest
 
+from hahomematic.caches import persistent
+from hahomematic.caches.persistent import ParamsetDescriptionCache
 from hahomematic.central import CentralUnit
 from hahomematic.client import Client
 from hahomematic.config import PING_PONG_MISMATCH_COUNT
@@ -16,6 +23,10 @@ from hahomematic.const import (
     DEFAULT_INCLUDE_INTERNAL_PROGRAMS,
     DEFAULT_INCLUDE_INTERNAL_SYSVARS,
     LOCAL_HOST,
+    MAX_CACHE_AGE,
+    MAX_DEVICE_DATA_DELTA_AGE,
+    NO_CACHE_ENTRY,
+    DataOperationResult,
     DataPointCategory,
     DataPointUsage,
     EventKey,
@@ -27,6 +38,7 @@ from hahomematic.const import (
     ParamsetKey,
 )
 from hahomematic.exceptions import HaHomematicException, NoClientsException
+from hahomematic_support.client_local import ClientLocal
 
 from tests import const, helper
 
@@ -69,6 +81,432 @@ async def test_central_basics(
     assert dps
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_central_data_cache_delta(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test that the changed device data is merged into the data cache."""
+    central, _, _ = central_client_factory
+    data_cache = central.data_cache
+    client = central.primary_client
+    assert client
+    interface = client.interface
+    fetch_all_device_data = AsyncMock()
+    with patch.object(client, "fetch_all_device_data", fetch_all_device_data):
+        # the first load fetches all data
+        await data_cache.load(direct_call=True, interface=interface)
+        fetch_all_device_data.assert_called_once_with(since=None)
+
+        refreshed_at = datetime.now()
+        data_cache.add_data(
+            interface=interface,
+            all_device_data={"VCU2128127:4": {"STATE": False, "WORKING": False}},
+            refreshed_at=refreshed_at,
+        )
+        data_cache.merge_data(
+            interface=interface,
+            all_device_data={"VCU2128127:4": {"STATE": True}, "VCU6354483:1": {"HUMIDITY": 45}},
+            refreshed_at=refreshed_at,
+        )
+        assert data_cache.get_data(interface, "VCU2128127:4", "STATE") is True
+        assert data_cache.get_data(interface, "VCU2128127:4", "WORKING") is False
+        assert data_cache.get_data(interface, "VCU6354483:1", "HUMIDITY") == 45
+        assert data_cache.get_data(interface, "VCU6354483:1", "TEMPERATURE") == NO_CACHE_ENTRY
+
+        # later loads fetch only the data changed since the last refresh
+        fetch_all_device_data.reset_mock()
+        await data_cache.load(direct_call=True, interface=interface)
+        fetch_all_device_data.assert_called_once_with(since=refreshed_at)
+
+        # outdated data is not used, but kept for the next delta
+        outdated_at = refreshed_at - timedelta(seconds=MAX_CACHE_AGE + 1)
+        data_cache.merge_data(interface=interface, all_device_data={}, refreshed_at=outdated_at)
+        assert data_cache.get_data(interface, "VCU2128127:4", "STATE") == NO_CACHE_ENTRY
+        fetch_all_device_data.reset_mock()
+        await data_cache.load(direct_call=True, interface=interface)
+        fetch_all_device_data.assert_called_once_with(since=outdated_at)
+
+        # too old data is replaced by all data
+        data_cache.merge_data(
+            interface=interface,
+            all_device_data={},
+            refreshed_at=refreshed_at - timedelta(seconds=MAX_DEVICE_DATA_DELTA_AGE + 1),
+        )
+        fetch_all_device_data.reset_mock()
+        await data_cache.load(direct_call=True, interface=interface)
+        fetch_all_device_data.assert_called_once_with(since=None)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_persistent_cache_dirty_tracking(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Test that the persistent caches are saved only after a change."""
+    central, _, _ = central_client_factory
+    # the caches are written to the storage folder in the working directory
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(type(central.config), "use_caches", PropertyMock(return_value=True))
+    paramset_descriptions = central.paramset_descriptions
+    await paramset_descriptions.save()
+    assert paramset_descriptions.data_changed is False
+    assert paramset_descriptions.dirty_regions == ()
+    assert await paramset_descriptions.save() == DataOperationResult.NO_SAVE
+
+    # re-adding the same description marks the cache dirty, but does not change the file
+    channel_address = "VCU2128127:4"
+    paramset_description = paramset_descriptions.get_paramset_key_descriptions(
+        interface_id=const.INTERFACE_ID,
+        channel_address=channel_address,
+        paramset_key=ParamsetKey.VALUES,
+    )
+    paramset_descriptions.add(
+        interface_id=const.INTERFACE_ID,
+        channel_address=channel_address,
+        paramset_key=ParamsetKey.VALUES,
+        paramset_description=paramset_description,
+    )
+    assert paramset_descriptions.data_changed is True
+    assert paramset_descriptions.dirty_regions == (const.INTERFACE_ID,)
+    assert await paramset_descriptions.save() == DataOperationResult.NO_SAVE
+    assert paramset_descriptions.data_changed is False
+
+    device = central.get_device("VCU2128127")
+    assert device
+    paramset_descriptions.remove_device(device=device)
+    assert paramset_descriptions.dirty_regions == (const.INTERFACE_ID,)
+    assert await paramset_descriptions.save() == DataOperationResult.SAVE_SUCCESS
+    assert paramset_descriptions.data_changed is False
+    assert paramset_descriptions.dirty_regions == ()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_persistent_cache_shards(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Test that the persistent caches are stored in shards per interface and model."""
+    central, _, _ = central_client_factory
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(type(central.config), "use_caches", PropertyMock(return_value=True))
+    shard_threads: list[threading.Thread] = []
+    get_shards = central.paramset_descriptions._get_shards
+
+    def _get_shards(region: str) -> Any:
+        shard_threads.append(threading.current_thread())
+        return get_shards(region=region)
+
+    await central.save_caches(save_device_descriptions=True, save_paramset_descriptions=True)
+    with patch.object(central.paramset_descriptions, "_get_shards", side_effect=_get_shards):
+        await central.flush_caches()
+    # the shards are collected in the event loop, and only written in the executor
+    assert shard_threads == [threading.current_thread()]
+    for cache in (central.device_descriptions, central.paramset_descriptions):
+        shard_dir = Path(cache._shard_dir)
+        manifest = orjson.loads((shard_dir / "manifest.json").read_bytes())
+        assert {entry["model"] for entry in manifest["shards"].values()} == {
+            "HmIP-BSM",
+            "HmIP-STHD",
+        }
+        assert sorted(path.name for path in shard_dir.iterdir()) == sorted(
+            [
+                "manifest.json",
+                *(
+                    persistent._get_shard_file_name(
+                        shard_name=shard_name, checksum=entry["checksum"]
+                    )
+                    for shard_name, entry in manifest["shards"].items()
+                ),
+            ]
+        )
+
+    # a fresh cache reads the shards of the interfaces of the central
+    paramset_descriptions = ParamsetDescriptionCache(central=central)
+    assert await paramset_descriptions.load() == DataOperationResult.LOAD_SUCCESS
+    assert orjson.dumps(
+        paramset_descriptions.raw_paramset_descriptions, option=orjson.OPT_NON_STR_KEYS
+    ) == orjson.dumps(
+        central.paramset_descriptions.raw_paramset_descriptions, option=orjson.OPT_NON_STR_KEYS
+    )
+    assert await paramset_descriptions.load() == DataOperationResult.NO_LOAD
+
+    # only the shard of the changed model and the manifest are written
+    shard_dir = Path(central.paramset_descriptions._shard_dir)
+    bsm_shard_name = central.paramset_descriptions._get_shard_name(
+        region=const.INTERFACE_ID, model="HmIP-BSM"
+    )
+    old_bsm_file_name = persistent._get_shard_file_name(
+        shard_name=bsm_shard_name,
+        checksum=central.paramset_descriptions._manifest[bsm_shard_name]["checksum"],
+    )
+    device = central.get_device("VCU6354483")
+    assert device
+    with patch(
+        "hahomematic.caches.persistent._write_file", wraps=persistent._write_file
+    ) as write_file:
+        central.paramset_descriptions.remove_device(device=device)
+        await central.paramset_descriptions.save()
+        central.device_descriptions.remove_device(device=device)
+        central.paramset_descriptions.add(
+            interface_id=const.INTERFACE_ID,
+            channel_address="VCU2128127:4",
+            paramset_key=ParamsetKey.VALUES,
+            paramset_description={},
+        )
+        await central.paramset_descriptions.save()
+    # the changed shard is written to a new file, and the replaced file is deleted
+    new_bsm_file_name = persistent._get_shard_file_name(
+        shard_name=bsm_shard_name,
+        checksum=central.paramset_descriptions._manifest[bsm_shard_name]["checksum"],
+    )
+    assert [call.kwargs["file_name"] for call in write_file.call_args_list] == [
+        "manifest.json",
+        new_bsm_file_name,
+        "manifest.json",
+    ]
+    assert sorted(path.name for path in shard_dir.iterdir()) == sorted(
+        ["manifest.json", new_bsm_file_name]
+    )
+    assert not (shard_dir / old_bsm_file_name).exists()
+
+    # a malformed manifest is ignored like a missing one
+    manifest_path = shard_dir / "manifest.json"
+    manifest_data = manifest_path.read_bytes()
+    manifest = orjson.loads(manifest_data)
+    incomplete_manifest = {
+        "version": manifest["version"],
+        "shards": {
+            shard_name: {"region": entry["region"]}
+            for shard_name, entry in manifest["shards"].items()
+        },
+    }
+    for malformed_data in (
+        manifest_data[: len(manifest_data) // 2],
+        orjson.dumps({"version": manifest["version"]}),
+        orjson.dumps(incomplete_manifest),
+    ):
+        manifest_path.write_bytes(malformed_data)
+        paramset_descriptions = ParamsetDescriptionCache(central=central)
+        assert await paramset_descriptions.load() == DataOperationResult.NO_LOAD
+        assert not paramset_descriptions.has_interface_id(interface_id=const.INTERFACE_ID)
+    manifest_path.write_bytes(manifest_data)
+    paramset_descriptions = ParamsetDescriptionCache(central=central)
+    assert await paramset_descriptions.load() == DataOperationResult.LOAD_SUCCESS
+
+    # a corrupt shard is detected by the checksum, and only its region is dropped
+    shard_path = shard_dir / new_bsm_file_name
+    shard_path.write_bytes(shard_path.read_bytes().replace(b"VALUES", b"VALUEZ"))
+    paramset_descriptions = ParamsetDescriptionCache(central=central)
+    assert await paramset_descriptions.load() == DataOperationResult.NO_LOAD
+    assert not paramset_descriptions.has_interface_id(interface_id=const.INTERFACE_ID)
+
+    # a missing shard does not fail the load
+    shard_path.unlink()
+    paramset_descriptions = ParamsetDescriptionCache(central=central)
+    assert await paramset_descriptions.load() == DataOperationResult.NO_LOAD
+    assert not paramset_descriptions.has_interface_id(interface_id=const.INTERFACE_ID)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_persistent_cache_save_delayed(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test that the requested saves of a burst are saved together."""
+    central, _, _ = central_client_factory
+    paramset_descriptions = central.paramset_descriptions
+    clock = [0.0]
+    # the timers are driven by the test: [(delay, callback, handle)]
+    timers: list[tuple[float, Callable[[], None], Mock]] = []
+
+    loop = asyncio.get_running_loop()
+    loop_call_later = loop.call_later
+
+    def call_later(delay: float, callback: Callable[..., None], *args: Any, **kwargs: Any) -> Any:
+        if callback != paramset_descriptions._start_save:
+            return loop_call_later(delay, callback, *args, **kwargs)
+        timers.append((delay, callback, handle := Mock()))
+        return handle
+
+    async def fire_timer() -> None:
+        _, callback, handle = timers[-1]
+        assert not handle.cancel.called
+        callback()
+        await central.looper.block_till_done()
+
+    with (
+        patch("hahomematic.config.CACHE_SAVE_DELAY", 5),
+        patch("hahomematic.config.CACHE_SAVE_MAX_DELAY", 60),
+        patch("hahomematic.caches.persistent.monotonic", side_effect=lambda: clock[0]),
+        patch.object(loop, "call_later", side_effect=call_later),
+        patch.object(paramset_descriptions, "save", AsyncMock()) as save,
+    ):
+        # every request restarts the delay
+        for timestamp in (0.0, 1.0, 2.0):
+            clock[0] = timestamp
+            await central.save_caches(save_paramset_descriptions=True)
+        assert [timer[0] for timer in timers] == [5, 5, 5]
+        assert [timer[2].cancel.called for timer in timers] == [True, True, False]
+        assert save.call_count == 0
+        await fire_timer()
+        assert save.call_count == 1
+
+        # the max delay is not exceeded by a long burst
+        timers.clear()
+        for timestamp in (10.0, 40.0, 68.0):
+            clock[0] = timestamp
+            await central.save_caches(save_paramset_descriptions=True)
+        assert [timer[0] for timer in timers] == [5, 5, 2]
+        await fire_timer()
+        assert save.call_count == 2
+
+        # a flush saves the scheduled changes now
+        timers.clear()
+        await central.save_caches(save_paramset_descriptions=True)
+        await central.flush_caches()
+        assert save.call_count == 3
+        assert timers[-1][2].cancel.called
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_paramset_descriptions_shared_by_model(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test that the paramset descriptions are stored once per model and channel."""
+    central, _, _ = central_client_factory
+    paramset_descriptions = central.paramset_descriptions
+    device_description = central.device_descriptions.get_device_description(
+        interface_id=const.INTERFACE_ID, address="VCU2128127"
+    )
+    central.device_descriptions.add_device_description(
+        interface_id=const.INTERFACE_ID,
+        device_description={**device_description, "ADDRESS": "VCU0000099"},
+    )
+    paramset_description = paramset_descriptions.get_paramset_key_descriptions(
+        interface_id=const.INTERFACE_ID,
+        channel_address="VCU2128127:4",
+        paramset_key=ParamsetKey.VALUES,
+    )
+    for channel_address in ("VCU0000099:4", "VCU0000099:5"):
+        paramset_descriptions.add(
+            interface_id=const.INTERFACE_ID,
+            channel_address=channel_address,
+            paramset_key=ParamsetKey.VALUES,
+            paramset_description=orjson.loads(orjson.dumps(paramset_description)),
+        )
+    # the same channel of the same model is shared, other channels are not
+    assert (
+        paramset_descriptions.get_paramset_key_descriptions(
+            interface_id=const.INTERFACE_ID,
+            channel_address="VCU0000099:4",
+            paramset_key=ParamsetKey.VALUES,
+        )
+        is paramset_description
+    )
+    assert (
+        paramset_descriptions.get_paramset_key_descriptions(
+            interface_id=const.INTERFACE_ID,
+            channel_address="VCU0000099:5",
+            paramset_key=ParamsetKey.VALUES,
+        )
+        is not paramset_description
+    )
+    assert paramset_descriptions.get_parameter_data(
+        interface_id=const.INTERFACE_ID,
+        channel_address="VCU0000099:4",
+        paramset_key=ParamsetKey.VALUES,
+        parameter="STATE",
+    ) == paramset_description.get("STATE")
+
+    # the shared descriptions are written once, and the file format without sharing is still read
+    raw_paramset_descriptions = orjson.loads(
+        orjson.dumps(
+            paramset_descriptions.raw_paramset_descriptions, option=orjson.OPT_NON_STR_KEYS
+        )
+    )
+    shard = paramset_descriptions._get_shards(region=const.INTERFACE_ID)["HmIP-BSM"]
+    file_data = orjson.loads(
+        orjson.dumps(
+            paramset_descriptions._to_file_data(content=shard), option=orjson.OPT_NON_STR_KEYS
+        )
+    )
+    assert len(file_data["descriptions"]) < sum(len(paramsets) for paramsets in shard.values())
+    assert paramset_descriptions._from_file_data(data=file_data) == {
+        channel_address: raw_paramset_descriptions[const.INTERFACE_ID][channel_address]
+        for channel_address in shard
+    }
+    assert (
+        paramset_descriptions._from_legacy_file_data(data=raw_paramset_descriptions)
+        == raw_paramset_descriptions
+    )
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     (
@@ -594,6 +1032,108 @@ async def test_add_device(
     assert len(central._devices) == 2
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_add_device_of_known_model(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test that the paramsets of new devices are cloned from a known device of the model."""
+    central, _, _ = central_client_factory
+    dev_desc = helper.load_device_description(central=central, filename="HmIP-BSM.json")
+    get_paramset_description = ClientLocal._get_paramset_description
+    requested_addresses: list[str] = []
+    failing_device_addresses: set[str] = set()
+
+    async def _get_paramset_description(
+        client: ClientLocal, address: str, paramset_key: ParamsetKey
+    ) -> Any:
+        requested_addresses.append(address)
+        if paramset_key == ParamsetKey.MASTER and address[:10] in failing_device_addresses:
+            return None
+        return await get_paramset_description(
+            client, address=f"VCU2128127{address[10:]}", paramset_key=paramset_key
+        )
+
+    def _get_device_descriptions(address: str, firmware: str) -> Any:
+        return orjson.loads(
+            orjson.dumps(dev_desc)
+            .replace(b"VCU2128127", address.encode())
+            .replace(b'"FIRMWARE":"1.18.12"', f'"FIRMWARE":"{firmware}"'.encode())
+        )
+
+    with patch.object(
+        ClientLocal,
+        "_get_paramset_description",
+        autospec=True,
+        side_effect=_get_paramset_description,
+    ):
+        # the paramsets of a known model are verified with one sample request
+        await central.add_new_devices(
+            interface_id=const.INTERFACE_ID,
+            device_descriptions=_get_device_descriptions(address="VCU0000001", firmware="1.18.12"),
+        )
+        assert requested_addresses == ["VCU0000001:0"]
+        assert central.get_device("VCU0000001")
+        assert central.paramset_descriptions.get_paramset_key_descriptions(
+            interface_id=const.INTERFACE_ID,
+            channel_address="VCU0000001:4",
+            paramset_key=ParamsetKey.VALUES,
+        ) is central.paramset_descriptions.get_paramset_key_descriptions(
+            interface_id=const.INTERFACE_ID,
+            channel_address="VCU2128127:4",
+            paramset_key=ParamsetKey.VALUES,
+        )
+
+        # only the first device of an unknown firmware is fetched
+        requested_addresses.clear()
+        await central.add_new_devices(
+            interface_id=const.INTERFACE_ID,
+            device_descriptions=(
+                *_get_device_descriptions(address="VCU0000002", firmware="1.6.0"),
+                *_get_device_descriptions(address="VCU0000003", firmware="1.6.0"),
+            ),
+        )
+        assert len(requested_addresses) > 1
+        assert {address.split(":")[0] for address in requested_addresses} == {"VCU0000002"}
+        assert central.get_device("VCU0000002")
+        assert central.get_device("VCU0000003")
+        assert len(central.get_device("VCU0000003").generic_data_points) == len(
+            central.get_device("VCU2128127").generic_data_points
+        )
+
+        # a paramset, that is missing for the model, is fetched for the other devices
+        requested_addresses.clear()
+        failing_device_addresses.add("VCU0000004")
+        await central.add_new_devices(
+            interface_id=const.INTERFACE_ID,
+            device_descriptions=(
+                *_get_device_descriptions(address="VCU0000004", firmware="1.7.0"),
+                *_get_device_descriptions(address="VCU0000005", firmware="1.7.0"),
+            ),
+        )
+        assert {address.split(":")[0] for address in requested_addresses} == {
+            "VCU0000004",
+            "VCU0000005",
+        }
+        assert central.paramset_descriptions.get_paramset_key_descriptions(
+            interface_id=const.INTERFACE_ID,
+            channel_address="VCU0000005:0",
+            paramset_key=ParamsetKey.MASTER,
+        )
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     (
@@ -763,33 +1303,33 @@ async def test_central_services(
         include_internal=DEFAULT_INCLUDE_INTERNAL_SYSVARS
     )
 
-    assert len(mock_client.method_calls) == 42
+    assert len(mock_client.method_calls) == 23
     await central.load_and_refresh_data_point_data(
         interface=Interface.BIDCOS_RF, paramset_key=ParamsetKey.MASTER
     )
-    assert len(mock_client.method_calls) == 42
+    assert len(mock_client.method_calls) == 23
     await central.load_and_refresh_data_point_data(
         interface=Interface.BIDCOS_RF, paramset_key=ParamsetKey.VALUES
     )
-    assert len(mock_client.method_calls) == 60
+    assert len(mock_client.method_calls) == 41
 
     await central.get_system_variable(name="SysVar_Name")
     assert mock_client.method_calls[-1] == call.get_system_variable("SysVar_Name")
 
-    assert len(mock_client.method_calls) == 61
+    assert len(mock_client.method_calls) == 42
     await central.set_system_variable(name="sv_alarm", value=True)
     assert mock_client.method_calls[-1] == call.set_system_variable(name="sv_alarm", value=True)
-    assert len(mock_client.method_calls) == 62
+    assert len(mock_client.method_calls) == 43
     await central.set_system_variable(name="SysVar_Name", value=True)
-    assert len(mock_client.method_calls) == 62
+    assert len(mock_client.method_calls) == 43
 
     await central.set_install_mode(interface_id=const.INTERFACE_ID)
     assert mock_client.method_calls[-1] == call.set_install_mode(
         on=True, t=60, mode=1, device_address=None
     )
-    assert len(mock_client.method_calls) == 63
+    assert len(mock_client.method_calls) == 44
     await central.set_install_mode(interface_id="NOT_A_VALID_INTERFACE_ID")
-    assert len(mock_client.method_calls) == 63
+    assert len(mock_client.method_calls) == 44
 
     await central.get_client(interface_id=const.INTERFACE_ID).set_value(
         channel_address="123",
@@ -803,7 +1343,7 @@ async def test_central_services(
         parameter="LEVEL",
         value=1.0,
     )
-    assert len(mock_client.method_calls) == 64
+    assert len(mock_client.method_calls) == 45
 
     with pytest.raises(HaHomematicException):
         await central.get_client(interface_id="NOT_A_VALID_INTERFACE_ID").set_value(
@@ -812,7 +1352,7 @@ async def test_central_services(
             parameter="LEVEL",
             value=1.0,
         )
-    assert len(mock_client.method_calls) == 64
+    assert len(mock_client.method_calls) == 45
 
     await central.get_client(interface_id=const.INTERFACE_ID).put_paramset(
         channel_address="123",
@@ -822,14 +1362,14 @@ async def test_central_services(
     assert mock_client.method_calls[-1] == call.put_paramset(
         channel_address="123", paramset_key="VALUES", values={"LEVEL": 1.0}
     )
-    assert len(mock_client.method_calls) == 65
+    assert len(mock_client.method_calls) == 46
     with pytest.raises(HaHomematicException):
         await central.get_client(interface_id="NOT_A_VALID_INTERFACE_ID").put_paramset(
             channel_address="123",
             paramset_key=ParamsetKey.VALUES,
             values={"LEVEL": 1.0},
         )
-    assert len(mock_client.method_calls) == 65
+    assert len(mock_client.method_calls) == 46
 
     assert (
         central.get_generic_data_point(
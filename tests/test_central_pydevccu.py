@@ -7,7 +7,7 @@ import os
 import orjson
 import pytest
 
-from hahomematic.const import DataPointUsage
+from hahomematic.const import DataPointUsage, ParamsetKey
 from hahomematic.model.decorators import (
     get_public_attributes_for_config_property,
     get_public_attributes_for_info_property,
@@ -144,3 +144,37 @@ async def test_central_full(central_unit_full) -> None:
     )
     assert len(central_unit_full._devices) == 0
     assert len(central_unit_full.get_data_points(exclude_no_create=False)) == 0
+
+
+@pytest.mark.asyncio
+async def test_multicall_batch(central_unit_mini) -> None:
+    """Test the batching of read requests by system.multicall."""
+    client = central_unit_mini.get_client(const.INTERFACE_ID)
+    assert client.supports_multicall is True
+    device = next(device for device in central_unit_mini.devices if device.model == "HmIP-BWTH")
+    channel_address = f"{device.address}:1"
+
+    values = await client.get_value_batch(
+        channel_parameters=(
+            (channel_address, "ACTUAL_TEMPERATURE"),
+            (channel_address, "UNKNOWN_PARAMETER"),
+            ("UNKNOWN_ADDRESS:1", "STATE"),
+        )
+    )
+    # the failed calls of the batch are omitted
+    assert tuple(values) == ((channel_address, "ACTUAL_TEMPERATURE"),)
+
+    paramsets = await client.get_paramset_batch(
+        addresses=(channel_address, "UNKNOWN_ADDRESS:1"), paramset_key=ParamsetKey.MASTER
+    )
+    assert tuple(paramsets) == (channel_address,)
+
+    paramset_descriptions = await client.get_all_paramset_descriptions(
+        device_descriptions=(
+            central_unit_mini.device_descriptions.get_device_description(
+                interface_id=const.INTERFACE_ID, address=channel_address
+            ),
+        )
+    )
+    assert {ParamsetKey.MASTER, ParamsetKey.VALUES} <= set(paramset_descriptions[channel_address])
+    assert "ACTUAL_TEMPERATURE" in paramset_descriptions[channel_address][ParamsetKey.VALUES]
@@ -0,0 +1,103 @@
+"""Tests for the circuit breaker of hahomematic."""
+
+from __future__ import annotations
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from hahomematic.central import CentralUnit
+from hahomematic.client import Client
+from hahomematic.client.circuit_breaker import CircuitBreaker
+from hahomematic.const import CircuitBreakerState, EventKey, InterfaceEventType
+
+from tests import const, helper
+
+TEST_DEVICES: dict[str, str] = {
+    "VCU2128127": "HmIP-BSM.json",
+}
+
+# pylint: disable=protected-access
+
+
+def test_circuit_breaker() -> None:
+    """Test the states and the backoff of the circuit breaker."""
+    states: list[tuple[CircuitBreakerState, float]] = []
+    breaker = CircuitBreaker(
+        interface_id=const.INTERFACE_ID,
+        base_delay=10,
+        max_delay=40,
+        on_state_change=lambda state, retry_in: states.append((state, retry_in)),
+    )
+    assert breaker.state == CircuitBreakerState.CLOSED
+    assert breaker.allow_request() is True
+
+    for failure_count, max_delay in ((1, 10), (2, 20), (3, 40), (4, 40), (5, 40)):
+        breaker.record_failure()
+        assert breaker.failure_count == failure_count
+        assert breaker.state == CircuitBreakerState.OPEN
+        assert breaker.allow_request() is False
+        # the backoff is jittered and capped
+        assert max_delay / 2 <= states[-1][1] <= max_delay
+        assert 0 < breaker.retry_in <= max_delay
+
+    # after the backoff a probe is allowed
+    breaker._retry_at = 0.0
+    assert breaker.allow_request() is True
+    assert breaker.state == CircuitBreakerState.HALF_OPEN
+    assert breaker.retry_in == 0.0
+    breaker.record_success()
+    assert breaker.state == CircuitBreakerState.CLOSED
+    assert breaker.failure_count == 0
+    assert [state for state, _ in states[-2:]] == [
+        CircuitBreakerState.HALF_OPEN,
+        CircuitBreakerState.CLOSED,
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_client_reconnect_circuit_breaker(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test the reconnects of a client are guarded by the circuit breaker."""
+    central, _, factory = central_client_factory
+    client = central.get_client(interface_id=const.INTERFACE_ID)
+    factory.ha_event_mock.reset_mock()
+
+    with patch("hahomematic.client.RECONNECT_WAIT", 0):
+        with patch(
+            "hahomematic_support.client_local.ClientLocal.is_connected", return_value=False
+        ) as is_connected:
+            assert await client.reconnect() is False
+            assert client.circuit_breaker.state == CircuitBreakerState.OPEN
+            # no probe, while the circuit is open
+            assert await client.reconnect() is False
+            assert is_connected.call_count == 1
+
+        client.circuit_breaker._retry_at = 0.0
+        assert await client.reconnect() is True
+    assert client.circuit_breaker.state == CircuitBreakerState.CLOSED
+
+    breaker_events = [
+        call.args[1][EventKey.DATA][EventKey.STATE]
+        for call in factory.ha_event_mock.call_args_list
+        if call.args[1].get(EventKey.TYPE) == InterfaceEventType.CIRCUIT_BREAKER
+    ]
+    assert breaker_events == [
+        CircuitBreakerState.OPEN,
+        CircuitBreakerState.HALF_OPEN,
+        CircuitBreakerState.CLOSED,
+    ]
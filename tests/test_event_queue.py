@@ -0,0 +1,424 @@
+"""Tests for the event queue of hahomematic."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+
+from hahomematic.central import CentralUnit
+from hahomematic.central.event_queue import EventDispatcher, EventQueue
+from hahomematic.client import Client
+from hahomematic.const import EventPriority, EventQueueOverflowPolicy
+
+from tests import const, helper
+
+TEST_DEVICES: dict[str, str] = {
+    "VCU2128127": "HmIP-BSM.json",
+}
+
+# pylint: disable=protected-access
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_event_queue_coalescing(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test the coalescing of events in the event queue."""
+    central, _, factory = central_client_factory
+    event_queue = EventQueue(
+        central=central,
+        coalesce=True,
+        max_size=100,
+        overflow_policy=EventQueueOverflowPolicy.DROP_LOWEST_PRIORITY,
+    )
+    dp = central.get_generic_data_point("VCU2128127:4", "STATE")
+    factory.ha_event_mock.reset_mock()
+
+    event_queue.put(const.INTERFACE_ID, "VCU2128127:4", "STATE", True)
+    event_queue.put(const.INTERFACE_ID, "VCU2128127:1", "PRESS_SHORT", True)
+    event_queue.put(const.INTERFACE_ID, "VCU2128127:4", "STATE", False)
+    event_queue.put(const.INTERFACE_ID, "VCU2128127:1", "PRESS_SHORT", True)
+    event_queue.put_events(
+        const.INTERFACE_ID,
+        (("VCU2128127:4", "STATE", True), ("VCU2128127:0", "UNREACH", False)),
+    )
+    assert event_queue.depth == 4
+    assert event_queue.merged_count == 2
+    await central.looper.block_till_done()
+
+    assert event_queue.depth == 0
+    assert dp.value is True
+    press_events = [
+        call
+        for call in factory.ha_event_mock.call_args_list
+        if call.args[0] == "homematic.keypress"
+    ]
+    assert len(press_events) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_event_queue_without_coalescing(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test the event queue without coalescing."""
+    central, _, _ = central_client_factory
+    event_queue = EventQueue(
+        central=central,
+        coalesce=False,
+        max_size=100,
+        overflow_policy=EventQueueOverflowPolicy.DROP_LOWEST_PRIORITY,
+    )
+    dp = central.get_generic_data_point("VCU2128127:4", "STATE")
+
+    event_queue.put(const.INTERFACE_ID, "VCU2128127:4", "STATE", True)
+    event_queue.put(const.INTERFACE_ID, "VCU2128127:4", "STATE", False)
+    assert event_queue.depth == 2
+    await central.looper.block_till_done()
+
+    assert event_queue.merged_count == 0
+    assert dp.value is False
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_event_queue_overflow(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test the priorities and the overflow policies of the event queue."""
+    central, _, _ = central_client_factory
+    event_queue = EventQueue(
+        central=central,
+        coalesce=False,
+        max_size=3,
+        overflow_policy=EventQueueOverflowPolicy.DROP_LOWEST_PRIORITY,
+    )
+    event_queue.put(const.INTERFACE_ID, "VCU2128127:0", "RSSI_DEVICE", -60)
+    event_queue.put(const.INTERFACE_ID, "VCU2128127:0", "RSSI_DEVICE", -61)
+    event_queue.put(const.INTERFACE_ID, "VCU2128127:4", "STATE", True)
+    assert event_queue.get_depth(EventPriority.BULK) == 2
+    # the oldest bulk event is dropped
+    event_queue.put(const.INTERFACE_ID, "VCU2128127:0", "UNREACH", True)
+    event_queue.put(const.INTERFACE_ID, "VCU2128127:4", "STATE", False)
+    assert event_queue.depth == 3
+    assert event_queue.get_depth(EventPriority.BULK) == 0
+    assert event_queue.get_dropped_count(EventPriority.BULK) == 2
+    # no event with a lower priority left, so the new one is dropped
+    event_queue.put(const.INTERFACE_ID, "VCU2128127:0", "RSSI_DEVICE", -62)
+    assert event_queue.get_dropped_count(EventPriority.BULK) == 3
+    event_queue.put(const.INTERFACE_ID, "VCU2128127:0", "UNREACH", False)
+    assert event_queue.get_dropped_count(EventPriority.USER_VISIBLE) == 1
+    assert event_queue.get_depth(EventPriority.CONNECTIVITY) == 2
+    assert event_queue.dropped_count == 4
+
+    await central.looper.block_till_done()
+    assert event_queue.depth == 0
+    assert event_queue.max_wait_time >= event_queue.last_wait_time > 0
+    assert central.get_generic_data_point("VCU2128127:0", "UNREACH").value is False
+    assert central.get_generic_data_point("VCU2128127:4", "STATE").value is False
+
+    drop_newest_queue = EventQueue(
+        central=central,
+        coalesce=False,
+        max_size=1,
+        overflow_policy=EventQueueOverflowPolicy.DROP_NEWEST,
+    )
+    drop_newest_queue.put(const.INTERFACE_ID, "VCU2128127:4", "STATE", True)
+    drop_newest_queue.put(const.INTERFACE_ID, "VCU2128127:0", "UNREACH", True)
+    assert drop_newest_queue.get_dropped_count(EventPriority.CONNECTIVITY) == 1
+    await central.looper.block_till_done()
+    assert central.get_generic_data_point("VCU2128127:4", "STATE").value is True
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_event_queue_device_order(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test that the events of a device keep their order with mixed priorities."""
+    central, _, _ = central_client_factory
+    event_queue = EventQueue(
+        central=central,
+        coalesce=False,
+        max_size=100,
+        overflow_policy=EventQueueOverflowPolicy.DROP_LOWEST_PRIORITY,
+    )
+    events = (
+        (const.INTERFACE_ID, "VCU2128127:0", "RSSI_DEVICE", -60),
+        (const.INTERFACE_ID, "VCU0000000:1", "STATE", True),
+        (const.INTERFACE_ID, "VCU2128127:4", "STATE", True),
+        (const.INTERFACE_ID, "VCU2128127:0", "UNREACH", False),
+        (const.INTERFACE_ID, "VCU2128127:0", "RSSI_DEVICE", -61),
+    )
+    for event in events:
+        event_queue.put(*event)
+
+    # the connectivity event selects the device first, but its older events are not overtaken
+    assert event_queue._take() == (events[0], events[2], events[3], events[1], events[4])
+    assert event_queue.depth == 0
+    assert not event_queue._device_events
+    await central.looper.block_till_done()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_event_dispatcher(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test the per device ordering of the event dispatcher."""
+    central, _, _ = central_client_factory
+    dispatcher = EventDispatcher(central=central, max_pending=3, max_device_pending=3)
+    release = asyncio.Event()
+    processed: list[tuple[str, str, Any]] = []
+
+    async def data_point_events(interface_id: str, events: tuple[tuple[str, str, Any], ...]):
+        if events[0][0].startswith("SLOW"):
+            await release.wait()
+        processed.extend(events)
+
+    with patch.object(central, "data_point_events", side_effect=data_point_events):
+        dispatcher.dispatch(
+            events=(
+                (const.INTERFACE_ID, "SLOW:1", "STATE", 1),
+                (const.INTERFACE_ID, "FAST:1", "STATE", 1),
+            )
+        )
+        for _ in range(3):
+            await asyncio.sleep(0)
+        dispatcher.dispatch(
+            events=(
+                (const.INTERFACE_ID, "SLOW:1", "STATE", 2),
+                (const.INTERFACE_ID, "FAST:1", "STATE", 2),
+            )
+        )
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        # the slow device does not block the other device
+        assert processed == [("FAST:1", "STATE", 1), ("FAST:1", "STATE", 2)]
+        assert dispatcher.active_devices == 1
+        assert dispatcher.pending == 2
+
+        release.set()
+        await dispatcher.wait_for_capacity()
+        await central.looper.block_till_done()
+
+    assert processed[2:] == [("SLOW:1", "STATE", 1), ("SLOW:1", "STATE", 2)]
+    assert dispatcher.active_devices == 0
+    assert dispatcher.pending == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_event_dispatcher_cancelled(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test that a cancelled device task releases the capacity of its events."""
+    central, _, _ = central_client_factory
+    dispatcher = EventDispatcher(central=central, max_pending=2, max_device_pending=2)
+
+    async def data_point_events(interface_id: str, events: tuple[tuple[str, str, Any], ...]):
+        await asyncio.Event().wait()
+
+    with patch.object(central, "data_point_events", side_effect=data_point_events):
+        dispatcher.dispatch(events=((const.INTERFACE_ID, "SLOW:1", "STATE", 1),))
+        await asyncio.sleep(0)
+        dispatcher.dispatch(events=((const.INTERFACE_ID, "SLOW:1", "STATE", 2),))
+        await asyncio.sleep(0)
+        assert dispatcher.pending == 2
+        assert not dispatcher._capacity.is_set()
+
+        for task in asyncio.all_tasks():
+            if task.get_name() == "device-events-SLOW":
+                task.cancel()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+    assert dispatcher.active_devices == 0
+    assert dispatcher.pending == 0
+    assert dispatcher._capacity.is_set()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_event_queue_process_cancelled(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test that the event queue restarts the processing after a cancelled process task."""
+    central, _, _ = central_client_factory
+    event_queue = EventQueue(
+        central=central,
+        coalesce=True,
+        max_size=100,
+        overflow_policy=EventQueueOverflowPolicy.DROP_LOWEST_PRIORITY,
+    )
+    dp = central.get_generic_data_point("VCU2128127:4", "STATE")
+    # only the first wait blocks
+    blocked = [False, True]
+
+    async def wait_for_capacity() -> None:
+        if blocked.pop():
+            await asyncio.Event().wait()
+
+    with patch.object(event_queue.dispatcher, "wait_for_capacity", side_effect=wait_for_capacity):
+        event_queue.put(const.INTERFACE_ID, "VCU2128127:4", "STATE", True)
+        for _ in range(3):
+            await asyncio.sleep(0)
+        event_queue.put(const.INTERFACE_ID, "VCU2128127:4", "STATE", False)
+        assert event_queue.depth == 1
+
+        for task in asyncio.all_tasks():
+            if task.get_name() == "event-queue":
+                task.cancel()
+        await asyncio.sleep(0)
+        await central.looper.block_till_done()
+
+    assert event_queue.depth == 0
+    assert event_queue._processing is False
+    assert dp.value is False
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_event_queue_device_limit(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test that a blocked device over its limit does not block the other devices."""
+    central, _, _ = central_client_factory
+    with patch("hahomematic.central.event_queue._MAX_DISPATCHED_DEVICE_EVENTS", 2):
+        event_queue = EventQueue(
+            central=central,
+            coalesce=False,
+            max_size=100,
+            overflow_policy=EventQueueOverflowPolicy.DROP_LOWEST_PRIORITY,
+        )
+    release = asyncio.Event()
+    processed: list[tuple[str, str, Any]] = []
+
+    async def data_point_events(interface_id: str, events: tuple[tuple[str, str, Any], ...]):
+        if events[0][0].startswith("SLOW"):
+            await release.wait()
+        processed.extend(events)
+
+    with patch.object(central, "data_point_events", side_effect=data_point_events):
+        for value in range(5):
+            event_queue.put(const.INTERFACE_ID, "SLOW:1", "STATE", value)
+        for _ in range(5):
+            await asyncio.sleep(0)
+        event_queue.put(const.INTERFACE_ID, "FAST:1", "STATE", 1)
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        # the events over the limit of the slow device stay in the queue
+        assert processed == [("FAST:1", "STATE", 1)]
+        assert event_queue.depth == 3
+        assert event_queue.dispatcher.pending == 2
+        assert event_queue._processing is False
+
+        release.set()
+        await central.looper.block_till_done()
+
+    assert processed[1:] == [("SLOW:1", "STATE", value) for value in range(5)]
+    assert event_queue.depth == 0
+    assert event_queue.dispatcher.pending == 0
+    assert not event_queue.dispatcher._device_pending
@@ -0,0 +1,116 @@
+"""Tests for the event recorder of hahomematic."""
+
+from __future__ import annotations
+
+import os
+from unittest.mock import Mock
+from xmlrpc.client import Binary, DateTime
+
+import pytest
+
+from hahomematic.central import CentralUnit, xml_rpc_server as xmlrpc
+from hahomematic.central.event_recorder import read_records
+from hahomematic.client import Client
+from hahomematic.const import LOCAL_HOST, RecordType
+from hahomematic.support import find_free_port
+from hahomematic_support.event_replay import replay_recording
+
+from tests import const, helper
+
+TEST_DEVICES: dict[str, str] = {
+    "VCU2128127": "HmIP-BSM.json",
+}
+
+# pylint: disable=protected-access
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_record_and_replay(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+    tmp_path,
+) -> None:
+    """Test recording and replaying of backend calls."""
+    central, _, _ = central_client_factory
+    file_path = os.path.join(tmp_path, "recording", "events.rec")
+    server = await xmlrpc.create_async_xml_rpc_server(ip_addr=LOCAL_HOST, port=find_free_port())
+    server.add_central(central)
+    recorder = server.start_recording(file_path=file_path)
+    rpc_functions = xmlrpc.RPCFunctions(server)
+
+    rpc_functions.event(const.INTERFACE_ID, "VCU2128127:4", "STATE", True)
+    rpc_functions.event(const.INTERFACE_ID, "VCU2128127:4", "STATE", False)
+    rpc_functions.deleteDevices(const.INTERFACE_ID, ["VCU0000000"])
+    assert recorder.record_count == 3
+    server.stop_recording()
+    assert recorder.is_recording is False
+    rpc_functions.event(const.INTERFACE_ID, "VCU2128127:4", "STATE", True)
+    await central.looper.block_till_done()
+
+    records = tuple(read_records(file_path=file_path))
+    assert [record.record_type for record in records] == [
+        RecordType.SESSION,
+        RecordType.EVENT,
+        RecordType.EVENT,
+        RecordType.DELETE_DEVICES,
+    ]
+    assert records[1].args == (const.INTERFACE_ID, "VCU2128127:4", "STATE", True)
+    assert records[1].timestamp <= records[2].timestamp <= records[3].timestamp
+
+    dp = central.get_generic_data_point("VCU2128127:4", "STATE")
+    assert dp.value is True
+    result = await replay_recording(
+        central=central, file_path=file_path, speed=None, trace_memory=True
+    )
+    assert result.record_count == 3
+    assert result.event_count == 2
+    assert len(result.latencies) == 2
+    assert result.max_latency >= result.mean_latency >= 0.0
+    assert result.get_latency_percentile(50) <= result.max_latency
+    assert result.peak_memory
+    assert dp.value is False
+
+    result = await replay_recording(
+        central=central, file_path=file_path, speed=100.0, interface_id=const.INTERFACE_ID
+    )
+    assert result.replay_duration >= result.recorded_duration / 100.0
+    assert dp.value is False
+
+    # a new session is appended to the recording
+    server.start_recording(file_path=file_path)
+    datetime_value = DateTime("20241216T12:00:00")
+    binary_value = Binary(b"\x00\x01")
+    rpc_functions.event(const.INTERFACE_ID, "VCU2128127:0", "TIME", datetime_value)
+    rpc_functions.event(const.INTERFACE_ID, "VCU2128127:0", "DATA", binary_value)
+    server.stop_recording()
+    await central.looper.block_till_done()
+    records = tuple(read_records(file_path=file_path))
+    assert [record.record_type for record in records[4:]] == [
+        RecordType.SESSION,
+        RecordType.EVENT,
+        RecordType.EVENT,
+    ]
+    assert records[5].args[3] == datetime_value
+    assert records[6].args[3] == binary_value
+
+    result = await replay_recording(central=central, file_path=file_path, speed=None)
+    assert result.record_count == 5
+    assert result.recorded_duration == pytest.approx(
+        records[3].timestamp - records[0].timestamp + records[6].timestamp - records[4].timestamp
+    )
+    assert result.peak_memory is None
+
+    server.remove_central(central)
+    await server.stop()
@@ -2,11 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta
 import json
+import re
+from typing import Any
+from unittest.mock import AsyncMock, patch
 
 import orjson
 import pytest
 
+from hahomematic.central import CentralConnectionState
+from hahomematic.client.json_rpc import JsonRpcAioHttpClient, _JsonRpcMethod
+from hahomematic.client.json_rpc_decoder import DeviceDataDecoder, JsonRpcResponseDecoder
+from hahomematic.const import Interface, ParamsetKey
+
 SUCCESS = '{"HmIP-RF.0001D3C99C3C93%3A0.CONFIG_PENDING":false,\r\n"VirtualDevices.INT0000001%3A1.SET_POINT_TEMPERATURE":4.500000,\r\n"VirtualDevices.INT0000001%3A1.SWITCH_POINT_OCCURED":false,\r\n"VirtualDevices.INT0000001%3A1.VALVE_STATE":4,\r\n"VirtualDevices.INT0000001%3A1.WINDOW_STATE":0,\r\n"HmIP-RF.001F9A49942EC2%3A0.CARRIER_SENSE_LEVEL":10.000000,\r\n"HmIP-RF.0003D7098F5176%3A0.UNREACH":false,\r\n"BidCos-RF.OEQ1860891%3A0.UNREACH":true,\r\n"BidCos-RF.OEQ1860891%3A0.STICKY_UNREACH":true,\r\n"BidCos-RF.OEQ1860891%3A1.INHIBIT":false,\r\n"HmIP-RF.000A570998B3FB%3A0.CONFIG_PENDING":false,\r\n"HmIP-RF.000A570998B3FB%3A0.UPDATE_PENDING":false,\r\n"HmIP-RF.000A5A4991BDDC%3A0.CONFIG_PENDING":false,\r\n"HmIP-RF.000A5A4991BDDC%3A0.UPDATE_PENDING":false,\r\n"BidCos-RF.NEQ1636407%3A1.STATE":0,\r\n"BidCos-RF.NEQ1636407%3A2.STATE":false,\r\n"BidCos-RF.NEQ1636407%3A2.INHIBIT":false,\r\n"CUxD.CUX2800001%3A12.TS":"0"}'
 FAILURE = '{"HmIP-RF.0001D3C99C3C93%3A0.CONFIG_PENDING":false,\r\n"VirtualDevices.INT0000001%3A1.SET_POINT_TEMPERATURE":4.500000,\r\n"VirtualDevices.INT0000001%3A1.SWITCH_POINT_OCCURED":false,\r\n"VirtualDevices.INT0000001%3A1.VALVE_STATE":4,\r\n"VirtualDevices.INT0000001%3A1.WINDOW_STATE":0,\r\n"HmIP-RF.001F9A49942EC2%3A0.CARRIER_SENSE_LEVEL":10.000000,\r\n"HmIP-RF.0003D7098F5176%3A0.UNREACH":false,\r\n,\r\n,\r\n"BidCos-RF.OEQ1860891%3A0.UNREACH":true,\r\n"BidCos-RF.OEQ1860891%3A0.STICKY_UNREACH":true,\r\n"BidCos-RF.OEQ1860891%3A1.INHIBIT":false,\r\n"HmIP-RF.000A570998B3FB%3A0.CONFIG_PENDING":false,\r\n"HmIP-RF.000A570998B3FB%3A0.UPDATE_PENDING":false,\r\n"HmIP-RF.000A5A4991BDDC%3A0.CONFIG_PENDING":false,\r\n"HmIP-RF.000A5A4991BDDC%3A0.UPDATE_PENDING":false,\r\n"BidCos-RF.NEQ1636407%3A1.STATE":0,\r\n"BidCos-RF.NEQ1636407%3A2.STATE":false,\r\n"BidCos-RF.NEQ1636407%3A2.INHIBIT":false,\r\n"CUxD.CUX2800001%3A12.TS":"0"}'
 
@@ -34,3 +45,289 @@ def test_defect_json() -> None:
         json = "{" + '"name": "Text mit Wert ' + sc + '"' + "}"
         with pytest.raises(orjson.JSONDecodeError):
             orjson.loads(json)
+
+
+@pytest.mark.asyncio
+async def test_json_rpc_single_flight() -> None:
+    """Test that identical concurrent reads share one request."""
+    json_rpc_client = JsonRpcAioHttpClient(
+        username="user",
+        password="pass",
+        device_url="http://127.0.0.1",
+        connection_state=CentralConnectionState(),
+    )
+
+    async def post(*args, **kwargs):
+        await asyncio.sleep(0)
+        return {"result": {"STATE": True}, "error": None}
+
+    with patch.object(
+        json_rpc_client, "_do_post_with_session", AsyncMock(side_effect=post)
+    ) as do_post:
+        results = await asyncio.gather(
+            *(
+                json_rpc_client.get_paramset(
+                    interface=Interface.HMIP_RF, address=address, paramset_key=ParamsetKey.VALUES
+                )
+                for address in ("VCU0000001:1", "VCU0000001:1", "VCU0000002:1")
+            )
+        )
+        assert results == [{"STATE": True}] * 3
+        assert do_post.call_count == 2
+        assert json_rpc_client.single_flight.hit_count == 1
+        assert json_rpc_client.single_flight.miss_count == 2
+
+        # writes are never shared
+        await asyncio.gather(
+            *(
+                json_rpc_client.set_value(
+                    interface=Interface.HMIP_RF,
+                    address="VCU0000001:1",
+                    parameter="STATE",
+                    value_type="bool",
+                    value=True,
+                )
+                for _ in range(2)
+            )
+        )
+        assert do_post.call_count == 4
+        assert json_rpc_client.single_flight.hit_count == 1
+
+
+BOOTSTRAP = (
+    '{"deviceDetails":[{"id":"1001","address":"VCU0000001","name":"Wohnzimmer%20L%C3%BCfter",'
+    '"interface":"HmIP-RF","channels":[{"id":"1002","address":"VCU0000001%3A1","name":"K%FCche"}]},'
+    '{"id":"1003","address":"VCU0000002","name":"Unknown","interface":"Unknown","channels":[]}],'
+    '"rooms":[{"id":"2001","name":"Wohnzimmer","channelIds":["1002"]}],'
+    '"functions":[{"id":"3001","name":"Licht","channelIds":["1001","1002"]}],'
+    '"deviceData":{"HmIP-RF":{"HmIP-RF.VCU0000001%3A1.STATE":true,'
+    '"HmIP-RF.VCU0000001%3A1.LEVEL":0.500000},"BidCos-RF":{}},'
+    '"systemVariables":[{"id":"4001","name":"Anwesend","type":"LOGIC","isInternal":false,'
+    '"value":"true","unit":"","description":"Anwesenheit%20hahm"},'
+    '{"id":"4002","name":"Intern","type":"NUMBER","isInternal":true,"value":"1.5","unit":"",'
+    '"minValue":"0","maxValue":"10","description":""}],'
+    '"programs":[{"id":"5001","name":"Licht%20an","isActive":true,"isInternal":false,'
+    '"lastExecuteTime":"","description":"Schaltet%20das%20Licht"}]}'
+)
+
+
+class _FakeContent:
+    """Content of a response of the fake client session."""
+
+    def __init__(self, body: bytes) -> None:
+        """Init the content."""
+        self._body = body
+
+    async def iter_chunked(self, n: int) -> AsyncIterator[bytes]:
+        """Return the body in chunks of 7 bytes."""
+        for pos in range(0, len(self._body), 7):
+            yield self._body[pos : pos + 7]
+
+
+class _FakeResponse:
+    """Response of the fake client session."""
+
+    def __init__(self, result: Any) -> None:
+        """Init the response."""
+        self.status = 200
+        self._result = result
+        self.content = _FakeContent(orjson.dumps({"result": result, "error": None}))
+
+    async def json(self, encoding: str) -> dict[str, Any]:
+        """Return the json object of the response."""
+        return {"result": self._result, "error": None}
+
+
+class _FakeClientSession:
+    """Client session, that answers the json rpc requests after a delay."""
+
+    def __init__(self) -> None:
+        """Init the client session."""
+        self.methods: list[str] = []
+        self.scripts: list[str] = []
+
+    async def post(self, url: str, data: bytes, **kwargs: Any) -> _FakeResponse:
+        """Return the response to a request."""
+        method = orjson.loads(data)["method"]
+        self.methods.append(method)
+        await asyncio.sleep(0.01)
+        if method == _JsonRpcMethod.SESSION_LOGIN:
+            return _FakeResponse("session_id")
+        if method == _JsonRpcMethod.SYSTEM_LIST_METHODS:
+            return _FakeResponse([{"name": name} for name in _JsonRpcMethod])
+        if method == _JsonRpcMethod.REGA_RUN_SCRIPT:
+            script = orjson.loads(data)["params"]["script"]
+            self.scripts.append(script)
+            if "sUse_Interfaces" in script:
+                return _FakeResponse(BOOTSTRAP)
+            if "sUse_Interface" in script:
+                return _FakeResponse(SUCCESS)
+            return _FakeResponse('[{"id": "1", "description": "Description"}]')
+        return _FakeResponse([])
+
+
+@pytest.mark.asyncio
+async def test_json_rpc_run_concurrently() -> None:
+    """Test that independent calls run concurrently with one session."""
+    client_session = _FakeClientSession()
+    json_rpc_client = JsonRpcAioHttpClient(
+        username="user",
+        password="pass",
+        device_url="http://127.0.0.1",
+        connection_state=CentralConnectionState(),
+        client_session=client_session,
+        max_concurrency=2,
+    )
+    assert json_rpc_client.max_concurrency == 2
+
+    results = await json_rpc_client.run_concurrently(
+        json_rpc_client.get_all_channel_ids_room,
+        json_rpc_client.get_all_channel_ids_function,
+        lambda: json_rpc_client.get_all_programs(include_internal=False),
+        lambda: json_rpc_client.get_all_system_variables(include_internal=False),
+    )
+    assert results == ({}, {}, (), ())
+    # the session is validated once and reused by all calls
+    assert client_session.methods.count(_JsonRpcMethod.SESSION_LOGIN) == 1
+    assert client_session.methods.count(_JsonRpcMethod.SYSTEM_LIST_METHODS) == 1
+    assert client_session.methods.count(_JsonRpcMethod.REGA_RUN_SCRIPT) == 2
+    assert json_rpc_client.max_requests_in_flight == 2
+
+    async def fail() -> None:
+        raise ValueError("failed")
+
+    with pytest.raises(ValueError):
+        await json_rpc_client.run_concurrently(json_rpc_client.get_all_channel_ids_room, fail)
+
+    # the sibling calls are cancelled and awaited, before the error is raised
+    cancelled: list[bool] = []
+
+    async def block() -> None:
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    with pytest.raises(ValueError):
+        await json_rpc_client.run_concurrently(block, fail)
+    assert cancelled == [True]
+
+
+def _decode_device_data(body: bytes, chunk_size: int) -> dict[str, Any]:
+    """Return the response decoded from chunks of the body."""
+    decoder = JsonRpcResponseDecoder(result_decoder=DeviceDataDecoder())
+    for pos in range(0, len(body), chunk_size):
+        decoder.feed(body[pos : pos + chunk_size])
+    return decoder.close()
+
+
+def test_json_rpc_decode_device_data() -> None:
+    """Test the incremental decoding of the device data."""
+    expected: dict[str, dict[str, Any]] = {}
+    for key, value in orjson.loads(SUCCESS).items():
+        address_key, _, parameter = key.rpartition(".")
+        channel_address = address_key.split(".", 1)[1].replace("%3A", ":")
+        expected.setdefault(channel_address, {})[parameter] = value
+    assert expected["INT0000001:1"]["SET_POINT_TEMPERATURE"] == 4.5
+
+    body = orjson.dumps({"id": 0, "version": "1.1", "result": SUCCESS, "error": None})
+    # also split the escape sequences and the multi byte characters
+    for chunk_size in (1, 2, 5, 64, len(body)):
+        response = _decode_device_data(body=body, chunk_size=chunk_size)
+        assert response == {"id": 0, "version": "1.1", "result": expected, "error": None}
+
+    unicode_response = {
+        "error": {"code": None},
+        "result": '{"HmIP-RF.VCU0000001%3A1.NAME":"\u00e4\U0001f600\u00f6"}',
+    }
+    for ensure_ascii in (True, False):
+        body = json.dumps(unicode_response, ensure_ascii=ensure_ascii).encode()
+        for chunk_size in (1, 3, len(body)):
+            response = _decode_device_data(body=body, chunk_size=chunk_size)
+            assert response["result"] == {"VCU0000001:1": {"NAME": "\u00e4\U0001f600\u00f6"}}
+            assert response["error"] == {"code": None}
+
+    assert _decode_device_data(body=b'{"result": "{}", "error": null}', chunk_size=1) == {
+        "result": {},
+        "error": None,
+    }
+    assert _decode_device_data(body=b'{"result": null, "error": "failed"}', chunk_size=1) == {
+        "result": None,
+        "error": "failed",
+    }
+
+    with pytest.raises(json.JSONDecodeError):
+        _decode_device_data(body=orjson.dumps({"result": SUCCESS})[:-20], chunk_size=64)
+    with pytest.raises(json.JSONDecodeError):
+        _decode_device_data(body=orjson.dumps({"result": FAILURE, "error": None}), chunk_size=64)
+
+
+@pytest.mark.asyncio
+async def test_json_rpc_get_all_device_data() -> None:
+    """Test that the device data is streamed into the per channel store."""
+    client_session = _FakeClientSession()
+    json_rpc_client = JsonRpcAioHttpClient(
+        username="user",
+        password="pass",
+        device_url="http://127.0.0.1",
+        connection_state=CentralConnectionState(),
+        client_session=client_session,
+    )
+    all_device_data = await json_rpc_client.get_all_device_data(interface=Interface.HMIP_RF)
+    assert all_device_data["0001D3C99C3C93:0"] == {"CONFIG_PENDING": False}
+    assert all_device_data["NEQ1636407:2"] == {"STATE": False, "INHIBIT": False}
+    assert all_device_data["CUX2800001:12"]["TS"] == "0"
+    assert 'sUse_Interface = "HmIP-RF";' in client_session.scripts[-1]
+    assert "iMax_Age" not in client_session.scripts[-1]
+
+    # the delta is requested by the age, because the clock of the backend may differ
+    await json_rpc_client.get_all_device_data(
+        interface=Interface.HMIP_RF, since=datetime.now() - timedelta(seconds=30)
+    )
+    max_age = re.search(r"integer iMax_Age = (\d+);", client_session.scripts[-1])
+    assert max_age
+    assert 32 <= int(max_age.group(1)) <= 33
+    assert "oDP.Timestamp().ToInteger() >= iSince" in client_session.scripts[-1]
+
+
+@pytest.mark.asyncio
+async def test_json_rpc_get_bootstrap_data() -> None:
+    """Test that the data required on start is fetched with one script."""
+    client_session = _FakeClientSession()
+    json_rpc_client = JsonRpcAioHttpClient(
+        username="user",
+        password="pass",
+        device_url="http://127.0.0.1",
+        connection_state=CentralConnectionState(),
+        client_session=client_session,
+    )
+    bootstrap_data = await json_rpc_client.get_bootstrap_data(
+        interfaces=(Interface.HMIP_RF, Interface.BIDCOS_RF),
+        include_internal_programs=False,
+        include_internal_sysvars=False,
+    )
+    assert client_session.methods.count(_JsonRpcMethod.REGA_RUN_SCRIPT) == 1
+    assert 'sUse_Interfaces = "HmIP-RF\tBidCos-RF";' in client_session.scripts[-1]
+
+    # the texts are url decoded, also the ones of older backends with ISO-8859-1
+    assert bootstrap_data.device_details[0]["name"] == "Wohnzimmer L\u00fcfter"
+    assert bootstrap_data.device_details[0]["channels"][0] == {
+        "id": "1002",
+        "address": "VCU0000001:1",
+        "name": "K\u00fcche",
+    }
+    assert bootstrap_data.channel_ids_room["1002"] == {"Wohnzimmer"}
+    assert bootstrap_data.channel_ids_function["1001"] == {"Licht"}
+    assert bootstrap_data.all_device_data == {
+        Interface.HMIP_RF: {"VCU0000001:1": {"STATE": True, "LEVEL": 0.5}},
+        Interface.BIDCOS_RF: {},
+    }
+    assert len(bootstrap_data.system_variables) == 1
+    assert bootstrap_data.system_variables[0].name == "Anwesend"
+    assert bootstrap_data.system_variables[0].value is True
+    assert bootstrap_data.system_variables[0].description == "Anwesenheit"
+    assert bootstrap_data.system_variables[0].extended_sysvar is True
+    assert len(bootstrap_data.programs) == 1
+    assert bootstrap_data.programs[0].name == "Licht an"
+    assert bootstrap_data.programs[0].description == "Schaltet das Licht"
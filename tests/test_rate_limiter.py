@@ -0,0 +1,140 @@
+"""Tests for the command rate limiter of hahomematic."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from hahomematic.central import CentralUnit
+from hahomematic.client import Client
+from hahomematic.client.rate_limiter import CommandRateLimiter
+from hahomematic.const import ParamsetKey, RequestLane
+
+from tests import const, helper
+
+TEST_DEVICES: dict[str, str] = {
+    "VCU2128127": "HmIP-BSM.json",
+}
+
+# pylint: disable=protected-access
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter() -> None:
+    """Test the token bucket of the rate limiter."""
+    rate_limiter = CommandRateLimiter(interface_id=const.INTERFACE_ID, rate=20.0, burst_size=2)
+    assert rate_limiter.current_rate == 20.0
+    start = time.monotonic()
+    await asyncio.gather(*(rate_limiter.acquire() for _ in range(4)))
+    # the burst passes without delay, the other commands are paced
+    assert time.monotonic() - start >= 0.09
+    assert rate_limiter.sent_count == 4
+    assert rate_limiter.delayed_count == 2
+    assert rate_limiter.max_delay > 0
+    assert rate_limiter.total_delay >= rate_limiter.max_delay
+    assert rate_limiter.waiting == 0
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_duty_cycle() -> None:
+    """Test the adaption of the rate limiter to the duty cycle."""
+    rate_limiter = CommandRateLimiter(interface_id=const.INTERFACE_ID, rate=10.0, burst_size=20)
+    rate_limiter.update_duty_cycle(value=40)
+    assert rate_limiter.duty_cycle_level == 40.0
+    assert rate_limiter.current_rate == 10.0
+    assert rate_limiter.current_burst_size == 20.0
+
+    rate_limiter.update_duty_cycle(value=77.5)
+    assert rate_limiter.current_rate == pytest.approx(5.25)
+    assert rate_limiter.current_burst_size == pytest.approx(10.5)
+
+    rate_limiter.update_duty_cycle(value=99)
+    assert rate_limiter.current_rate == pytest.approx(0.5)
+    assert rate_limiter.current_burst_size == 1.0
+
+    # the boolean duty cycle state of a device is ignored
+    rate_limiter.update_duty_cycle(value=False)
+    rate_limiter.update_duty_cycle(value="abc")
+    assert rate_limiter.duty_cycle_level == 99.0
+
+    rate_limiter.update_duty_cycle(value=0)
+    assert rate_limiter.current_rate == 10.0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_rate_limiter_duty_cycle_event(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test the duty cycle events of the backend update the rate limiter."""
+    central, client, _ = central_client_factory
+    assert client.rate_limiter is not None
+    assert central.accept_event(
+        interface_id=const.INTERFACE_ID, channel_address="BidCoS-RF", parameter="DUTY_CYCLE_LEVEL"
+    )
+    # the unsubscribed duty cycle flag of a device is not used by the rate limiter
+    assert not central.accept_event(
+        interface_id=const.INTERFACE_ID, channel_address="VCU0000000:0", parameter="DUTY_CYCLE"
+    )
+    await central.data_point_event(const.INTERFACE_ID, "BidCoS-RF", "DUTY_CYCLE_LEVEL", 80)
+    assert client.rate_limiter.duty_cycle_level == 80.0
+    assert client.rate_limiter.current_rate < central.config.command_rate_limit
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, False, False, False, None, None),
+    ],
+)
+async def test_rate_limiter_outside_of_write_lane(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test that a throttled write does not occupy the write lane."""
+    central, _, _ = central_client_factory
+    client = central.primary_client._mock_wraps
+    assert client.rate_limiter is not None
+    active_writes: list[int] = []
+
+    async def acquire() -> None:
+        active_writes.append(client.request_scheduler.get_active(RequestLane.WRITE))
+
+    with (
+        patch.object(client.rate_limiter, "acquire", side_effect=acquire),
+        patch.object(client, "_exec_set_value", AsyncMock()) as exec_set_value,
+    ):
+        # the local client overrides set_value, so the base implementation is called
+        await Client.set_value(
+            client,
+            channel_address="VCU2128127:4",
+            paramset_key=ParamsetKey.VALUES,
+            parameter="STATE",
+            value=True,
+            wait_for_callback=None,
+        )
+    assert exec_set_value.call_count == 1
+    assert active_writes == [0]
+    assert client.request_scheduler.get_request_count(RequestLane.WRITE) == 1
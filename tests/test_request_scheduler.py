@@ -0,0 +1,137 @@
+"""Tests for the request scheduler of hahomematic."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+
+from hahomematic.central import CentralUnit
+from hahomematic.client import Client
+from hahomematic.client.request_scheduler import RequestScheduler
+from hahomematic.const import RequestLane
+from hahomematic.context import REQUEST_LANE_VAR, background_requests
+
+from tests import const, helper
+
+TEST_DEVICES: dict[str, str] = {
+    "VCU2128127": "HmIP-BSM.json",
+}
+
+# pylint: disable=protected-access
+
+
+@pytest.mark.asyncio
+async def test_request_scheduler_lanes() -> None:
+    """Test writes and reads are served before queued background reads."""
+    scheduler = RequestScheduler(
+        interface_id=const.INTERFACE_ID, max_writes=1, max_reads=1, max_background_reads=1
+    )
+    release = asyncio.Event()
+    served: list[str] = []
+
+    async def request(name: str, lane: RequestLane | None = None) -> None:
+        async with scheduler.lane(lane):
+            served.append(name)
+            if name == "background_1":
+                await release.wait()
+
+    with background_requests():
+        background = [asyncio.create_task(request(f"background_{i}")) for i in range(1, 4)]
+    await asyncio.sleep(0)
+    assert scheduler.get_active(RequestLane.BACKGROUND) == 1
+    assert scheduler.get_waiting(RequestLane.BACKGROUND) == 2
+
+    # a write passes the queued background reads
+    await request("write", RequestLane.WRITE)
+    assert served == ["background_1", "write"]
+
+    # a read only waits for the background read in flight
+    read = asyncio.create_task(request("read"))
+    await asyncio.sleep(0)
+    assert scheduler.get_waiting(RequestLane.READ) == 1
+    release.set()
+    await asyncio.gather(read, *background)
+    assert served == ["background_1", "write", "read", "background_2", "background_3"]
+    assert scheduler.get_request_count(RequestLane.BACKGROUND) == 3
+    assert scheduler.get_request_count(RequestLane.READ) == 1
+    assert scheduler.get_max_wait_time(RequestLane.READ) > 0
+    assert all(scheduler.get_active(lane) == 0 for lane in RequestLane)
+
+
+@pytest.mark.asyncio
+async def test_request_scheduler_cancel() -> None:
+    """Test cancelled requests release their slots."""
+    scheduler = RequestScheduler(
+        interface_id=const.INTERFACE_ID, max_writes=1, max_reads=2, max_background_reads=1
+    )
+    assert scheduler.get_limit(RequestLane.READ) == 2
+    assert scheduler.get_limit(RequestLane.BACKGROUND) == 1
+    release = asyncio.Event()
+
+    async def request(lane: RequestLane) -> None:
+        async with scheduler.lane(lane):
+            await release.wait()
+
+    first = asyncio.create_task(request(RequestLane.BACKGROUND))
+    waiting = asyncio.create_task(request(RequestLane.BACKGROUND))
+    await asyncio.sleep(0)
+    assert scheduler.get_waiting(RequestLane.BACKGROUND) == 1
+    waiting.cancel()
+    await asyncio.sleep(0)
+    assert scheduler.get_waiting(RequestLane.BACKGROUND) == 0
+    first.cancel()
+    await asyncio.sleep(0)
+    assert scheduler.get_active(RequestLane.BACKGROUND) == 0
+
+    assert REQUEST_LANE_VAR.get() == RequestLane.READ
+    with background_requests():
+        assert REQUEST_LANE_VAR.get() == RequestLane.BACKGROUND
+    assert REQUEST_LANE_VAR.get() == RequestLane.READ
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, False, False, False, None, None),
+    ],
+)
+async def test_shared_reads_by_lane(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test that an interactive read does not join a background read in flight."""
+    central, _, _ = central_client_factory
+    client = central.primary_client._mock_wraps
+    release = asyncio.Event()
+
+    async def send_read(method: str, *args: Any) -> Any:
+        await release.wait()
+        return REQUEST_LANE_VAR.get()
+
+    async def background_read() -> Any:
+        with background_requests():
+            return await client._read("getValue", "VCU2128127:4", "STATE")
+
+    with patch.object(client, "_send_read", side_effect=send_read):
+        reads = (
+            asyncio.create_task(background_read()),
+            asyncio.create_task(background_read()),
+            asyncio.create_task(client._read("getValue", "VCU2128127:4", "STATE")),
+        )
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*reads)
+
+    assert results == [RequestLane.BACKGROUND, RequestLane.BACKGROUND, RequestLane.READ]
+    assert client.single_flight.hit_count == 1
+    assert client.single_flight.miss_count == 2
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
 from datetime import datetime, timedelta
 from typing import Any
@@ -9,6 +10,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from hahomematic.async_support import SingleFlight
 from hahomematic.caches.visibility import _get_value_from_dict_by_wildcard_key
 from hahomematic.central import CentralUnit
 from hahomematic.client import Client
@@ -625,3 +627,49 @@ def test_scheduler_time_pattern() -> None:
     assert SCHEDULER_TIME_PATTERN.match("5:00")
     assert SCHEDULER_TIME_PATTERN.match("25:00") is None
     assert SCHEDULER_TIME_PATTERN.match("F:00") is None
+
+
+@pytest.mark.asyncio
+async def test_single_flight() -> None:
+    """Test the sharing of identical concurrent calls."""
+    single_flight = SingleFlight()
+    calls: list[str] = []
+    release = asyncio.Event()
+
+    async def call(value: str) -> str:
+        calls.append(value)
+        await release.wait()
+        if value == "error":
+            raise HaHomematicException("failed")
+        return value
+
+    tasks = [
+        asyncio.create_task(single_flight.run(key=key, call=lambda key=key: call(key)))
+        for key in ("a", "a", "b", "a", "error", "error")
+    ]
+    await asyncio.sleep(0)
+    assert single_flight.in_flight == 3
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert results[:4] == ["a", "a", "b", "a"]
+    assert all(isinstance(result, HaHomematicException) for result in results[4:])
+    assert calls == ["a", "b", "error"]
+    assert single_flight.miss_count == 3
+    assert single_flight.hit_count == 3
+    assert single_flight.in_flight == 0
+
+    # a finished call is not shared
+    assert await single_flight.run(key="a", call=lambda: call("a")) == "a"
+    assert single_flight.miss_count == 4
+
+    # the waiting caller retries, if the call in flight is cancelled
+    release.clear()
+    first = asyncio.create_task(single_flight.run(key="c", call=lambda: call("c")))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(single_flight.run(key="c", call=lambda: call("c")))
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+    release.set()
+    assert await second == "c"
+    assert first.cancelled() is True
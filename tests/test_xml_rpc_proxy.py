@@ -0,0 +1,189 @@
+"""Tests for the xml rpc proxies of hahomematic."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+import xmlrpc.client
+from xmlrpc.server import SimpleXMLRPCDispatcher
+
+from aiohttp import web
+import pytest
+
+from hahomematic.central import CentralConnectionState
+from hahomematic.client.xml_rpc import AioHttpXmlRpcProxy, XmlRpcProxy
+from hahomematic.client.xml_rpc_decoder import decode_response
+from hahomematic.const import LOCAL_HOST, XmlRpcDecoderType
+from hahomematic.exceptions import AuthFailure, ClientException, NoConnectionException
+from hahomematic.support import find_free_port
+from hahomematic_support.xml_rpc_benchmark import benchmark_decoders, get_recorded_responses
+
+from tests import const
+
+# pylint: disable=protected-access
+
+
+async def _start_backend(port: int, status: int = 200) -> tuple[web.AppRunner, list[str]]:
+    """Start a simple xml rpc backend and return the runner and the remote ports of the calls."""
+    dispatcher = SimpleXMLRPCDispatcher(allow_none=True, encoding="ISO-8859-1")
+    dispatcher.register_introspection_functions()
+    dispatcher.register_function(lambda address, parameter: f"{address}.{parameter}", "getValue")
+    dispatcher.register_function(lambda: ["device"], "listDevices")
+    peers: list[str] = []
+
+    async def handle(request: web.Request) -> web.Response:
+        peers.append(str(request.transport.get_extra_info("peername")[1]))
+        if status != 200:
+            return web.Response(status=status)
+        # let the requests overlap
+        await asyncio.sleep(0.05)
+        return web.Response(
+            body=dispatcher._marshaled_dispatch(await request.read()), content_type="text/xml"
+        )
+
+    app = web.Application()
+    app.router.add_post("/", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, LOCAL_HOST, port).start()
+    return runner, peers
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_xml_rpc_proxy() -> None:
+    """Test the aiohttp based xml rpc proxy."""
+    port = find_free_port()
+    runner, peers = await _start_backend(port=port)
+    proxy = AioHttpXmlRpcProxy(
+        interface_id=const.INTERFACE_ID,
+        connection_state=CentralConnectionState(),
+        uri=f"http://{LOCAL_HOST}:{port}",
+        headers=[],
+        max_connections=2,
+    )
+    await proxy.do_init()
+    assert "getValue" in proxy.supported_methods
+    assert "ping" in proxy.supported_methods
+
+    assert await proxy.listDevices() == ["device"]
+    results = await asyncio.gather(*(proxy.getValue(f"VCU000000{i}:1", "STATE") for i in range(6)))
+    assert results == [f"VCU000000{i}:1.STATE" for i in range(6)]
+    # all requests have been served by the kept alive connections of the pool
+    assert len(set(peers)) == 2
+
+    with pytest.raises(ClientException):
+        await proxy.getValue("VCU0000001:1")
+    with pytest.raises(ClientException):
+        await proxy.getValue(None, "STATE")
+
+    await proxy.stop()
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_xml_rpc_proxy_errors() -> None:
+    """Test the error mapping of the aiohttp based xml rpc proxy."""
+    port = find_free_port()
+    connection_state = CentralConnectionState()
+    proxy = AioHttpXmlRpcProxy(
+        interface_id=const.INTERFACE_ID,
+        connection_state=connection_state,
+        uri=f"http://{LOCAL_HOST}:{port}",
+        headers=[("Authorization", "Basic dGVzdDp0ZXN0")],
+    )
+    with pytest.raises(NoConnectionException):
+        await proxy.listDevices()
+    assert connection_state.has_issue(issuer=proxy, iid=const.INTERFACE_ID) is True
+    # no requests are sent, while the connection has an issue
+    with pytest.raises(NoConnectionException, match="No connection"):
+        await proxy.listDevices()
+
+    await proxy.stop()
+    assert proxy._client_session.closed is True
+
+    runner, _ = await _start_backend(port=port, status=401)
+    proxy = AioHttpXmlRpcProxy(
+        interface_id=const.INTERFACE_ID,
+        connection_state=CentralConnectionState(),
+        uri=f"http://{LOCAL_HOST}:{port}",
+        headers=[("Authorization", "Basic dGVzdDp0ZXN0")],
+    )
+    with pytest.raises(AuthFailure):
+        await proxy.listDevices()
+    await proxy.stop()
+    await runner.cleanup()
+
+
+def test_xml_rpc_decoders() -> None:
+    """Test the fast decoder returns the same results as the standard decoder."""
+    data = {
+        "ADDRESS": "VCU0000001:1",
+        "CHILDREN": [],
+        "FLAGS": 1,
+        "VALUE": 1.5,
+        "STATE": True,
+        "NONE": None,
+        "LINKS": [{"NAME": "ÄÖÜ <&>", "PARAMSETS": ["MASTER", "VALUES"]}, []],
+        "BINARY": xmlrpc.client.Binary(b"\x00\x01"),
+        "DATE": xmlrpc.client.DateTime(datetime(2024, 12, 16, 10, 0, 0)),
+    }
+    responses = (
+        xmlrpc.client.dumps(
+            (data,), methodresponse=True, encoding="ISO-8859-1", allow_none=True
+        ).encode("ISO-8859-1", "xmlcharrefreplace"),
+        xmlrpc.client.dumps((["a", 1, ["b"]],), methodresponse=True).encode(),
+        b"<?xml version='1.0'?><methodResponse><params><param><value>untyped</value></param>"
+        b"<param><value><ex:nil/></value></param><param><value><i8>1099511627776</i8></value></param>"
+        b"<param><value><boolean>0</boolean></value></param><param><value><string></string></value>"
+        b"</param></params></methodResponse>",
+    )
+    for response in responses:
+        assert decode_response(
+            data=response, decoder_type=XmlRpcDecoderType.FAST
+        ) == decode_response(data=response, decoder_type=XmlRpcDecoderType.STANDARD)
+
+    fault = xmlrpc.client.dumps(xmlrpc.client.Fault(-2, "Unknown paramset")).encode()
+    for decoder_type in XmlRpcDecoderType:
+        with pytest.raises(xmlrpc.client.Fault, match="Unknown paramset"):
+            decode_response(data=fault, decoder_type=decoder_type)
+        with pytest.raises(xmlrpc.client.ResponseError):
+            decode_response(data=b"<methodResponse></methodResponse>", decoder_type=decoder_type)
+
+    # the benchmark fails, if the decoders return different results
+    results = benchmark_decoders(responses=get_recorded_responses(max_devices=10), rounds=1)
+    assert [result.decoder_type for result in results] == [
+        XmlRpcDecoderType.STANDARD,
+        XmlRpcDecoderType.FAST,
+    ]
+    assert all(result.response_count > 10 for result in results)
+
+
+@pytest.mark.asyncio
+async def test_xml_rpc_proxy_fast_decoder() -> None:
+    """Test the proxies with the fast decoder."""
+    port = find_free_port()
+    runner, _ = await _start_backend(port=port)
+    proxies = (
+        XmlRpcProxy(
+            max_workers=1,
+            interface_id=const.INTERFACE_ID,
+            connection_state=CentralConnectionState(),
+            uri=f"http://{LOCAL_HOST}:{port}/",
+            headers=[],
+            decoder_type=XmlRpcDecoderType.FAST,
+        ),
+        AioHttpXmlRpcProxy(
+            interface_id=const.INTERFACE_ID,
+            connection_state=CentralConnectionState(),
+            uri=f"http://{LOCAL_HOST}:{port}",
+            headers=[],
+            decoder_type=XmlRpcDecoderType.FAST,
+        ),
+    )
+    for proxy in proxies:
+        await proxy.do_init()
+        assert "getValue" in proxy.supported_methods
+        assert await proxy.listDevices() == ["device"]
+        assert await proxy.getValue("VCU0000001:1", "STATE") == "VCU0000001:1.STATE"
+        await proxy.stop()
+    await runner.cleanup()
@@ -0,0 +1,227 @@
+"""Tests for the xml rpc servers of hahomematic."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import MagicMock, Mock, patch
+from xmlrpc.client import dumps, loads
+
+from aiohttp import ClientSession, TCPConnector
+import pytest
+
+from hahomematic.central import CentralUnit, xml_rpc_server as xmlrpc
+from hahomematic.client import Client
+from hahomematic.const import LOCAL_HOST
+from hahomematic.support import find_free_port
+
+from tests import const, helper
+
+TEST_DEVICES: dict[str, str] = {
+    "VCU2128127": "HmIP-BSM.json",
+}
+
+# pylint: disable=protected-access
+
+
+async def _call(session: ClientSession, url: str, method: str, *params) -> Any:
+    """Execute a xml rpc call and return the result."""
+    async with session.post(
+        url, data=dumps(params, methodname=method, allow_none=True).encode()
+    ) as response:
+        assert response.status == 200
+        return loads(await response.read())[0][0]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_async_xml_rpc_server(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test the async xml rpc server."""
+    central, _, _ = central_client_factory
+    port = find_free_port()
+    server = await xmlrpc.create_async_xml_rpc_server(ip_addr=LOCAL_HOST, port=port)
+    assert server.started is True
+    assert await xmlrpc.create_async_xml_rpc_server(ip_addr=LOCAL_HOST, port=port) is server
+    server.add_central(central)
+    dp = central.get_generic_data_point("VCU2128127:4", "STATE")
+    assert dp.value is None
+
+    url = f"http://{LOCAL_HOST}:{port}/RPC2"
+    connector = TCPConnector(limit=1)
+    async with ClientSession(connector=connector) as session:
+        assert "system.multicall" in await _call(session, url, "system.listMethods")
+        assert await _call(session, url, "listDevices", const.INTERFACE_ID)
+        await _call(session, url, "event", const.INTERFACE_ID, "VCU2128127:4", "STATE", True)
+        await central.looper.block_till_done()
+        assert dp.value is True
+
+        await _call(
+            session,
+            url,
+            "system.multicall",
+            [
+                {
+                    "methodName": "event",
+                    "params": [const.INTERFACE_ID, "VCU2128127:4", "STATE", False],
+                },
+                {
+                    "methodName": "event",
+                    "params": [const.INTERFACE_ID, "VCU2128127:4", "STATE", True],
+                },
+            ],
+        )
+        await asyncio.sleep(0)
+        await central.looper.block_till_done()
+        assert dp.value is True
+        # all requests have been served by a single keep-alive connection
+        assert len(connector._conns) == 1
+
+    assert server.get_central(const.INTERFACE_ID) is central
+    assert server.get_central("unknown") is None
+    server.remove_central(central)
+    assert server.no_central_assigned is True
+    assert server.get_central(const.INTERFACE_ID) is None
+    await server.stop()
+    assert server.started is False
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_multicall_event_batch(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test that the events of a system.multicall are handed over as one batch."""
+    central, _, _ = central_client_factory
+    parameter_callback = MagicMock()
+    central.register_backend_parameter_callback(parameter_callback)
+    port = find_free_port()
+    server = await xmlrpc.create_async_xml_rpc_server(ip_addr=LOCAL_HOST, port=port)
+    server.add_central(central)
+    url = f"http://{LOCAL_HOST}:{port}/RPC2"
+
+    with patch.object(central, "data_point_events", wraps=central.data_point_events) as batch:
+        async with ClientSession() as session:
+            result = await _call(
+                session,
+                url,
+                "system.multicall",
+                [
+                    {
+                        "methodName": "event",
+                        "params": [const.INTERFACE_ID, "VCU2128127:4", "STATE", True],
+                    },
+                    {
+                        "methodName": "event",
+                        "params": [const.INTERFACE_ID, "VCU2128127:0", "UNREACH", False],
+                    },
+                    {"methodName": "listDevices", "params": [const.INTERFACE_ID]},
+                    {
+                        "methodName": "event",
+                        "params": [const.INTERFACE_ID, "VCU2128127:4", "STATE", False],
+                    },
+                ],
+            )
+        await asyncio.sleep(0)
+        await central.looper.block_till_done()
+
+    assert len(result) == 4
+    assert result[2][0]
+    # both parts of the bundle are processed in one batch, in the order of arrival of the device
+    assert batch.call_count == 1
+    assert batch.call_args.kwargs["events"] == (
+        ("VCU2128127:4", "STATE", True),
+        ("VCU2128127:0", "UNREACH", False),
+        ("VCU2128127:4", "STATE", False),
+    )
+    assert central.get_generic_data_point("VCU2128127:4", "STATE").value is False
+    assert parameter_callback.call_count == 3
+
+    server.remove_central(central)
+    await server.stop()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    (
+        "address_device_translation",
+        "do_mock_client",
+        "add_sysvars",
+        "add_programs",
+        "ignore_devices_on_create",
+        "un_ignore_list",
+    ),
+    [
+        (TEST_DEVICES, True, False, False, None, None),
+    ],
+)
+async def test_drop_unsubscribed_events(
+    central_client_factory: tuple[CentralUnit, Client | Mock, helper.Factory],
+) -> None:
+    """Test that events without subscription are dropped by the xml rpc server."""
+    central, _, _ = central_client_factory
+    server = await xmlrpc.create_async_xml_rpc_server(ip_addr=LOCAL_HOST, port=find_free_port())
+    server.add_central(central)
+    rpc_functions = xmlrpc.RPCFunctions(server)
+    assert central.dropped_event_count == 0
+
+    with patch.object(central, "data_point_events", wraps=central.data_point_events) as event:
+        rpc_functions.event(const.INTERFACE_ID, "VCU2128127:4", "UNKNOWN_PARAMETER", 1)
+        rpc_functions.event(const.INTERFACE_ID, "VCU2128127:4", "STATE", True)
+        await asyncio.sleep(0)
+        await central.looper.block_till_done()
+
+    assert event.call_count == 1
+    assert central.dropped_event_count == 1
+    assert central.get_last_event_dt(const.INTERFACE_ID) is not None
+    assert central.get_generic_data_point("VCU2128127:4", "STATE").value is True
+
+    device = central.get_device("VCU2128127")
+    await central.delete_devices(interface_id=const.INTERFACE_ID, addresses=[device.address])
+    rpc_functions.event(const.INTERFACE_ID, "VCU2128127:4", "STATE", False)
+    assert central.dropped_event_count == 2
+
+    # only the events of the parameters requested by a backend parameter callback pass
+    backend_parameter_callback = Mock()
+    unregister = central.register_backend_parameter_callback(
+        backend_parameter_callback, parameters=("ERROR_CODE",)
+    )
+    rpc_functions.event(const.INTERFACE_ID, "VCU2128127:4", "RSSI_DEVICE", -60)
+    rpc_functions.event(const.INTERFACE_ID, "VCU2128127:4", "ERROR_CODE", 1)
+    await asyncio.sleep(0)
+    await central.looper.block_till_done()
+    assert central.dropped_event_count == 3
+    backend_parameter_callback.assert_called_once_with(
+        const.INTERFACE_ID, "VCU2128127:4", "ERROR_CODE", 1
+    )
+    unregister()
+    rpc_functions.event(const.INTERFACE_ID, "VCU2128127:4", "ERROR_CODE", 0)
+    assert central.dropped_event_count == 4
+
+    server.remove_central(central)
+    await server.stop()